@@ -0,0 +1,8 @@
+{% macro coordinates_to_grid_cell(lat, lon, reference_lat, cell_meters) %}
+    {# Cell [row, column] of a coordinate on a square grid of cell_meters, projected around reference_lat #}
+    {# Two points within cell_meters of each other always land in the same or neighboring cells #}
+    [
+        cast(floor(radians({{ lat }}) * 6371000 / {{ cell_meters }}) as bigint),
+        cast(floor(radians({{ lon }}) * 6371000 * cos(radians({{ reference_lat }})) / {{ cell_meters }}) as bigint)
+    ]
+{% endmacro %}
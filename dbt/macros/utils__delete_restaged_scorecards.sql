@@ -0,0 +1,12 @@
+{% macro delete_restaged_scorecards(upstream) %}
+    {# pre_hook of the staging child models: drop every row of the scorecards this run restages from upstream #}
+    {# delete+insert alone only replaces scorecards the new version still emits rows for (e.g. not once its throws are removed) #}
+    {% if is_incremental() %}
+    delete from {{ this }}
+    where scorecard_id in (
+        select scorecard_id
+        from {{ upstream }}
+        where loaded_at > (select max(loaded_at) from {{ this }})
+    )
+    {% endif %}
+{% endmacro %}
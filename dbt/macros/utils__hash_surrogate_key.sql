@@ -0,0 +1,19 @@
+{% macro hash_surrogate_key(field_list) %}
+    {# UBIGINT surrogate key from the lower 64 bits of the md5 of the fields, joined like dbt_utils.generate_surrogate_key #}
+    {# md5 keeps keys stable across DuckDB versions, which incremental models rely on (hash() isn't guaranteed to be) #}
+    md5_number_lower(concat_ws('-',
+        {%- for field in field_list %}
+        coalesce(cast({{ field }} as varchar), '_null_'){{ "," if not loop.last }}
+        {%- endfor %}
+    ))
+{% endmacro %}
+
+{% test hash_key_collisions(model, column_name, key_columns) %}
+    {# Fails for hash keys shared by more than one natural key (a hash collision rather than a duplicate row) #}
+    select
+        {{ column_name }},
+        count(distinct row({{ key_columns | join(", ") }})) as natural_key_count
+    from {{ model }}
+    group by {{ column_name }}
+    having count(distinct row({{ key_columns | join(", ") }})) > 1
+{% endtest %}
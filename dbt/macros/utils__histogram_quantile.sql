@@ -0,0 +1,14 @@
+{% macro histogram_quantile(histogram, quantile) %}
+    {# Discrete quantile of a list of {'value', 'count'} buckets sorted by value (same as quantile_disc over the raw values) #}
+    {# Histograms of rounded values are exact, mergeable sketches: merging two is summing counts per value #}
+    list_filter(
+        list_transform(
+            range(1, len({{ histogram }}) + 1),
+            i -> {
+                'value': {{ histogram }}[i].value,
+                'cumulative_count': list_sum(list_transform({{ histogram }}[1:i], h -> h.count))
+            }
+        ),
+        b -> b.cumulative_count >= greatest(ceil({{ quantile }} * list_sum(list_transform({{ histogram }}, h -> h.count))), 1)
+    )[1].value
+{% endmacro %}
@@ -0,0 +1,38 @@
+{% macro batch_timestamp() %}
+    {# Timestamp identifying this dbt invocation's batch of new/changed scorecards #}
+    cast('{{ run_started_at.strftime("%Y-%m-%d %H:%M:%S.%f") }}' as timestamp)
+{% endmacro %}
+
+{% macro create_change_watermarks() %}
+    {# on-run-start: table of the batch timestamp each incremental model last consumed scorecard changes up to #}
+    create schema if not exists staging;
+    create table if not exists staging.scorecard_change_watermarks (
+        model_name varchar primary key,
+        processed_at timestamp
+    );
+{% endmacro %}
+
+{% macro changes_watermark() %}
+    {# Batch timestamp of the last run of the current model, so changes stamped since then in any run count #}
+    (
+        select coalesce(max(wm.processed_at), '-infinity'::timestamp)
+        from staging.scorecard_change_watermarks wm
+        where wm.model_name = '{{ this.identifier }}'
+    )
+{% endmacro %}
+
+{% macro record_changes_watermark() %}
+    {# Last post_hook of every model using changes_watermark: everything stamped up to this run is consumed #}
+    insert or replace into staging.scorecard_change_watermarks
+    values ('{{ this.identifier }}', {{ batch_timestamp() }})
+{% endmacro %}
+
+{% macro in_changed_scorecards(scorecard_id) %}
+    {# Filter to rows whose scorecard is new or changed since the current model last ran (see staging.scorecard_changes) #}
+    {# Models calling this inside is_incremental() need a "-- depends_on: ref('scorecard_changes')" comment #}
+    {{ scorecard_id }} in (
+        select scorecard_id
+        from {{ ref('scorecard_changes') }}
+        where processed_at > {{ changes_watermark() }}
+    )
+{% endmacro %}
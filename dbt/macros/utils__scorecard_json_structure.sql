@@ -0,0 +1,97 @@
+{% macro scorecard_json_structure() %}
+    {# json_transform structure for the parts of a UDisc scorecard document the staging models read #}
+    {%- set timestamp = 'VARCHAR' -%}
+    {%- set coordinates = {'latitude': 'DOUBLE', 'longitude': 'DOUBLE'} -%}
+    {%- set hole_throw = {'landingZone': 'VARCHAR', 'distance': 'DOUBLE'} -%}
+    {%- set hole_score = {'strokes': 'INTEGER', 'changeVersion': 'INTEGER', 'holeThrows': [hole_throw]} -%}
+    {%- set player = {
+        'objectId': 'VARCHAR',
+        'name': 'VARCHAR',
+        'isDeleted': 'BOOLEAN',
+        'createdAt': timestamp,
+        'updatedAt': timestamp
+    } -%}
+    {%- set user = {
+        'objectId': 'VARCHAR',
+        'fullName': 'VARCHAR',
+        'name': 'VARCHAR',
+        'username': 'VARCHAR',
+        'createdAt': timestamp,
+        'updatedAt': timestamp
+    } -%}
+    {%- set entry = {
+        'objectId': 'VARCHAR',
+        'createdAt': timestamp,
+        'updatedAt': timestamp,
+        'includeInHandicaps': 'BOOLEAN',
+        'includeInProfile': 'BOOLEAN',
+        'startingScore': 'INTEGER',
+        'roundRating': 'DOUBLE',
+        'players': [player],
+        'users': [user],
+        'holeScores': [hole_score]
+    } -%}
+    {%- set hole = {
+        'holeId': 'VARCHAR',
+        'name': 'VARCHAR',
+        'par': 'INTEGER',
+        'distance': 'DOUBLE',
+        'customDistance': 'DOUBLE',
+        'teePosition': {
+            'teePositionId': 'VARCHAR',
+            'status': 'VARCHAR',
+            'latitude': 'DOUBLE',
+            'longitude': 'DOUBLE',
+            'teeType': {'teeType': 'VARCHAR'}
+        },
+        'teePad': coordinates,
+        'targetPosition': {
+            'targetPositionId': 'VARCHAR',
+            'status': 'VARCHAR',
+            'latitude': 'DOUBLE',
+            'longitude': 'DOUBLE',
+            'targetType': {
+                'type': 'VARCHAR',
+                'basketModel': {'name': 'VARCHAR', 'manufacturer': 'VARCHAR'}
+            }
+        },
+        'basket': coordinates,
+        'doglegs': ['JSON']
+    } -%}
+    {%- set scorecard = {
+        'objectId': 'VARCHAR',
+        'courseId': 'VARCHAR',
+        'courseName': 'VARCHAR',
+        'layoutId': 'VARCHAR',
+        'layoutName': 'VARCHAR',
+        'startDate': {'iso': timestamp},
+        'endDate': {'iso': timestamp},
+        'playFormat': 'VARCHAR',
+        'startingHoleIndex': 'INTEGER',
+        'stepCount': 'INTEGER',
+        'floorsAscended': 'INTEGER',
+        'floorsDescended': 'INTEGER',
+        'distance': 'DOUBLE',
+        'difficulty': 'VARCHAR',
+        'customName': 'VARCHAR',
+        'usesValidSmartLayout': 'BOOLEAN',
+        'weather': {
+            'temperature': 'DOUBLE',
+            'humidity': 'DOUBLE',
+            'cloudCoverPercent': 'DOUBLE',
+            'wind': {'speed': 'DOUBLE', 'direction': 'DOUBLE'}
+        },
+        'entries': [entry],
+        'holes': [hole],
+        'version': 'INTEGER',
+        'notes': 'VARCHAR',
+        'isFinished': 'BOOLEAN',
+        'isSimpleScoring': 'BOOLEAN',
+        'isPublic': 'BOOLEAN',
+        'isDeleted': 'BOOLEAN',
+        'createdAt': timestamp,
+        'updatedAt': timestamp,
+        'createdBy': {'objectId': 'VARCHAR'}
+    } -%}
+    '{{ tojson(scorecard) }}'
+{% endmacro %}
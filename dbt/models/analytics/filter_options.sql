@@ -0,0 +1,65 @@
+{{
+  config(
+    materialized='table',
+    schema='analytics'
+  )
+}}
+
+-- Dashboard filter widget options, one row per option with its round count and date bounds, so widgets
+-- don't run SELECT DISTINCT over the analytics tables. The app loads the whole table once per warehouse version.
+-- Option types: player (singles players), team (doubles and larger team names), course, layout (parent_value
+-- is its course), course_layout and format. The format options cover every round, so their date bounds are
+-- the overall date bounds.
+
+with round_options as (
+    select
+        r."Player" as player_name,
+        r."Format" as round_format,
+        r."Course Name" as course_name,
+        r."Layout Name" as layout_name,
+        r."Course Layout Name" as course_layout_name,
+        r."Date" as round_date
+
+    from {{ ref('rounds') }} r
+),
+
+options as (
+    select
+        case when ro.round_format = 'Singles' then 'player' else 'team' end as option_type,
+        ro.player_name as option_value,
+        null as parent_value,
+        ro.round_date
+    from round_options ro
+
+    union all
+
+    select 'course', ro.course_name, null, ro.round_date
+    from round_options ro
+
+    union all
+
+    select 'layout', ro.layout_name, ro.course_name, ro.round_date
+    from round_options ro
+
+    union all
+
+    select 'course_layout', ro.course_layout_name, null, ro.round_date
+    from round_options ro
+
+    union all
+
+    select 'format', ro.round_format, null, ro.round_date
+    from round_options ro
+)
+
+select
+    o.option_type,
+    o.option_value,
+    o.parent_value,
+    count(*) as rounds,
+    min(o.round_date) as first_round_date,
+    max(o.round_date) as last_round_date
+
+from options o
+where o.option_value is not null
+group by o.option_type, o.option_value, o.parent_value
\ No newline at end of file
@@ -5,86 +5,6 @@
   )
 }}
 
-with throwing_stats as (
-
-    select
-        rh.round_hole_sk,
-        sum(
-            case
-                when rh.hole_par <= 3 and thr.throw_number = 1 and thr.throw_to not in ('Out of Bounds', 'Off Fairway') then 1
-                when rh.hole_par = 4
-                    and thr.throw_number = 1
-                    and thr.throw_type in ('Teeshot', 'Fairway', 'Approach')
-                    and thr.throw_to not in ('Out of Bounds', 'Off Fairway')
-                    then 1
-                when rh.hole_par = 4
-                    and thr.throw_number = 2
-                    and thr.throw_type in ('Teeshot', 'Fairway', 'Approach')
-                    and thr.throw_to in ('Circle 2', 'Circle 1', 'Basket')
-                    then 1
-                when rh.hole_par >= 5
-                    and thr.throw_number between 1 and 2
-                    and thr.throw_type in ('Teeshot', 'Fairway', 'Approach')
-                    and thr.throw_to not in ('Out of Bounds', 'Off Fairway')
-                    then 1
-                when rh.hole_par >= 5
-                    and thr.throw_number = 3
-                    and thr.throw_type in ('Teeshot', 'Fairway', 'Approach')
-                    and thr.throw_to in ('Circle 2', 'Circle 1', 'Basket')
-                    then 1
-                else 0
-            end
-        ) as fairway_hits,
-        sum(
-            case
-                when rh.hole_par <= 3 and thr.throw_number = 1 then 1
-                when rh.hole_par = 4 and thr.throw_number between 1 and 2 and thr.throw_type in ('Teeshot', 'Fairway', 'Approach') then 1
-                when rh.hole_par >= 5 and thr.throw_number between 1 and 3 and thr.throw_type in ('Teeshot', 'Fairway', 'Approach') then 1
-                else 0
-            end
-        ) as fairway_attempts,
-        sum(
-            case
-                when thr.throw_number < rh.hole_par
-                    and (thr.throw_from in ('Circle 2', 'Circle 1')
-                            or thr.throw_to = 'Basket')
-                    then 1
-                else 0
-            end
-        ) as gir_c2,
-        sum(
-            case
-                when thr.throw_number < rh.hole_par
-                    and (thr.throw_from = 'Circle 1'
-                            or thr.throw_to = 'Basket')
-                    then 1
-                else 0
-            end
-        ) as gir_c1,
-        sum(
-            case
-                when thr.throw_number < rh.hole_par
-                    and thr.made_from = 'Tap In'
-                    then 1
-                else 0
-            end
-        ) as parked,
-        sum(case when thr.throw_from = 'Circle 1' and thr.throw_to = 'Basket' then 1 else 0 end) as c1_putts_made,
-        sum(case when thr.throw_from = 'Circle 1' then 1 else 0 end) as c1_putts_attempted,
-        sum(case when thr.throw_from = 'Circle 1' and thr.throw_to = 'Basket' and thr.made_from != 'Tap In' then 1 else 0 end) as c1x_putts_made,
-        sum(case when thr.throw_from = 'Circle 1' and (thr.made_from IS DISTINCT FROM 'Tap In') then 1 else 0 end) as c1x_putts_attempted,
-        sum(case when thr.throw_from = 'Circle 2' and thr.throw_to = 'Basket' then 1 else 0 end) as c2_putts_made,
-        sum(case when thr.throw_from = 'Circle 2' then 1 else 0 end) as c2_putts_attempted,
-        max_by(thr.distance, thr.throw_number) as distance_made_from,
-        max_by(thr.made_from, thr.throw_number) as zone_made_from
-
-    from {{ ref('fct_round_hole') }} rh
-    join {{ ref('fct_throw') }} thr on rh.round_hole_sk = thr.round_hole_sk
-
-    group by rh.round_hole_sk
-
-)
-
 select
     sc.scorecard_sk as "Scorecard SK",
     sc.start_date as "Scorecard Date",
@@ -126,6 +46,6 @@ left join {{ ref('dim_player') }} pl on rnd.player_sk = pl.player_sk
 left join {{ ref('dim_team') }} tm on rnd.team_sk = tm.team_sk
 join {{ ref('fct_round_hole') }} rh on rnd.round_sk = rh.round_sk
 join {{ ref('dim_hole') }} hl on rh.hole_sk = hl.hole_sk
-left join throwing_stats thst on rh.round_hole_sk = thst.round_hole_sk
+left join {{ ref('agg_round_hole_throw_stats') }} thst on rh.round_hole_sk = thst.round_hole_sk
 
 where not sc.is_deleted
\ No newline at end of file
@@ -0,0 +1,278 @@
+{{
+  config(
+    materialized='incremental',
+    unique_key='hole_streak_sk',
+    incremental_strategy='delete+insert',
+    schema='analytics',
+    post_hook=[
+      "
+        delete from {{ this }} hs
+        using (
+          select ed.player_sk, ed.streak_sk as course_streak_sk, min(ed.as_of_date) as restart_date
+          from {{ this }} ed
+          join {{ ref('fct_scorecard') }} fsc on ed.layout_sk = fsc.layout_sk
+            and ed.as_of_date = cast(fsc.start_date as date)
+          join {{ ref('scorecard_changes') }} scd on fsc.scorecard_id = scd.scorecard_id
+          where scd.processed_at > {{ changes_watermark() }}
+            and scd.first_processed_at < scd.processed_at
+          group by ed.player_sk, ed.streak_sk
+        ) es
+        where hs.processed_at < {{ batch_timestamp() }}
+          and hs.player_sk = es.player_sk
+          and (hs.streak_sk = es.course_streak_sk or hs.streak_type = 'total')
+          and hs.as_of_date >= es.restart_date
+      ",
+      "
+        update {{ this }} t
+        set player_name = dp.full_name
+        from {{ ref('dim_player') }} dp
+        where t.player_sk = dp.player_sk
+          and t.player_name is distinct from dp.full_name
+      ",
+      "
+        update {{ this }} t
+        set course_layout_name = dl.layout_full_name
+        from {{ ref('dim_layout') }} dl
+        where t.layout_sk = dl.layout_sk
+          and t.course_layout_name is distinct from dl.layout_full_name
+      ",
+      "{{ record_changes_watermark() }}"
+    ]
+  )
+}}
+
+-- Hole streaks per player, overall ('total') and per course layout ('course'), with one row per
+-- player, streak type and play date holding the streaks as of the end of that day. Query "as of" a
+-- date by taking each streak_sk's latest row on or before it.
+-- Streaks are islands of consecutive holes (in play order) meeting a condition: each hole's streak is
+-- its distance from the last hole that broke it. Incremental runs restart each streak from the earliest
+-- date with new holes, and the total and course streaks of each edited scorecard's players from its play
+-- date, carrying in the state as of the day before, so they never replay a player's history from the
+-- first round. The post_hooks drop those players' rows after an edit that weren't rebuilt (e.g. the
+-- edited round was the last one played) and refresh player and layout names from the dims.
+-- depends_on: {{ ref('scorecard_changes') }}
+
+{% set streaks = [
+    ('birdie_streak', 'hole_score < 0'),
+    ('par_streak', 'hole_score = 0'),
+    ('bogey_streak', 'hole_score > 0'),
+    ('bogey_free', 'hole_score <= 0'),
+    ('double_free', 'hole_score <= 1'),
+    ('triple_free', 'hole_score <= 2')
+] %}
+
+with
+{% if is_incremental() %}
+changed_scorecards as (
+    select
+        fsc.scorecard_id,
+        fsc.layout_sk,
+        cast(fsc.start_date as date) as play_date,
+        scd.first_processed_at < scd.processed_at as is_edited
+
+    from {{ ref('scorecard_changes') }} scd
+    join {{ ref('fct_scorecard') }} fsc on scd.scorecard_id = fsc.scorecard_id
+    where scd.processed_at > {{ changes_watermark() }}
+),
+
+edited_streaks as (
+    -- Players with a course streak row for an edited scorecard's layout and play date as of the last
+    -- run, which includes players since dropped from it
+    select
+        hs.player_sk,
+        hs.streak_sk as course_streak_sk,
+        cs.play_date
+
+    from {{ this }} hs
+    join changed_scorecards cs on hs.layout_sk = cs.layout_sk
+        and hs.as_of_date = cs.play_date
+    where cs.is_edited
+),
+{% endif %}
+
+player_holes as (
+    select
+        fr.player_sk,
+        dp.full_name as player_name,
+        dl.layout_sk,
+        dl.layout_full_name as course_layout_name,
+        fsc.scorecard_id,
+        cast(fsc.start_date as date) as play_date,
+        fsc.start_date,
+        fr.round_sk,
+        frh.play_order_number,
+        frh.hole_number,
+        frh.hole_score
+
+    from {{ ref('fct_round_hole') }} frh
+    join {{ ref('fct_round') }} fr on frh.round_sk = fr.round_sk
+    join {{ ref('fct_scorecard') }} fsc on fr.scorecard_sk = fsc.scorecard_sk
+    join {{ ref('dim_player') }} dp on fr.player_sk = dp.player_sk
+    join {{ ref('dim_layout') }} dl on fsc.layout_sk = dl.layout_sk
+
+    where fsc.is_finished = true
+        and not fsc.is_deleted
+        {% if is_incremental() %}
+        and cast(fsc.start_date as date) >= (select min(cs.play_date) from changed_scorecards cs)
+        {% endif %}
+),
+
+streak_holes as (
+    select
+        {{ hash_surrogate_key(['ph.player_sk', "'total'"]) }} as streak_sk,
+        'total' as streak_type,
+        null as layout_sk,
+        null as course_layout_name,
+        ph.* exclude (layout_sk, course_layout_name)
+    from player_holes ph
+
+    union all by name
+
+    select
+        {{ hash_surrogate_key(['ph.player_sk', "'course'", 'ph.layout_sk']) }} as streak_sk,
+        'course' as streak_type,
+        ph.layout_sk,
+        ph.course_layout_name,
+        ph.* exclude (layout_sk, course_layout_name)
+    from player_holes ph
+),
+
+restarts as (
+    {% if is_incremental() %}
+    select
+        r.streak_sk,
+        min(r.restart_date) as restart_date
+
+    from (
+        -- Streaks with holes on new or edited scorecards restart from the earliest of them
+        select sh.streak_sk, sh.play_date as restart_date
+        from streak_holes sh
+        where {{ in_changed_scorecards('sh.scorecard_id') }}
+
+        union all
+
+        -- Edits can change or remove holes of the edited scorecards' players, so their course streak on
+        -- its layout and their total streak restart from its play date
+        select es.course_streak_sk as streak_sk, es.play_date as restart_date
+        from edited_streaks es
+
+        union all
+
+        select {{ hash_surrogate_key(['es.player_sk', "'total'"]) }} as streak_sk, es.play_date as restart_date
+        from edited_streaks es
+    ) r
+    group by r.streak_sk
+    {% else %}
+    select
+        sh.streak_sk,
+        min(sh.play_date) as restart_date
+
+    from streak_holes sh
+    group by sh.streak_sk
+    {% endif %}
+),
+
+carried_state as (
+    -- Streaks as of the last play date before each restart
+    {% if is_incremental() %}
+    select
+        hs.streak_sk,
+        hs.holes_played,
+        {% for name, condition in streaks -%}
+        hs.current_{{ name }},
+        hs.long_{{ name }}{{ "," if not loop.last }}
+        {% endfor %}
+    from {{ this }} hs
+    join restarts rs on hs.streak_sk = rs.streak_sk
+        and hs.as_of_date < rs.restart_date
+    qualify row_number() over (partition by hs.streak_sk order by hs.as_of_date desc) = 1
+    {% else %}
+    select
+        rs.streak_sk,
+        0 as holes_played,
+        {% for name, condition in streaks -%}
+        0 as current_{{ name }},
+        0 as long_{{ name }}{{ "," if not loop.last }}
+        {% endfor %}
+    from restarts rs
+    where false
+    {% endif %}
+),
+
+ordered_holes as (
+    select
+        sh.*,
+        row_number() over (
+            partition by sh.streak_sk
+            order by sh.start_date, sh.round_sk, sh.play_order_number, sh.hole_number
+        ) as hole_seq
+
+    from streak_holes sh
+    join restarts rs on sh.streak_sk = rs.streak_sk
+        and sh.play_date >= rs.restart_date
+),
+
+hole_breaks as (
+    -- Sequence number of the last hole (up to and including this one) that broke each streak, 0 if none yet
+    select
+        oh.*,
+        {% for name, condition in streaks -%}
+        max(case when not coalesce(oh.{{ condition }}, false) then oh.hole_seq else 0 end) over (
+            partition by oh.streak_sk
+            order by oh.hole_seq
+            rows between unbounded preceding and current row
+        ) as last_break_{{ name }}{{ "," if not loop.last }}
+        {% endfor %}
+    from ordered_holes oh
+),
+
+hole_streaks as (
+    select
+        hb.*,
+        {% for name, condition in streaks -%}
+        hb.hole_seq - hb.last_break_{{ name }}
+            + case when hb.last_break_{{ name }} = 0 then coalesce(cs.current_{{ name }}, 0) else 0 end
+            as running_{{ name }},
+        {% endfor %}
+        coalesce(cs.holes_played, 0) + hb.hole_seq as running_holes_played,
+        {% for name, condition in streaks -%}
+        coalesce(cs.long_{{ name }}, 0) as carried_long_{{ name }}{{ "," if not loop.last }}
+        {% endfor %}
+    from hole_breaks hb
+    left join carried_state cs on hb.streak_sk = cs.streak_sk
+),
+
+daily_streaks as (
+    select
+        hs.*,
+        {% for name, condition in streaks -%}
+        greatest(
+            hs.carried_long_{{ name }},
+            max(hs.running_{{ name }}) over (
+                partition by hs.streak_sk
+                order by hs.hole_seq
+                rows between unbounded preceding and current row
+            )
+        ) as running_long_{{ name }}{{ "," if not loop.last }}
+        {% endfor %}
+    from hole_streaks hs
+    qualify row_number() over (partition by hs.streak_sk, hs.play_date order by hs.hole_seq desc) = 1
+)
+
+select
+    {{ hash_surrogate_key(['ds.streak_sk', 'ds.play_date']) }} as hole_streak_sk,
+    ds.streak_sk,
+    ds.player_sk,
+    ds.player_name,
+    ds.streak_type,
+    ds.layout_sk,
+    ds.course_layout_name,
+    ds.play_date as as_of_date,
+    ds.running_holes_played as holes_played,
+    {% for name, condition in streaks -%}
+    ds.running_{{ name }} as current_{{ name }},
+    ds.running_long_{{ name }} as long_{{ name }},
+    {% endfor %}
+    {{ batch_timestamp() }} as processed_at
+
+from daily_streaks ds
\ No newline at end of file
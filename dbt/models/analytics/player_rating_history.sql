@@ -0,0 +1,80 @@
+{{
+  config(
+    materialized='incremental',
+    unique_key='round_sk',
+    incremental_strategy='delete+insert',
+    schema='analytics',
+    post_hook=[
+      "
+        delete from {{ this }} prh
+        where {{ in_changed_scorecards('prh.scorecard_id') }}
+          and prh.processed_at < {{ batch_timestamp() }}
+      ",
+      "
+        update {{ this }} t
+        set player_name = dp.full_name
+        from {{ ref('dim_player') }} dp
+        where t.player_sk = dp.player_sk
+          and t.player_name is distinct from dp.full_name
+      ",
+      "
+        update {{ this }} t
+        set course_layout_name = dl.layout_full_name
+        from {{ ref('dim_layout') }} dl
+        where t.layout_sk = dl.layout_sk
+          and t.course_layout_name is distinct from dl.layout_full_name
+      ",
+      "{{ record_changes_watermark() }}"
+    ]
+  )
+}}
+
+-- One row per finished singles round with the player's UDisc round rating (null for unrated rounds).
+-- Incremental runs only add the rounds of new or changed scorecards; the post_hook drops rounds of
+-- changed scorecards that weren't re-added (deleted, unfinished or removed from the scorecard), and
+-- player and layout names are refreshed from the dims since renames don't touch the rows' scorecards.
+-- depends_on: {{ ref('scorecard_changes') }}
+
+with player_rounds as (
+    select
+        fr.round_sk,
+        fsc.scorecard_id,
+        fr.player_sk,
+        dp.full_name as player_name,
+        dl.course_sk,
+        dl.layout_sk,
+        dl.layout_full_name as course_layout_name,
+        fsc.start_date as date,
+        round(fr.round_rating_udisc, 0) as rating,
+        fr.round_strokes as strokes,
+        fr.round_score as score
+
+    from {{ ref('fct_round') }} fr
+    join {{ ref('fct_scorecard') }} fsc on fr.scorecard_sk = fsc.scorecard_sk
+    join {{ ref('dim_player') }} dp on fr.player_sk = dp.player_sk
+    join {{ ref('dim_layout') }} dl on fsc.layout_sk = dl.layout_sk
+
+    where fsc.is_finished = true
+        and not fsc.is_deleted
+        {% if is_incremental() %}
+        and {{ in_changed_scorecards('fsc.scorecard_id') }}
+        {% endif %}
+),
+
+round_holes as (
+    select
+        frh.round_sk,
+        count(distinct frh.hole_number) as holes_played
+
+    from {{ ref('fct_round_hole') }} frh
+    where frh.round_sk in (select round_sk from player_rounds)
+    group by frh.round_sk
+)
+
+select
+    pr.*,
+    coalesce(rh.holes_played, 0) as holes_played,
+    {{ batch_timestamp() }} as processed_at
+
+from player_rounds pr
+left join round_holes rh on pr.round_sk = rh.round_sk
\ No newline at end of file
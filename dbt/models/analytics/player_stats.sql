@@ -0,0 +1,233 @@
+{{
+  config(
+    materialized='incremental',
+    unique_key='player_sk',
+    incremental_strategy='delete+insert',
+    schema='analytics',
+    post_hook=[
+      "
+        delete from {{ this }} ps
+        where not exists (select 1 from {{ ref('player_rating_history') }} prh where prh.player_sk = ps.player_sk)
+      ",
+      "
+        update {{ this }} t
+        set player_name = dp.full_name
+        from {{ ref('dim_player') }} dp
+        where t.player_sk = dp.player_sk
+          and t.player_name is distinct from dp.full_name
+      ",
+      "{{ record_changes_watermark() }}"
+    ]
+  )
+}}
+
+-- Career stats per player, kept as running aggregates (counts, sums, sum of squares, min/max) and a
+-- rating histogram, so incremental runs merge in only the rounds added to player_rating_history since
+-- the last run. Edits can change or drop rounds already counted, which can't be subtracted back out,
+-- so only the players they touch are recomputed from their full history.
+-- Median and percentiles come from the histogram (see the histogram_quantile macro).
+-- Player names are refreshed from dim_player after each run.
+-- depends_on: {{ ref('scorecard_changes') }}
+-- depends_on: {{ ref('fct_scorecard') }}
+-- depends_on: {{ ref('fct_round') }}
+
+with edited_scorecards as (
+    select scd.scorecard_id
+
+    from {{ ref('scorecard_changes') }} scd
+    where scd.processed_at > {{ changes_watermark() }}
+        and scd.first_processed_at < scd.processed_at
+),
+
+{% if is_incremental() %}
+rebuilt_players as (
+    -- Players on edited scorecards
+    select fr.player_sk
+
+    from edited_scorecards es
+    join {{ ref('fct_scorecard') }} fsc on es.scorecard_id = fsc.scorecard_id
+    join {{ ref('fct_round') }} fr on fsc.scorecard_sk = fr.scorecard_sk
+    where fr.player_sk is not null
+
+    union
+
+    -- Players dropped from an edited scorecard, whose counted and new rounds no longer add up to their history
+    select ps.player_sk
+
+    from {{ this }} ps
+    left join (
+        select prh.player_sk, count(*) as rounds
+        from {{ ref('player_rating_history') }} prh
+        group by prh.player_sk
+    ) hr on ps.player_sk = hr.player_sk
+    left join (
+        select prh.player_sk, count(*) as rounds
+        from {{ ref('player_rating_history') }} prh
+        where prh.processed_at > {{ changes_watermark() }}
+        group by prh.player_sk
+    ) nr on ps.player_sk = nr.player_sk
+    where exists (select 1 from edited_scorecards)
+        and ps.rounds + coalesce(nr.rounds, 0) != coalesce(hr.rounds, 0)
+),
+{% endif %}
+
+new_rounds as (
+    select prh.*
+
+    from {{ ref('player_rating_history') }} prh
+    {% if is_incremental() %}
+    where prh.processed_at > {{ changes_watermark() }}
+        or prh.player_sk in (select player_sk from rebuilt_players)
+    {% endif %}
+),
+
+new_rating_histograms as (
+    select
+        rb.player_sk,
+        list({'value': rb.value, 'count': rb.count} order by rb.value) as rating_histogram
+
+    from (
+        select
+            nr.player_sk,
+            cast(nr.rating as integer) as value,
+            count(*) as count
+
+        from new_rounds nr
+        where nr.rating is not null
+        group by all
+    ) rb
+    group by rb.player_sk
+),
+
+new_state as (
+    select
+        nr.player_sk,
+        arg_max(nr.player_name, nr.date) as player_name,
+        count(*) as rounds,
+        cast(sum(nr.holes_played) as bigint) as holes,
+        cast(sum(nr.strokes) as bigint) as strokes,
+        cast(sum(nr.score) as bigint) as total_score,
+        list(distinct nr.course_sk) as course_sks,
+        count(nr.rating) as rated_rounds,
+        sum(nr.rating) as rating_sum,
+        sum(nr.rating * nr.rating) as rating_sum_squares,
+        max(nr.rating) as best_rating,
+        min(nr.rating) as worst_rating,
+        min(nr.date) as first_round_date,
+        max(nr.date) as last_round_date
+
+    from new_rounds nr
+    group by nr.player_sk
+),
+
+state_parts as (
+    select
+        ns.*,
+        coalesce(nrh.rating_histogram, []) as rating_histogram
+
+    from new_state ns
+    left join new_rating_histograms nrh on ns.player_sk = nrh.player_sk
+
+    {% if is_incremental() %}
+    union all by name
+
+    select
+        ps.player_sk,
+        ps.player_name,
+        ps.rounds,
+        ps.holes,
+        ps.strokes,
+        ps.total_score,
+        ps.course_sks,
+        ps.rated_rounds,
+        ps.rating_sum,
+        ps.rating_sum_squares,
+        ps.best_rating,
+        ps.worst_rating,
+        ps.first_round_date,
+        ps.last_round_date,
+        ps.rating_histogram
+
+    from {{ this }} ps
+    where ps.player_sk in (select player_sk from new_state)
+        and ps.player_sk not in (select player_sk from rebuilt_players)
+    {% endif %}
+),
+
+merged_rating_histograms as (
+    select
+        mb.player_sk,
+        list({'value': mb.value, 'count': mb.count} order by mb.value) as rating_histogram
+
+    from (
+        select
+            hb.player_sk,
+            hb.bucket.value as value,
+            sum(hb.bucket.count) as count
+
+        from (
+            select sp.player_sk, unnest(sp.rating_histogram) as bucket
+            from state_parts sp
+        ) hb
+        group by all
+    ) mb
+    group by mb.player_sk
+),
+
+merged_state as (
+    select
+        sp.player_sk,
+        arg_max(sp.player_name, sp.last_round_date) as player_name,
+        cast(sum(sp.rounds) as bigint) as rounds,
+        cast(sum(sp.holes) as bigint) as holes,
+        cast(sum(sp.strokes) as bigint) as strokes,
+        cast(sum(sp.total_score) as bigint) as total_score,
+        list_sort(list_distinct(flatten(list(sp.course_sks)))) as course_sks,
+        cast(sum(sp.rated_rounds) as bigint) as rated_rounds,
+        sum(sp.rating_sum) as rating_sum,
+        sum(sp.rating_sum_squares) as rating_sum_squares,
+        max(sp.best_rating) as best_rating,
+        min(sp.worst_rating) as worst_rating,
+        min(sp.first_round_date) as first_round_date,
+        max(sp.last_round_date) as last_round_date
+
+    from state_parts sp
+    group by sp.player_sk
+)
+
+select
+    ms.player_name,
+    ms.player_sk,
+    ms.rounds,
+    ms.holes,
+    ms.strokes,
+    len(ms.course_sks) as courses_played,
+    round(ms.total_score / ms.rounds, 2) as avg_score,
+    ms.rated_rounds,
+    round(ms.rating_sum / nullif(ms.rated_rounds, 0), 1) as avg_rating,
+    {{ histogram_quantile('coalesce(mrh.rating_histogram, [])', 0.5) }} as median_rating,
+    ms.best_rating,
+    ms.worst_rating,
+    case
+        when ms.rated_rounds > 1
+            then round(sqrt(greatest(
+                (ms.rating_sum_squares - ms.rating_sum * ms.rating_sum / ms.rated_rounds) / (ms.rated_rounds - 1),
+                0
+            )), 1)
+    end as stdev_rating,
+    {{ histogram_quantile('coalesce(mrh.rating_histogram, [])', 0.1) }} as rating_p10,
+    {{ histogram_quantile('coalesce(mrh.rating_histogram, [])', 0.25) }} as rating_p25,
+    {{ histogram_quantile('coalesce(mrh.rating_histogram, [])', 0.75) }} as rating_p75,
+    {{ histogram_quantile('coalesce(mrh.rating_histogram, [])', 0.9) }} as rating_p90,
+    ms.first_round_date,
+    ms.last_round_date,
+
+    -- Running state merged into by incremental runs
+    ms.total_score,
+    ms.course_sks,
+    ms.rating_sum,
+    ms.rating_sum_squares,
+    coalesce(mrh.rating_histogram, []) as rating_histogram
+
+from merged_state ms
+left join merged_rating_histograms mrh on ms.player_sk = mrh.player_sk
\ No newline at end of file
@@ -0,0 +1,123 @@
+{{
+  config(
+    materialized='table',
+    schema='analytics'
+  )
+}}
+
+-- Power (sour) score: the best (worst) possible score per player per course layout, assembled from the
+-- player's best (worst) strokes on each of the layout's holes. Holes are matched by canonical hole, so
+-- rounds on other layouts sharing the same physical hole count too. Per-hole strokes come from the
+-- incremental agg_player_hole_strokes, so this only re-aggregates small per-hole tables, and
+-- hole_makeup carries the hole-by-hole breakdown for the drilldown.
+
+with canonical_player_holes as (
+    select
+        phs.player_sk,
+        coalesce(chi.canonical_hole_id, phs.hole_sk) as canonical_hole_id,
+        sum(phs.times_played) as times_played,
+        min(phs.best_strokes) as best_strokes,
+        max(phs.worst_strokes) as worst_strokes
+
+    from {{ ref('agg_player_hole_strokes') }} phs
+    left join {{ ref('canonical_hole_ids') }} chi on phs.hole_sk = chi.hole_version_hash
+    group by all
+),
+
+latest_layout_scorecards as (
+    select
+        fsc.layout_sk,
+        fsc.scorecard_id
+
+    from {{ ref('fct_scorecard') }} fsc
+    where fsc.is_finished = true
+        and not fsc.is_deleted
+    qualify row_number() over (partition by fsc.layout_sk order by fsc.start_date desc, fsc.scorecard_id) = 1
+),
+
+layout_holes as (
+    -- Each layout's holes as of its most recently played scorecard
+    select
+        lls.layout_sk,
+        ch.hole_number,
+        ch.hole_par,
+        coalesce(chi.canonical_hole_id, ch.hole_version_hash) as canonical_hole_id
+
+    from latest_layout_scorecards lls
+    join {{ ref('course_holes') }} ch on lls.scorecard_id = ch.scorecard_id
+    left join {{ ref('canonical_hole_ids') }} chi on ch.hole_version_hash = chi.hole_version_hash
+),
+
+player_layout_rounds as (
+    select
+        fr.player_sk,
+        fsc.layout_sk,
+        count(*) as rounds_played
+
+    from {{ ref('fct_round') }} fr
+    join {{ ref('fct_scorecard') }} fsc on fr.scorecard_sk = fsc.scorecard_sk
+    where fr.player_sk is not null
+        and fsc.is_finished = true
+        and not fsc.is_deleted
+    group by all
+),
+
+player_layout_holes as (
+    select
+        plr.player_sk,
+        plr.layout_sk,
+        plr.rounds_played,
+        lh.hole_number,
+        lh.hole_par,
+        cph.times_played,
+        cph.best_strokes,
+        cph.worst_strokes
+
+    from player_layout_rounds plr
+    join layout_holes lh on plr.layout_sk = lh.layout_sk
+    left join canonical_player_holes cph on plr.player_sk = cph.player_sk
+        and lh.canonical_hole_id = cph.canonical_hole_id
+),
+
+power_scores as (
+    select
+        plh.player_sk,
+        plh.layout_sk,
+        plh.rounds_played,
+        count(*) as holes,
+        sum(plh.hole_par) as par,
+        sum(plh.best_strokes) as power_score,
+        sum(plh.worst_strokes) as sour_score,
+        list({
+            'hole_number': plh.hole_number,
+            'par': plh.hole_par,
+            'times_played': plh.times_played,
+            'best_strokes': plh.best_strokes,
+            'worst_strokes': plh.worst_strokes
+        } order by plh.hole_number) as hole_makeup
+
+    from player_layout_holes plh
+    group by plh.player_sk, plh.layout_sk, plh.rounds_played
+    -- Only layouts where the player has played every hole
+    having count(plh.best_strokes) = count(*)
+)
+
+select
+    dp.full_name as player_name,
+    dc.course_name,
+    dl.layout_full_name as course_layout_name,
+    ps.player_sk,
+    ps.layout_sk,
+    ps.rounds_played,
+    ps.holes,
+    ps.par,
+    ps.power_score,
+    ps.power_score - ps.par as power_score_vs_par,
+    ps.sour_score,
+    ps.sour_score - ps.par as sour_score_vs_par,
+    ps.hole_makeup
+
+from power_scores ps
+join {{ ref('dim_player') }} dp on ps.player_sk = dp.player_sk
+join {{ ref('dim_layout') }} dl on ps.layout_sk = dl.layout_sk
+join {{ ref('dim_course') }} dc on dl.course_sk = dc.course_sk
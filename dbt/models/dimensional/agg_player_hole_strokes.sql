@@ -0,0 +1,84 @@
+{{
+  config(
+    unique_key='player_hole_sk',
+    post_hook=[
+      "
+      delete from {{ this }} phs
+      where not exists (
+        select 1
+        from {{ ref('fct_round_hole') }} frh
+        join {{ ref('fct_round') }} fr on frh.round_sk = fr.round_sk
+        join {{ ref('fct_scorecard') }} fsc on fr.scorecard_sk = fsc.scorecard_sk
+        where fr.player_sk = phs.player_sk
+          and frh.hole_sk = phs.hole_sk
+          and fsc.is_finished = true
+          and not fsc.is_deleted
+      )
+      ",
+      "{{ record_changes_watermark() }}"
+    ]
+  )
+}}
+
+-- Best, worst and total strokes per player per hole version over finished singles rounds.
+-- Hole versions are stable keys, unlike canonical hole ids, which are reassigned as versions are
+-- merged; analytics.power_scores folds these into canonical holes (min of mins, max of maxes).
+-- Incremental runs recompute only the player/hole pairs played on new or changed scorecards, plus the
+-- pairs whose plays no longer add up after an edit.
+-- depends_on: {{ ref('scorecard_changes') }}
+
+with player_round_holes as (
+    select
+        fr.player_sk,
+        frh.hole_sk,
+        frh.hole_strokes,
+        fsc.scorecard_id
+
+    from {{ ref('fct_round_hole') }} frh
+    join {{ ref('fct_round') }} fr on frh.round_sk = fr.round_sk
+    join {{ ref('fct_scorecard') }} fsc on fr.scorecard_sk = fsc.scorecard_sk
+    where fr.player_sk is not null
+        and fsc.is_finished = true
+        and not fsc.is_deleted
+)
+
+select
+    {{ hash_surrogate_key(['prh.player_sk', 'prh.hole_sk']) }} as player_hole_sk,
+    prh.player_sk,
+    prh.hole_sk,
+    count(*) as times_played,
+    min(prh.hole_strokes) as best_strokes,
+    max(prh.hole_strokes) as worst_strokes,
+    sum(prh.hole_strokes) as total_strokes
+
+from player_round_holes prh
+{% if is_incremental() %}
+join (
+    select changed.player_sk, changed.hole_sk
+    from player_round_holes changed
+    where {{ in_changed_scorecards('changed.scorecard_id') }}
+
+    union
+
+    -- Pairs that lost plays to an edit (e.g. the player was dropped from an edited scorecard), which no
+    -- current row of the changed scorecards points to any more
+    select phs.player_sk, phs.hole_sk
+    from {{ this }} phs
+    left join (
+        select played.player_sk, played.hole_sk, count(*) as times_played
+        from player_round_holes played
+        group by played.player_sk, played.hole_sk
+    ) cur on phs.player_sk = cur.player_sk
+        and phs.hole_sk = cur.hole_sk
+    where exists (
+            select 1
+            from {{ ref('scorecard_changes') }} scd
+            where scd.processed_at > {{ changes_watermark() }}
+                and scd.first_processed_at < scd.processed_at
+        )
+        and phs.times_played != coalesce(cur.times_played, 0)
+) cph on prh.player_sk = cph.player_sk
+    and prh.hole_sk = cph.hole_sk
+{% endif %}
+
+group by prh.player_sk, prh.hole_sk
\ No newline at end of file
@@ -0,0 +1,111 @@
+{{
+  config(
+    unique_key='round_sk',
+    pre_hook="
+      {% if is_incremental() %}
+      delete from {{ this }} ts
+      where ts.round_sk in (
+          select fr.round_sk
+          from {{ ref('fct_round') }} fr
+          join {{ ref('fct_scorecard') }} fs on fr.scorecard_sk = fs.scorecard_sk
+          where {{ in_changed_scorecards('fs.scorecard_id') }}
+      )
+      {% endif %}
+      ",
+    post_hook=[
+      "
+      delete from {{ this }} ts
+      where not exists (select 1 from {{ ref('fct_round_hole') }} rh where rh.round_hole_sk = ts.round_hole_sk)
+      ",
+      "{{ record_changes_watermark() }}"
+    ]
+  )
+}}
+
+-- Throwing stats per round hole, computed in one pass over fct_throw.
+-- analytics.hole_results reads these directly and analytics.rounds re-aggregates them by round_sk.
+-- Incremental runs replace every round hole of each changed round (unique_key is the parent round_sk).
+-- Rounds without throws emit nothing here, so the pre_hook drops the changed scorecards' rounds first.
+-- depends_on: {{ ref('scorecard_changes') }}
+
+select
+    rh.round_hole_sk,
+    rh.round_sk,
+    sum(
+        case
+            when rh.hole_par <= 3 and thr.throw_number = 1 and thr.throw_to not in ('Out of Bounds', 'Off Fairway') then 1
+            when rh.hole_par = 4
+                and thr.throw_number = 1
+                and thr.throw_type in ('Teeshot', 'Fairway', 'Approach')
+                and thr.throw_to not in ('Out of Bounds', 'Off Fairway')
+                then 1
+            when rh.hole_par = 4
+                and thr.throw_number = 2
+                and thr.throw_type in ('Teeshot', 'Fairway', 'Approach')
+                and thr.throw_to in ('Circle 2', 'Circle 1', 'Basket')
+                then 1
+            when rh.hole_par >= 5
+                and thr.throw_number between 1 and 2
+                and thr.throw_type in ('Teeshot', 'Fairway', 'Approach')
+                and thr.throw_to not in ('Out of Bounds', 'Off Fairway')
+                then 1
+            when rh.hole_par >= 5
+                and thr.throw_number = 3
+                and thr.throw_type in ('Teeshot', 'Fairway', 'Approach')
+                and thr.throw_to in ('Circle 2', 'Circle 1', 'Basket')
+                then 1
+            else 0
+        end
+    ) as fairway_hits,
+    sum(
+        case
+            when rh.hole_par <= 3 and thr.throw_number = 1 then 1
+            when rh.hole_par = 4 and thr.throw_number between 1 and 2 and thr.throw_type in ('Teeshot', 'Fairway', 'Approach') then 1
+            when rh.hole_par >= 5 and thr.throw_number between 1 and 3 and thr.throw_type in ('Teeshot', 'Fairway', 'Approach') then 1
+            else 0
+        end
+    ) as fairway_attempts,
+    sum(
+        case
+            when thr.throw_number < rh.hole_par
+                and (thr.throw_from in ('Circle 2', 'Circle 1')
+                        or thr.throw_to = 'Basket')
+                then 1
+            else 0
+        end
+    ) as gir_c2,
+    sum(
+        case
+            when thr.throw_number < rh.hole_par
+                and (thr.throw_from = 'Circle 1'
+                        or thr.throw_to = 'Basket')
+                then 1
+            else 0
+        end
+    ) as gir_c1,
+    sum(
+        case
+            when thr.throw_number < rh.hole_par
+                and thr.made_from = 'Tap In'
+                then 1
+            else 0
+        end
+    ) as parked,
+    sum(case when thr.throw_from = 'Circle 1' and thr.throw_to = 'Basket' then 1 else 0 end) as c1_putts_made,
+    sum(case when thr.throw_from = 'Circle 1' then 1 else 0 end) as c1_putts_attempted,
+    sum(case when thr.throw_from = 'Circle 1' and thr.throw_to = 'Basket' and thr.made_from != 'Tap In' then 1 else 0 end) as c1x_putts_made,
+    sum(case when thr.throw_from = 'Circle 1' and (thr.made_from IS DISTINCT FROM 'Tap In') then 1 else 0 end) as c1x_putts_attempted,
+    sum(case when thr.throw_from = 'Circle 2' and thr.throw_to = 'Basket' then 1 else 0 end) as c2_putts_made,
+    sum(case when thr.throw_from = 'Circle 2' then 1 else 0 end) as c2_putts_attempted,
+    max_by(thr.distance, thr.throw_number) as distance_made_from,
+    max_by(thr.made_from, thr.throw_number) as zone_made_from
+
+from {{ ref('fct_round_hole') }} rh
+join {{ ref('fct_throw') }} thr on rh.round_hole_sk = thr.round_hole_sk
+join {{ ref('fct_round') }} fr on rh.round_sk = fr.round_sk
+join {{ ref('fct_scorecard') }} fs on fr.scorecard_sk = fs.scorecard_sk
+{% if is_incremental() %}
+where {{ in_changed_scorecards('fs.scorecard_id') }}
+{% endif %}
+
+group by rh.round_hole_sk, rh.round_sk
\ No newline at end of file
@@ -1,7 +1,11 @@
 {{ config(
-    unique_key=['player_sk', 'team_sk']
+    unique_key=['player_sk', 'team_sk'],
+    post_hook="{{ record_changes_watermark() }}"
 ) }}
 
+-- Incremental runs rebuild only the teams on new or changed scorecards
+-- depends_on: {{ ref('scorecard_changes') }}
+
 with player_teams as (
     select
         pl.player_sk,
@@ -12,6 +16,15 @@ with player_teams as (
     from {{ ref('scorecard_entries') }} se
     join {{ ref('dim_player') }} pl on se.player_id = pl.player_id
     join {{ ref('dim_team') }} tm on contains(tm.team_id, se.player_id)
+    {% if is_incremental() %}
+    where tm.team_id in (
+        select string_agg(distinct player_id, '_' order by player_id)
+        from {{ ref('scorecard_entries') }}
+        where {{ in_changed_scorecards('scorecard_id') }}
+        group by entry_id
+        having count(distinct player_id) > 1
+    )
+    {% endif %}
     group by all
 )
 
@@ -21,8 +34,4 @@ select
     pt.created_at,
     pt.updated_at
 
-from player_teams pt
-
-{% if is_incremental() %}
-  where pt.updated_at > (select max(updated_at) from {{ this }})
-{% endif %}
\ No newline at end of file
+from player_teams pt
\ No newline at end of file
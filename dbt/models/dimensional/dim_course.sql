@@ -1,22 +1,33 @@
 {{
   config(
-    unique_key='course_sk'
+    unique_key='course_sk',
+    post_hook="{{ record_changes_watermark() }}"
   )
 }}
 
+-- Incremental runs rebuild only the courses played on new or changed scorecards
+-- depends_on: {{ ref('scorecard_changes') }}
+
 with courses_grouped as (
   select
       sc.course_id,
       sc.course_name,
       upper(substring(replace(sc.difficulty, '-', ' '), 1, 1)) || lower(substring(replace(sc.difficulty, '-', ' '), 2)) as difficulty,
       sc.course_id is null as is_custom,
-      {{ dbt_utils.generate_surrogate_key(["coalesce(sc.course_id, sc.course_name)"]) }} as course_sk,
+      {{ hash_surrogate_key(["coalesce(sc.course_id, sc.course_name)"]) }} as course_sk,
       min(sc.created_at) as created_at,
       max(sc.updated_at) as updated_at,
       count(distinct sc.scorecard_id) as scorecard_count,
       max(sc.start_date) as latest_start_date
 
   from {{ ref('scorecards') }} sc
+  {% if is_incremental() %}
+  where coalesce(sc.course_id, sc.course_name) in (
+      select coalesce(course_id, course_name)
+      from {{ ref('scorecards') }}
+      where {{ in_changed_scorecards('scorecard_id') }}
+  )
+  {% endif %}
   group by all
 ),
 courses as (
@@ -34,8 +45,4 @@ select
   c.created_at,
   c.updated_at
 
-from courses c
-
-{% if is_incremental() %}
-  where c.updated_at > (select max(updated_at) from {{ this }})
-{% endif %}
\ No newline at end of file
+from courses c
\ No newline at end of file
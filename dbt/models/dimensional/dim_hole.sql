@@ -1,9 +1,13 @@
 {{
   config(
-    unique_key='hole_sk'
+    unique_key='hole_sk',
+    post_hook="{{ record_changes_watermark() }}"
   )
 }}
 
+-- Incremental runs rebuild only the hole versions on new or changed scorecards
+-- depends_on: {{ ref('scorecard_changes') }}
+
 with holes_grouped as (
     select
         ch.hole_version_hash as hole_sk,
@@ -22,6 +26,13 @@ with holes_grouped as (
         max(ch.start_date) as latest_start_date
 
     from {{ ref('course_holes') }} ch
+    {% if is_incremental() %}
+    where ch.hole_version_hash in (
+        select hole_version_hash
+        from {{ ref('course_holes') }}
+        where {{ in_changed_scorecards('scorecard_id') }}
+    )
+    {% endif %}
     group by all
 ),
 holes as (
@@ -44,8 +55,4 @@ select
     h.created_at,
     h.updated_at
 
-from holes h
-
-{% if is_incremental() %}
-  where h.updated_at > (select max(updated_at) from {{ this }})
-{% endif %}
\ No newline at end of file
+from holes h
\ No newline at end of file
@@ -1,15 +1,19 @@
 {{
   config(
-    unique_key='layout_sk'
+    unique_key='layout_sk',
+    post_hook="{{ record_changes_watermark() }}"
   )
 }}
 
+-- Incremental runs rebuild only the layouts played on new or changed scorecards
+-- depends_on: {{ ref('scorecard_changes') }}
+
 with layouts_grouped as (
     select
         sc.layout_id,
         sc.layout_name,
         sc.layout_full_name,
-        {{ dbt_utils.generate_surrogate_key(["coalesce(sc.layout_id, sc.layout_full_name)"]) }} as layout_sk,
+        {{ hash_surrogate_key(["coalesce(sc.layout_id, sc.layout_full_name)"]) }} as layout_sk,
         dc.course_sk,
         case
             when sc.layout_name like '% to %'
@@ -26,6 +30,13 @@ with layouts_grouped as (
 
     from {{ ref('scorecards') }} sc
     join {{ ref('dim_course') }} dc on coalesce(sc.course_id, sc.course_name) = coalesce(dc.course_id, dc.course_name)
+    {% if is_incremental() %}
+    where coalesce(sc.layout_id, sc.layout_full_name) in (
+        select coalesce(layout_id, layout_full_name)
+        from {{ ref('scorecards') }}
+        where {{ in_changed_scorecards('scorecard_id') }}
+    )
+    {% endif %}
     group by all
 ),
 layouts as (
@@ -46,8 +57,4 @@ select
     l.created_at,
     l.updated_at
 
-from layouts l
-
-{% if is_incremental() %}
-  where l.updated_at > (select max(updated_at) from {{ this }})
-{% endif %}
\ No newline at end of file
+from layouts l
\ No newline at end of file
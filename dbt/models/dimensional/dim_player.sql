@@ -1,12 +1,16 @@
 {{
   config(
-    unique_key='player_sk'
+    unique_key='player_sk',
+    post_hook="{{ record_changes_watermark() }}"
   )
 }}
 
+-- Incremental runs rebuild only the players on new or changed scorecards
+-- depends_on: {{ ref('scorecard_changes') }}
+
 with players_grouped as (
     select
-        {{ dbt_utils.generate_surrogate_key(["se.player_id"]) }} as player_sk,
+        {{ hash_surrogate_key(["se.player_id"]) }} as player_sk,
         se.player_id,
         se.player_full_name as full_name,
         se.player_first_name as first_name,
@@ -22,6 +26,13 @@ with players_grouped as (
         max(se.start_date) as latest_start_date
 
     from {{ ref('scorecard_entries') }} se
+    {% if is_incremental() %}
+    where se.player_id in (
+        select player_id
+        from {{ ref('scorecard_entries') }}
+        where {{ in_changed_scorecards('scorecard_id') }}
+    )
+    {% endif %}
     group by all
 ),
 players_with_created_by as (
@@ -37,6 +48,16 @@ players as (
     select *
     from players_with_created_by
     qualify row_number() over (partition by player_sk order by scorecard_count desc, latest_start_date desc) = 1
+),
+created_by_players as (
+    select player_id, player_sk
+    from players
+    {% if is_incremental() %}
+    -- The scorecard creator may be a player loaded by an earlier run
+    union
+    select player_id, player_sk
+    from {{ this }}
+    {% endif %}
 )
 
 select
@@ -54,8 +75,4 @@ select
   p.updated_at
 
 from players p
-left join players cbp on p.created_by_player_id = cbp.player_id
-
-{% if is_incremental() %}
-  where p.updated_at > (select max(updated_at) from {{ this }})
-{% endif %}
\ No newline at end of file
+left join created_by_players cbp on p.created_by_player_id = cbp.player_id
\ No newline at end of file
@@ -1,9 +1,14 @@
 {{
   config(
-    unique_key='target_sk'
+    unique_key='target_sk',
+    post_hook="{{ record_changes_watermark() }}"
   )
 }}
 
+-- Canonical target ids are ranked within a course, so incremental runs rebuild every target
+-- at the courses played on new or changed scorecards
+-- depends_on: {{ ref('scorecard_changes') }}
+
 with targets_grouped as (
     select
         ch.target_version_hash as target_sk,
@@ -21,6 +26,13 @@ with targets_grouped as (
         
     from {{ ref('course_holes') }} ch
     join {{ ref('canonical_target_ids') }} cti on ch.target_version_hash = cti.target_version_hash
+    {% if is_incremental() %}
+    where coalesce(ch.course_id, '') in (
+        select coalesce(course_id, '')
+        from {{ ref('course_holes') }}
+        where {{ in_changed_scorecards('scorecard_id') }}
+    )
+    {% endif %}
     group by all
 ),
 targets as (
@@ -41,8 +53,4 @@ select
     trg.created_at,
     trg.updated_at
 
-from targets trg
-
-{% if is_incremental() %}
-  where trg.updated_at > (select max(updated_at) from {{ this }})
-{% endif %}
\ No newline at end of file
+from targets trg
\ No newline at end of file
@@ -1,12 +1,16 @@
 {{ config(
-    unique_key='team_sk'
+    unique_key='team_sk',
+    post_hook="{{ record_changes_watermark() }}"
 ) }}
 
+-- Incremental runs rebuild only the teams on new or changed scorecards
+-- depends_on: {{ ref('scorecard_changes') }}
+
 with teams_grouped as (
     select
         se.entry_id,
         string_agg(distinct se.player_id, '_' order by se.player_id) as team_id,
-        {{ dbt_utils.generate_surrogate_key(["string_agg(distinct se.player_id, '_' order by se.player_id)"]) }} as team_sk,
+        {{ hash_surrogate_key(["string_agg(distinct se.player_id, '_' order by se.player_id)"]) }} as team_sk,
         string_agg(distinct coalesce(se.player_first_name, se.player_display_name), ' + ' 
             order by coalesce(se.player_first_name, se.player_display_name)) as team_name,
         case
@@ -17,15 +21,35 @@ with teams_grouped as (
         min(se.created_at) as created_at,
         max(se.updated_at) as updated_at,
         count(distinct se.scorecard_id) as scorecard_count,
-        max(se.start_date) as latest_start_date
+        max(se.start_date) as latest_start_date,
+        any_value(se.scorecard_id) as entry_scorecard_id
     
     from {{ ref('scorecard_entries') }} se
+    {% if is_incremental() %}
+    -- Every entry by a batch player, so the team rows below see all of their rounds
+    where se.entry_id in (
+        select entry_id
+        from {{ ref('scorecard_entries') }}
+        where player_id in (
+            select player_id
+            from {{ ref('scorecard_entries') }}
+            where {{ in_changed_scorecards('scorecard_id') }}
+        )
+    )
+    {% endif %}
     group by se.entry_id
     having count(distinct se.player_id) > 1
 ),
 teams as (
     select *
     from teams_grouped
+    {% if is_incremental() %}
+    where team_sk in (
+        select team_sk
+        from teams_grouped
+        where {{ in_changed_scorecards('entry_scorecard_id') }}
+    )
+    {% endif %}
     qualify row_number() over (partition by team_sk order by scorecard_count desc, latest_start_date desc) = 1
 )
 
@@ -37,8 +61,4 @@ select
     tm.created_at,
     tm.updated_at
 
-from teams tm
-
-{% if is_incremental() %}
-  where tm.updated_at > (select max(updated_at ) from {{ this }})
-{% endif %}
\ No newline at end of file
+from teams tm
\ No newline at end of file
@@ -1,9 +1,14 @@
 {{
   config(
-    unique_key='tee_sk'
+    unique_key='tee_sk',
+    post_hook="{{ record_changes_watermark() }}"
   )
 }}
 
+-- Canonical tee ids are ranked within a course, so incremental runs rebuild every tee
+-- at the courses played on new or changed scorecards
+-- depends_on: {{ ref('scorecard_changes') }}
+
 with tees_grouped as (
     select
         ch.tee_version_hash as tee_sk,
@@ -19,6 +24,13 @@ with tees_grouped as (
         
     from {{ ref('course_holes') }} ch
     join {{ ref('canonical_tee_ids') }} cti on ch.tee_version_hash = cti.tee_version_hash
+    {% if is_incremental() %}
+    where coalesce(ch.course_id, '') in (
+        select coalesce(course_id, '')
+        from {{ ref('course_holes') }}
+        where {{ in_changed_scorecards('scorecard_id') }}
+    )
+    {% endif %}
     group by all
 ),
 tees as (
@@ -37,8 +49,4 @@ select
     t.created_at,
     t.updated_at
 
-from tees t
-
-{% if is_incremental() %}
-  where t.updated_at > (select max(updated_at) from {{ this }})
-{% endif %}
\ No newline at end of file
+from tees t
\ No newline at end of file
@@ -1,15 +1,40 @@
 {{
   config(
-    unique_key='round_sk'
+    unique_key='round_sk',
+    post_hook=[
+      "
+      delete from {{ this }} fr
+      where not exists (select 1 from {{ ref('scorecard_entries') }} se where se.entry_id = fr.round_id)
+      ",
+      "{{ record_changes_watermark() }}"
+    ]
   )
 }}
 
-with player_or_team_id as (
+-- depends_on: {{ ref('scorecard_changes') }}
+
+with scorecard_entries as (
+    select *
+    from {{ ref('scorecard_entries') }} se
+    {% if is_incremental() %}
+    where {{ in_changed_scorecards('se.scorecard_id') }}
+    {% endif %}
+),
+
+course_holes as (
+    select *
+    from {{ ref('course_holes') }} ch
+    {% if is_incremental() %}
+    where {{ in_changed_scorecards('ch.scorecard_id') }}
+    {% endif %}
+),
+
+player_or_team_id as (
     select
         se.entry_id,
         string_agg(distinct se.player_id, '_' order by se.player_id) as player_or_team_id
 
-    from {{ ref('scorecard_entries') }} se
+    from scorecard_entries se
     group by se.entry_id
 ),
 
@@ -17,7 +42,7 @@ round_par as (
     select
         ch.scorecard_id,
         sum(ch.hole_par) as round_par
-    from {{ ref('course_holes') }} ch
+    from course_holes ch
     group by ch.scorecard_id
 ),
 
@@ -26,7 +51,7 @@ hole_strokes as (
         se.entry_id,
         se.hole_number,
         max(se.hole_strokes) as hole_strokes
-    from {{ ref('scorecard_entries') }} se
+    from scorecard_entries se
     group by se.entry_id, se.hole_number
 ),
 
@@ -41,7 +66,7 @@ round_strokes as (
 rounds_grouped as (
   select
       se.entry_id as round_id,
-      {{ dbt_utils.generate_surrogate_key(["se.entry_id"]) }} as round_sk,
+      {{ hash_surrogate_key(["se.entry_id"]) }} as round_sk,
       fsc.scorecard_sk,
       dp.player_sk,
       dt.team_sk,
@@ -62,7 +87,7 @@ rounds_grouped as (
       se.entry_created_at as created_at,
       se.entry_updated_at as updated_at
 
-  from {{ ref('scorecard_entries') }} se
+  from scorecard_entries se
   join player_or_team_id ptid on se.entry_id = ptid.entry_id
   join {{ ref('fct_scorecard') }} fsc on se.scorecard_id = fsc.scorecard_id
   join round_par rp on se.scorecard_id = rp.scorecard_id
@@ -93,8 +118,4 @@ select
     r.created_at,
     r.updated_at
 
-from rounds r
-
-{% if is_incremental() %}
-  where r.updated_at > (select max(updated_at) from {{ this }})
-{% endif %}
\ No newline at end of file
+from rounds r
\ No newline at end of file
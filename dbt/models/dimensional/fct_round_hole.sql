@@ -1,12 +1,23 @@
 {{
   config(
-    unique_key='round_hole_sk'
+    unique_key='round_sk',
+    post_hook=[
+      "
+      delete from {{ this }} rh
+      where not exists (select 1 from {{ ref('fct_round') }} fr where fr.round_sk = rh.round_sk)
+      ",
+      "{{ record_changes_watermark() }}"
+    ]
   )
 }}
 
+-- Incremental runs replace every hole of each changed round (unique_key is the parent round_sk),
+-- so a hole whose round_hole_sk changes in a late edit doesn't leave its old row behind.
+-- depends_on: {{ ref('scorecard_changes') }}
+
 with round_holes_grouped as (
     select
-        {{ dbt_utils.generate_surrogate_key(["fr.round_sk", "ch.hole_version_hash"]) }} as round_hole_sk,
+        {{ hash_surrogate_key(["fr.round_sk", "ch.hole_version_hash"]) }} as round_hole_sk,
         fr.round_sk,
         ch.hole_version_hash as hole_sk,
         fs.starting_hole,
@@ -41,6 +52,9 @@ with round_holes_grouped as (
     join {{ ref('course_holes') }} ch on se.scorecard_id = ch.scorecard_id
         and ch.hole_number = se.hole_number
     where se.hole_strokes > 0
+    {% if is_incremental() %}
+        and {{ in_changed_scorecards('se.scorecard_id') }}
+    {% endif %}
     group by all
 ),
 round_holes as (
@@ -76,8 +90,4 @@ select
     rh.updated_at
 
 from round_holes rh
-join hole_count hc on rh.round_sk = hc.round_sk
-
-{% if is_incremental() %}
-  where rh.updated_at > (select max(updated_at) from {{ this }})
-{% endif %}
\ No newline at end of file
+join hole_count hc on rh.round_sk = hc.round_sk
\ No newline at end of file
@@ -1,11 +1,14 @@
 {{ config(
-    unique_key='scorecard_sk'
+    unique_key='scorecard_sk',
+    post_hook="{{ record_changes_watermark() }}"
 ) }}
 
+-- depends_on: {{ ref('scorecard_changes') }}
+
 with scorecards as (
     select
         sc.scorecard_id,
-        {{ dbt_utils.generate_surrogate_key(["sc.scorecard_id"]) }} as scorecard_sk,
+        {{ hash_surrogate_key(["sc.scorecard_id"]) }} as scorecard_sk,
         dl.layout_sk,
         timezone('America/New_York', sc.start_date) as start_date,
         timezone('America/New_York', sc.end_date) as end_date,
@@ -20,18 +23,18 @@ with scorecards as (
         sc.floors_ascended,
         sc.floors_descended,
         round(
-            {{ kelvin_to_fahrenheit("cast(json_extract(sc.weather, '$.temperature') as double)") }}
+            {{ kelvin_to_fahrenheit("sc.weather.temperature") }}
         , 0) as temperature,
-        cast(json_extract(sc.weather, '$.wind.direction') as double) as wind_direction_degrees,
+        sc.weather.wind.direction as wind_direction_degrees,
         {{ bearing_degrees_to_cardinal_direction(
-            "cast(json_extract(sc.weather, '$.wind.direction') as double)",
+            "sc.weather.wind.direction",
             8
         ) }} as wind_direction,
         round(
-            {{ meters_per_second_to_miles_per_hour("cast(json_extract(sc.weather, '$.wind.speed') as double)") }}
+            {{ meters_per_second_to_miles_per_hour("sc.weather.wind.speed") }}
         , 0) as wind_speed,
-        cast(json_extract(sc.weather, '$.humidity') as double) as humidity_percent,
-        cast(json_extract(sc.weather, '$.cloudCoverPercent') as double) as cloud_cover_percent,
+        sc.weather.humidity as humidity_percent,
+        sc.weather.cloudCoverPercent as cloud_cover_percent,
         sc.notes,
         sc.uses_valid_smart_layout,
         sc.is_finished,
@@ -43,8 +46,11 @@ with scorecards as (
         sc.updated_at
 
     from {{ ref('scorecards') }} sc
-    join {{ ref('dim_layout') }} dl on coalesce(sc.layout_id, sc.layout_name) = coalesce(dl.layout_id, dl.layout_name)
+    join {{ ref('dim_layout') }} dl on coalesce(sc.layout_id, sc.layout_full_name) = coalesce(dl.layout_id, dl.layout_full_name)
     left join {{ ref('dim_player') }} dp on sc.created_by_user_id = dp.player_id
+    {% if is_incremental() %}
+    where {{ in_changed_scorecards('sc.scorecard_id') }}
+    {% endif %}
     qualify row_number() over (partition by scorecard_sk order by sc.updated_at desc) = 1
 )
 
@@ -76,8 +82,4 @@ select
     sc.created_at,
     sc.updated_at
 
-from scorecards sc
-
-{% if is_incremental() %}
-  where sc.updated_at > (select max(updated_at) from {{ this }})
-{% endif %}
\ No newline at end of file
+from scorecards sc
\ No newline at end of file
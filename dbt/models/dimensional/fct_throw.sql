@@ -1,9 +1,34 @@
 {{
   config(
-    unique_key='throw_sk'
+    unique_key='round_hole_sk',
+    pre_hook="
+      {% if is_incremental() %}
+      delete from {{ this }} thr
+      where thr.round_hole_sk in (
+          select rh.round_hole_sk
+          from {{ ref('fct_round_hole') }} rh
+          join {{ ref('fct_round') }} fr on rh.round_sk = fr.round_sk
+          join {{ ref('fct_scorecard') }} fs on fr.scorecard_sk = fs.scorecard_sk
+          where {{ in_changed_scorecards('fs.scorecard_id') }}
+      )
+      {% endif %}
+      ",
+    post_hook=[
+      "
+      delete from {{ this }} thr
+      where not exists (select 1 from {{ ref('fct_round_hole') }} rh where rh.round_hole_sk = thr.round_hole_sk)
+      ",
+      "{{ record_changes_watermark() }}"
+    ]
   )
 }}
 
+-- Incremental runs replace every throw of each changed round hole (unique_key is the parent
+-- round_hole_sk). The pre_hook first drops every throw of the changed scorecards' rounds, so throws
+-- removed in a late edit don't linger on holes the new version emits no throws for.
+-- depends_on: {{ ref('scorecard_changes') }}
+-- depends_on: {{ ref('fct_scorecard') }}
+
 with player_or_team_id as (
     select
         se.entry_id,
@@ -47,11 +72,14 @@ throw_data as (
     join {{ ref('fct_round') }} fr on thr.entry_id = fr.round_id
     join {{ ref('fct_round_hole') }} frh on fr.round_sk = frh.round_sk
         and thr.hole_number = frh.hole_number
+    {% if is_incremental() %}
+    where {{ in_changed_scorecards('thr.scorecard_id') }}
+    {% endif %}
 ),
 
 final as (
     select
-        {{ dbt_utils.generate_surrogate_key(['thr_to.round_hole_sk', 'thr_to.throw_number']) }} as throw_sk,
+        {{ hash_surrogate_key(['thr_to.round_hole_sk', 'thr_to.throw_number']) }} as throw_sk,
         thr_to.round_hole_sk,
         thr_to.throw_number,
         case
@@ -128,8 +156,4 @@ select
     f.created_at,
     f.updated_at
 
-from final f
-
-{% if is_incremental() %}
-  where f.updated_at > (select max(updated_at) from {{ this }})
-{% endif %}
\ No newline at end of file
+from final f
\ No newline at end of file
@@ -4,6 +4,12 @@
   )
 }}
 
+{% set grid_cell_meters = 15 %}
+
+-- Hole versions are matched pairwise within a course, but only for pairs sharing an id or whose tees
+-- or targets fall in the same or neighboring grid cells, since the distance rules below look no further
+-- than 10 meters. Matching versions are then grouped into connected components.
+
 with recursive course_hole_data_grouped as (
     select
         ch.course_id,
@@ -60,87 +66,159 @@ course_hole_data as (
     qualify row_number() over (partition by hole_version_hash order by max_scorecard_date desc) = 1
 ),
 
-hole_matching as (
-    -- Base case
-    select 
+hole_cells as (
+    -- Tee and target grid cells, projected around each course's average tee latitude
+    select
+        ch.course_id,
         ch.hole_version_hash,
-        ch.hole_version_hash as group_id,
-        0 as depth
-        
-    from course_hole_data ch
-    
-    union all
-    
-    -- Recursive case
+        {{ coordinates_to_grid_cell('ch.tee_latitude', 'ch.tee_longitude', 'ch.reference_latitude', grid_cell_meters) }} as tee_cell,
+        {{ coordinates_to_grid_cell('ch.target_latitude', 'ch.target_longitude', 'ch.reference_latitude', grid_cell_meters) }} as target_cell
+
+    from (
+        select *, avg(tee_latitude) over (partition by course_id) as reference_latitude
+        from course_hole_data
+    ) ch
+),
+
+neighbor_cells as (
+    -- Each hole's own cell and the eight cells around it
     select
-        ch2.hole_version_hash,
-        hm.group_id,
-        hm.depth + 1
-    
-    from hole_matching hm
-    join course_hole_data ch1 on hm.hole_version_hash = ch1.hole_version_hash
-    join course_hole_data ch2 on ch1.course_id = ch2.course_id
-        and ch1.hole_version_hash != ch2.hole_version_hash
-        and ch1.preference < ch2.preference
-        and (ch1.hole_id = ch2.hole_id
-            -- Holes share a direction and teepad id
-            or (ch1.hole_direction = ch2.hole_direction and ch1.tee_position_id = ch2.tee_position_id)
-            -- Holes share a direction and target id
-            or (ch1.hole_direction = ch2.hole_direction and ch1.target_position_id = ch2.target_position_id)
-            -- Holes share a direction and their tee coordinates within 5 meters apart
-            or (ch1.hole_direction = ch2.hole_direction
-                and {{ distance_meters('ch1.tee_latitude', 'ch1.tee_longitude', 'ch2.tee_latitude', 'ch2.tee_longitude') }} <= 5)
-            -- Holes share a direction and their target coordinates within 5 meters apart
-            or (ch1.hole_direction = ch2.hole_direction
-                and {{ distance_meters('ch1.target_latitude', 'ch1.target_longitude', 'ch2.target_latitude', 'ch2.target_longitude') }} <= 5)
-            -- Hole distance difference (meters) + Sum of squares of euclidean distance via lon-lat coordinates (meters) is within 10 meters
-            --      and they do not have different tee ids and different target ids
-            or (abs(ch1.hole_distance - ch2.hole_distance)
-                + sqrt(
-                    power(
-                        {{ distance_meters('ch1.tee_latitude', 'ch1.tee_longitude', 'ch2.tee_latitude', 'ch2.tee_longitude') }}
-                    , 2)
-                    + power(
-                        {{ distance_meters('ch1.target_latitude', 'ch1.target_longitude', 'ch2.target_latitude', 'ch2.target_longitude') }}
-                    , 2)
-                ) <= 10
-                and (ch1.tee_position_id = ch2.tee_position_id
-                    or ch1.target_position_id = ch2.target_position_id
-                    or greatest(ch1.tee_position_id, ch1.target_position_id,
-                        ch2.tee_position_id, ch2.target_position_id) is null)
-                )
-            -- Exception: Timmons hole 2
-            or (ch1.course_id = '2006'
-                and ch1.hole_number = 2
-                and ch2.hole_number = 2
-                )
-            -- Exception: Tyger River hole 1
-            or (ch1.course_id = '5519'
-                and ch1.hole_number = 1
-                and ch2.hole_number = 1
-                and ch1.tee_position_id = ch2.tee_position_id
-                )
-            -- Exception: Tyger River hole 18
-            or (ch1.course_id = '5519'
-                and ch1.hole_number = 18
-                and ch2.hole_number = 18
-                and ch1.target_position_id = ch2.target_position_id
-                )
+        hc.course_id,
+        hc.hole_version_hash,
+        [hc.tee_cell[1] + dy, hc.tee_cell[2] + dx] as tee_cell,
+        [hc.target_cell[1] + dy, hc.target_cell[2] + dx] as target_cell
+
+    from hole_cells hc,
+        unnest([-1, 0, 1]) as r(dy),
+        unnest([-1, 0, 1]) as c(dx)
+),
+
+candidate_pairs as (
+    -- Pairs that share an id
+    select ch1.hole_version_hash as hole_version_hash_1, ch2.hole_version_hash as hole_version_hash_2
+    from course_hole_data ch1
+    join course_hole_data ch2 on ch1.course_id = ch2.course_id and ch1.hole_id = ch2.hole_id
+
+    union
+
+    select ch1.hole_version_hash, ch2.hole_version_hash
+    from course_hole_data ch1
+    join course_hole_data ch2 on ch1.course_id = ch2.course_id and ch1.tee_position_id = ch2.tee_position_id
+
+    union
+
+    select ch1.hole_version_hash, ch2.hole_version_hash
+    from course_hole_data ch1
+    join course_hole_data ch2 on ch1.course_id = ch2.course_id and ch1.target_position_id = ch2.target_position_id
+
+    union
+
+    -- Pairs whose tees or targets are in the same or neighboring grid cells
+    select nc.hole_version_hash, hc.hole_version_hash
+    from neighbor_cells nc
+    join hole_cells hc on nc.course_id = hc.course_id and nc.tee_cell = hc.tee_cell
+
+    union
+
+    select nc.hole_version_hash, hc.hole_version_hash
+    from neighbor_cells nc
+    join hole_cells hc on nc.course_id = hc.course_id and nc.target_cell = hc.target_cell
+
+    union
+
+    -- Pairs covered by the course exceptions below
+    select ch1.hole_version_hash, ch2.hole_version_hash
+    from course_hole_data ch1
+    join course_hole_data ch2 on ch1.course_id = ch2.course_id and ch1.hole_number = ch2.hole_number
+    where (ch1.course_id = '2006' and ch1.hole_number = 2)
+        or (ch1.course_id = '5519' and ch1.hole_number in (1, 18))
+),
+
+hole_edges as materialized (
+    -- Candidate pairs that match, materialized so the recursive step below doesn't re-evaluate them
+    select
+        cp.hole_version_hash_1,
+        cp.hole_version_hash_2
+
+    from candidate_pairs cp
+    join course_hole_data ch1 on cp.hole_version_hash_1 = ch1.hole_version_hash
+    join course_hole_data ch2 on cp.hole_version_hash_2 = ch2.hole_version_hash
+    where cp.hole_version_hash_1 != cp.hole_version_hash_2
+    and (ch1.hole_id = ch2.hole_id
+        -- Holes share a direction and teepad id
+        or (ch1.hole_direction = ch2.hole_direction and ch1.tee_position_id = ch2.tee_position_id)
+        -- Holes share a direction and target id
+        or (ch1.hole_direction = ch2.hole_direction and ch1.target_position_id = ch2.target_position_id)
+        -- Holes share a direction and their tee coordinates within 5 meters apart
+        or (ch1.hole_direction = ch2.hole_direction
+            and {{ distance_meters('ch1.tee_latitude', 'ch1.tee_longitude', 'ch2.tee_latitude', 'ch2.tee_longitude') }} <= 5)
+        -- Holes share a direction and their target coordinates within 5 meters apart
+        or (ch1.hole_direction = ch2.hole_direction
+            and {{ distance_meters('ch1.target_latitude', 'ch1.target_longitude', 'ch2.target_latitude', 'ch2.target_longitude') }} <= 5)
+        -- Hole distance difference (meters) + Sum of squares of euclidean distance via lon-lat coordinates (meters) is within 10 meters
+        --      and they do not have different tee ids and different target ids
+        or (abs(ch1.hole_distance - ch2.hole_distance)
+            + sqrt(
+                power(
+                    {{ distance_meters('ch1.tee_latitude', 'ch1.tee_longitude', 'ch2.tee_latitude', 'ch2.tee_longitude') }}
+                , 2)
+                + power(
+                    {{ distance_meters('ch1.target_latitude', 'ch1.target_longitude', 'ch2.target_latitude', 'ch2.target_longitude') }}
+                , 2)
+            ) <= 10
+            and (ch1.tee_position_id = ch2.tee_position_id
+                or ch1.target_position_id = ch2.target_position_id
+                or greatest(ch1.tee_position_id, ch1.target_position_id,
+                    ch2.tee_position_id, ch2.target_position_id) is null)
+            )
+        -- Exception: Timmons hole 2
+        or (ch1.course_id = '2006'
+            and ch1.hole_number = 2
+            and ch2.hole_number = 2
+            )
+        -- Exception: Tyger River hole 1
+        or (ch1.course_id = '5519'
+            and ch1.hole_number = 1
+            and ch2.hole_number = 1
+            and ch1.tee_position_id = ch2.tee_position_id
+            )
+        -- Exception: Tyger River hole 18
+        or (ch1.course_id = '5519'
+            and ch1.hole_number = 18
+            and ch2.hole_number = 18
+            and ch1.target_position_id = ch2.target_position_id
             )
+        )
+),
+
+hole_components as (
+    -- Every hole version reachable from each hole version through matching pairs
+    select
+        ch.hole_version_hash,
+        ch.hole_version_hash as member_hash
+
+    from course_hole_data ch
 
-    where hm.depth < 3
+    union
+
+    select
+        hc.hole_version_hash,
+        he.hole_version_hash_2
+
+    from hole_components hc
+    join hole_edges he on hc.member_hash = he.hole_version_hash_1
 ),
 
 hole_groups as (
+    -- The most preferred hole version in each connected group names the group
     select
-        hm.hole_version_hash,
-        min_by(hm.group_id, ch.preference) as group_id,
-        min(ch.preference) as group_preference,
-        min_by(hm.depth, ch.preference) as depth
-    
-    from hole_matching hm
-    join course_hole_data ch on hm.group_id = ch.hole_version_hash
-    group by hm.hole_version_hash
+        hc.hole_version_hash,
+        min_by(hc.member_hash, ch.preference) as group_id,
+        min(ch.preference) as group_preference
+
+    from hole_components hc
+    join course_hole_data ch on hc.member_hash = ch.hole_version_hash
+    group by hc.hole_version_hash
 ),
 
 assign_hole_id as (
@@ -149,8 +227,7 @@ assign_hole_id as (
         coalesce(
             ch.hole_id,
             substring(md5(hg.hole_version_hash), 1, 8)
-        )as canonical_hole_id,
-        hg.depth
+        )as canonical_hole_id
     
     from hole_groups hg
     join course_hole_data ch on hg.group_id = ch.hole_version_hash
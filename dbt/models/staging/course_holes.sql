@@ -1,9 +1,15 @@
 {{
   config(
-    schema='staging'
+    materialized='incremental',
+    unique_key='scorecard_id',
+    schema='staging',
+    pre_hook="{{ delete_restaged_scorecards(ref('scorecards')) }}"
   )
 }}
 
+-- Incremental runs replace every row of each scorecard staged after this model's latest loaded_at; the pre_hook
+-- drops the old rows first, so a version that no longer has any (e.g. holes removed) doesn't keep them
+
 select
     scorecard_id,
     course_id,
@@ -15,50 +21,33 @@ select
     ordinality as hole_number,
 
     -- Hole level data
-    json_extract_string(hole, '$.holeId') as hole_id,
-    json_extract_string(hole, '$.name') as hole_name,
-    cast(json_extract(hole, '$.par') as integer) as hole_par,
-    cast(json_extract(hole, '$.distance') as double) as hole_distance,
-    cast(json_extract(hole, '$.customDistance') as double) as hole_distance_custom,
+    hole.holeId as hole_id,
+    hole.name as hole_name,
+    hole.par as hole_par,
+    hole.distance as hole_distance,
+    hole.customDistance as hole_distance_custom,
     
     -- Tee and basket information
-    json_extract_string(hole, '$.teePosition.teePositionId') as tee_position_id,
-    json_extract_string(hole, '$.teePosition.status') as tee_position_status,
-    coalesce(
-      cast(json_extract(hole, '$.teePosition.latitude') as double),
-      cast(json_extract(hole, '$.teePad.latitude') as double))
-    as tee_latitude,
-    coalesce(
-      cast(json_extract(hole, '$.teePosition.longitude') as double),
-      cast(json_extract(hole, '$.teePad.longitude') as double)
-    ) as tee_longitude,
-    json_extract_string(hole, '$.teePosition.teeType.teeType') as tee_type,
-    json_extract_string(hole, '$.targetPosition.targetPositionId') as target_position_id,
-    json_extract_string(hole, '$.targetPosition.status') as target_position_status,
-    coalesce(
-      cast(json_extract(hole, '$.targetPosition.latitude') as double),
-      cast(json_extract(hole, '$.basket.latitude') as double)
-    ) as target_latitude,
-    coalesce(
-      cast(json_extract(hole, '$.targetPosition.longitude') as double),
-      cast(json_extract(hole, '$.basket.longitude') as double)
-    ) as target_longitude,
-    json_extract_string(hole, '$.targetPosition.targetType.type') as target_type,
-    json_extract_string(hole, '$.targetPosition.targetType.basketModel.name') as basket_type,
-    json_extract_string(hole, '$.targetPosition.targetType.basketModel.manufacturer') as basket_manufacturer,
+    hole.teePosition.teePositionId as tee_position_id,
+    hole.teePosition.status as tee_position_status,
+    coalesce(hole.teePosition.latitude, hole.teePad.latitude) as tee_latitude,
+    coalesce(hole.teePosition.longitude, hole.teePad.longitude) as tee_longitude,
+    hole.teePosition.teeType.teeType as tee_type,
+    hole.targetPosition.targetPositionId as target_position_id,
+    hole.targetPosition.status as target_position_status,
+    coalesce(hole.targetPosition.latitude, hole.basket.latitude) as target_latitude,
+    coalesce(hole.targetPosition.longitude, hole.basket.longitude) as target_longitude,
+    hole.targetPosition.targetType.type as target_type,
+    hole.targetPosition.targetType.basketModel.name as basket_type,
+    hole.targetPosition.targetType.basketModel.manufacturer as basket_manufacturer,
 
     {{ bearing_degrees_to_cardinal_direction(
-        coordinates_to_bearing_degrees(
-            'coalesce(cast(json_extract(hole, \'$.teePosition.latitude\') as double), cast(json_extract(hole, \'$.teePad.latitude\') as double))',
-            'coalesce(cast(json_extract(hole, \'$.teePosition.longitude\') as double), cast(json_extract(hole, \'$.teePad.longitude\') as double))',
-            'coalesce(cast(json_extract(hole, \'$.targetPosition.latitude\') as double), cast(json_extract(hole, \'$.basket.latitude\') as double))',
-            'coalesce(cast(json_extract(hole, \'$.targetPosition.longitude\') as double), cast(json_extract(hole, \'$.basket.longitude\') as double))'
-        ),
+        coordinates_to_bearing_degrees('tee_latitude', 'tee_longitude', 'target_latitude', 'target_longitude'),
         8
     ) }} as hole_direction,
 
-    json_extract(hole, '$.doglegs') as doglegs,
-    json_array_length(json_extract(hole, '$.doglegs')) as dogleg_count,
+    hole.doglegs as doglegs,
+    len(hole.doglegs) as dogleg_count,
 
     md5(
         concat(
@@ -112,8 +101,12 @@ select
 
     start_date,
     created_at,
-    updated_at
+    updated_at,
+    loaded_at
     
 from {{ ref('scorecards') }},
-      unnest(json_extract(holes, '$')::json[]) with ordinality as t(hole, ordinality)
-where holes is not null
\ No newline at end of file
+      unnest(holes) with ordinality as t(hole, ordinality)
+where holes is not null
+{% if is_incremental() %}
+    and loaded_at > (select max(loaded_at) from {{ this }})
+{% endif %}
\ No newline at end of file
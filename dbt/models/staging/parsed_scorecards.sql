@@ -0,0 +1,63 @@
+{{
+  config(
+    materialized='incremental',
+    unique_key=['scorecard_id', 'user_name'],
+    schema='staging'
+  )
+}}
+
+-- Each raw scorecard document parsed once into a typed struct (see the scorecard_json_structure macro),
+-- so the staging models select struct fields instead of re-parsing the JSON text.
+-- Only the latest version of each user's copy of a scorecard is kept (scorecards aggregates across users' copies).
+-- Incremental runs parse the raw rows loaded after the latest loaded_at already parsed and replace the
+-- scorecards they touch, unless the copy already parsed is the newer version.
+
+with parsed as (
+    select
+        json_transform(r.raw_data, {{ scorecard_json_structure() }}) as scorecard,
+        r.user_name,
+        r.loaded_at
+
+    from {{ source('raw_udisc_scorecards', 'raw_udisc_scorecards') }} r
+    {% if is_incremental() %}
+    where r.loaded_at > (select max(loaded_at) from {{ this }})
+    {% endif %}
+),
+
+versions as (
+    select
+        p.scorecard.objectId as scorecard_id,
+        p.scorecard,
+        p.user_name,
+        p.loaded_at
+
+    from parsed p
+
+    {% if is_incremental() %}
+    union all
+
+    select
+        prev.scorecard_id,
+        prev.scorecard,
+        prev.user_name,
+        prev.loaded_at
+
+    from {{ this }} prev
+    where (prev.scorecard_id, prev.user_name) in (
+        select (p.scorecard.objectId, p.user_name)
+        from parsed p
+    )
+    {% endif %}
+)
+
+select
+    v.scorecard_id,
+    v.scorecard,
+    v.user_name,
+    v.loaded_at
+
+from versions v
+qualify row_number() over (
+    partition by v.scorecard_id, v.user_name
+    order by cast(v.scorecard.updatedAt as timestamp) desc, v.loaded_at desc
+) = 1
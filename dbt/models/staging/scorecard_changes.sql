@@ -0,0 +1,43 @@
+{{
+  config(
+    materialized='incremental',
+    unique_key='scorecard_id',
+    incremental_strategy='delete+insert',
+    schema='staging'
+  )
+}}
+
+-- One row per scorecard holding the version last processed by the incremental models.
+-- Each run stamps the scorecards that are new or changed since the previous run with its batch
+-- timestamp, compared per scorecard so late edits with old timestamps still count. Incremental
+-- models consume the rows stamped after their own watermark (see changes_watermark), so changes
+-- stamped by a run that didn't reach them are picked up by their next run.
+-- first_processed_at tells new scorecards apart from edits to ones processed before.
+
+with scorecard_versions as (
+    select
+        sc.scorecard_id,
+        greatest(sc.updated_at, max(se.entry_updated_at)) as updated_at
+
+    from {{ ref('scorecards') }} sc
+    left join {{ ref('scorecard_entries') }} se on sc.scorecard_id = se.scorecard_id
+    group by sc.scorecard_id, sc.updated_at
+)
+
+select
+    sv.scorecard_id,
+    sv.updated_at,
+    {{ batch_timestamp() }} as processed_at,
+    {% if is_incremental() %}
+    coalesce(prev.first_processed_at, {{ batch_timestamp() }}) as first_processed_at
+    {% else %}
+    {{ batch_timestamp() }} as first_processed_at
+    {% endif %}
+
+from scorecard_versions sv
+
+{% if is_incremental() %}
+left join {{ this }} prev on sv.scorecard_id = prev.scorecard_id
+where prev.scorecard_id is null
+    or sv.updated_at > prev.updated_at
+{% endif %}
@@ -1,9 +1,15 @@
 {{
   config(
-    schema='staging'
+    materialized='incremental',
+    unique_key='scorecard_id',
+    schema='staging',
+    pre_hook="{{ delete_restaged_scorecards(ref('scorecards')) }}"
   )
 }}
 
+-- Incremental runs replace every row of each scorecard staged after this model's latest loaded_at; the pre_hook
+-- drops the old rows first, so a version that no longer has any (e.g. entries removed) doesn't keep them
+
 with entries_flattened as (
     select
         sc.scorecard_id,
@@ -12,37 +18,41 @@ with entries_flattened as (
         sc.start_date,
         sc.created_at,
         sc.updated_at,
+        sc.loaded_at,
         
         -- Entry level data
-        json_extract_string(entry, '$.objectId') as entry_id,
-        timezone('America/New_York', cast(json_extract_string(entry, '$.createdAt') as timestamp)) as entry_created_at,
-        timezone('America/New_York', cast(json_extract_string(entry, '$.updatedAt') as timestamp)) as entry_updated_at,
-        cast(json_extract(entry, '$.includeInHandicaps') as boolean) as include_in_handicaps,
-        cast(json_extract(entry, '$.includeInProfile') as boolean) as include_in_profile,
-        cast(json_extract(entry, '$.startingScore') as integer) as starting_score,
-        cast(json_extract(entry, '$.roundRating') as double) as round_rating_udisc,
+        entry.objectId as entry_id,
+        timezone('America/New_York', cast(entry.createdAt as timestamp)) as entry_created_at,
+        timezone('America/New_York', cast(entry.updatedAt as timestamp)) as entry_updated_at,
+        entry.includeInHandicaps as include_in_handicaps,
+        entry.includeInProfile as include_in_profile,
+        entry.startingScore as starting_score,
+        entry.roundRating as round_rating_udisc,
         
-        -- Raw arrays for further processing
-        json_extract(entry, '$.players') as players,
-        json_extract(entry, '$.users') as users,
-        json_extract(entry, '$.holeScores') as hole_scores
+        -- Lists for further processing
+        entry.players as players,
+        entry.users as users,
+        entry.holeScores as hole_scores
         
     from {{ ref('scorecards') }} sc,
-         unnest(json_extract(sc.entries, '$')::json[]) as t(entry)
+         unnest(sc.entries) as t(entry)
     where entries is not null
+    {% if is_incremental() %}
+        and sc.loaded_at > (select max(loaded_at) from {{ this }})
+    {% endif %}
 ),
 
 hole_scores_flattened as (
     select
         ef.scorecard_id,
         ef.entry_id,
-        cast(json_extract(hole_score, '$.strokes') as integer) as hole_strokes,
-        cast(json_extract(hole_score, '$.changeVersion') as integer) as hole_score_change_version,
-        json_extract(hole_score, '$.holeThrows') as hole_throws,
+        hole_score.strokes as hole_strokes,
+        hole_score.changeVersion as hole_score_change_version,
+        hole_score.holeThrows as hole_throws,
         row_number() over (partition by entry_id order by ordinality) as hole_number
         
     from entries_flattened ef,
-         unnest(json_extract(ef.hole_scores, '$')::json[]) with ordinality as t(hole_score, ordinality)
+         unnest(ef.hole_scores) with ordinality as t(hole_score, ordinality)
     where hole_scores is not null
 ),
 
@@ -50,19 +60,19 @@ players_flattened as (
     select
         ef.scorecard_id,
         ef.entry_id,
-        json_extract_string(player, '$.objectId') as player_id,
+        player.objectId as player_id,
         null as player_full_name,
         null as player_first_name,
         null as player_last_name,
-        json_extract_string(player, '$.name') as player_display_name,
+        player.name as player_display_name,
         null as player_username,
         false as player_is_udisc_user,
-        coalesce(cast(json_extract(player, '$.isDeleted') as boolean), false) as player_is_deleted,
-        timezone('America/New_York', cast(json_extract_string(player, '$.createdAt') as timestamp)) as player_created_at,
-        timezone('America/New_York', cast(json_extract_string(player, '$.updatedAt') as timestamp)) as player_updated_at
+        coalesce(player.isDeleted, false) as player_is_deleted,
+        timezone('America/New_York', cast(player.createdAt as timestamp)) as player_created_at,
+        timezone('America/New_York', cast(player.updatedAt as timestamp)) as player_updated_at
         
     from entries_flattened ef,
-         unnest(json_extract(ef.players, '$')::json[]) as t(player)
+         unnest(ef.players) as t(player)
     where hole_scores is not null
 
     union all
@@ -70,19 +80,19 @@ players_flattened as (
     select
         ef.scorecard_id,
         ef.entry_id,
-        json_extract_string(user, '$.objectId') as player_id,
-        coalesce(json_extract_string(user, '$.fullName'), json_extract_string(user, '$.name')) as player_full_name,
+        user.objectId as player_id,
+        coalesce(user.fullName, user.name) as player_full_name,
         split_part(player_full_name, ' ', 1) as player_first_name,
         split_part(player_full_name, ' ', 2) as player_last_name,
-        json_extract_string(user, '$.name') as player_display_name,
-        json_extract_string(user, '$.username') as player_username,
+        user.name as player_display_name,
+        user.username as player_username,
         true as player_is_udisc_user,
         false as player_is_deleted,
-        timezone('America/New_York', cast(json_extract_string(user, '$.createdAt') as timestamp)) as player_created_at,
-        timezone('America/New_York', cast(json_extract_string(user, '$.updatedAt') as timestamp)) as player_updated_at
+        timezone('America/New_York', cast(user.createdAt as timestamp)) as player_created_at,
+        timezone('America/New_York', cast(user.updatedAt as timestamp)) as player_updated_at
         
     from entries_flattened ef,
-         unnest(json_extract(ef.users, '$')::json[]) as t(user)
+         unnest(ef.users) as t(user)
     where hole_scores is not null
 ),
 
@@ -117,7 +127,8 @@ final as (
         ef.created_by_user_id,
         ef.start_date,
         ef.created_at,
-        ef.updated_at
+        ef.updated_at,
+        ef.loaded_at
         
     from entries_flattened ef
     left join hole_scores_flattened hsc on ef.scorecard_id = hsc.scorecard_id
@@ -1,54 +1,74 @@
 {{
   config(
+    materialized='incremental',
+    unique_key='scorecard_id',
     schema='staging'
   )
 }}
 
+-- Incremental runs only read parsed rows loaded after the latest loaded_at already staged
+
 with grouped_scorecards as (
     select
-        json_extract_string(raw_data, '$.objectId') as scorecard_id,
+        sc.scorecard_id,
         
-        json_extract_string(raw_data, '$.courseId') as course_id,
-        trim(json_extract_string(raw_data, '$.courseName')) as course_name,
-        json_extract_string(raw_data, '$.layoutId') as layout_id,
-        trim(json_extract_string(raw_data, '$.layoutName')) as layout_name,
-        json_extract_string(raw_data, '$.courseName') || ' - ' || trim(json_extract_string(raw_data, '$.layoutName')) as layout_full_name,
-
-        timezone('America/New_York', cast(json_extract_string(raw_data, '$.startDate.iso') as timestamp)) as start_date,
-        timezone('America/New_York', cast(json_extract_string(raw_data, '$.endDate.iso') as timestamp)) as end_date,
-        json_extract_string(raw_data, '$.playFormat') as play_format,
-        cast(json_extract(raw_data, '$.startingHoleIndex') as integer) as starting_hole_index,
-
-        max(cast(json_extract(raw_data, '$.stepCount') as integer)) as step_count,
-        max(cast(json_extract(raw_data, '$.floorsAscended') as integer)) as floors_ascended,
-        max(cast(json_extract(raw_data, '$.floorsDescended') as integer)) as floors_descended,
-        max(cast(json_extract(raw_data, '$.distance') as double)) as total_distance,
-
-        json_extract_string(raw_data, '$.difficulty') as difficulty,
-        json_extract_string(raw_data, '$.customName') as custom_name,
-        cast(json_extract(raw_data, '$.usesValidSmartLayout') as boolean) as uses_valid_smart_layout,
-
-        json_extract(raw_data, '$.weather') as weather,
-        json_extract(raw_data, '$.entries') as entries,
-        json_extract(raw_data, '$.holes') as holes,
-        json_array_length(json_extract(raw_data, '$.holes')) as hole_count,
-
-        cast(json_extract(raw_data, '$.version') as integer) as version,
-        max(json_extract_string(raw_data, '$.notes')) as notes,
-        cast(json_extract(raw_data, '$.isFinished') as boolean) as is_finished,
-        cast(json_extract(raw_data, '$.isSimpleScoring') as boolean) as is_simple_scoring,
-        coalesce(cast(json_extract(raw_data, '$.isPublic') as boolean), true) as is_public,
-        coalesce(cast(json_extract(raw_data, '$.isDeleted') as boolean), false) as is_deleted,
-        timezone('America/New_York', cast(json_extract_string(raw_data, '$.createdAt') as timestamp)) as created_at,
-        timezone('America/New_York', cast(json_extract_string(raw_data, '$.updatedAt') as timestamp)) as updated_at,
-        json_extract_string(raw_data, '$.createdBy.objectId') as created_by_user_id,
-        min(r.loaded_at) as loaded_at
+        sc.scorecard.courseId as course_id,
+        trim(sc.scorecard.courseName) as course_name,
+        sc.scorecard.layoutId as layout_id,
+        trim(sc.scorecard.layoutName) as layout_name,
+        sc.scorecard.courseName || ' - ' || trim(sc.scorecard.layoutName) as layout_full_name,
+
+        timezone('America/New_York', cast(sc.scorecard.startDate.iso as timestamp)) as start_date,
+        timezone('America/New_York', cast(sc.scorecard.endDate.iso as timestamp)) as end_date,
+        sc.scorecard.playFormat as play_format,
+        sc.scorecard.startingHoleIndex as starting_hole_index,
+
+        max(sc.scorecard.stepCount) as step_count,
+        max(sc.scorecard.floorsAscended) as floors_ascended,
+        max(sc.scorecard.floorsDescended) as floors_descended,
+        max(sc.scorecard.distance) as total_distance,
+
+        sc.scorecard.difficulty as difficulty,
+        sc.scorecard.customName as custom_name,
+        sc.scorecard.usesValidSmartLayout as uses_valid_smart_layout,
+
+        sc.scorecard.weather as weather,
+        sc.scorecard.entries as entries,
+        sc.scorecard.holes as holes,
+        len(sc.scorecard.holes) as hole_count,
+
+        sc.scorecard.version as version,
+        max(sc.scorecard.notes) as notes,
+        sc.scorecard.isFinished as is_finished,
+        sc.scorecard.isSimpleScoring as is_simple_scoring,
+        coalesce(sc.scorecard.isPublic, true) as is_public,
+        coalesce(sc.scorecard.isDeleted, false) as is_deleted,
+        timezone('America/New_York', cast(sc.scorecard.createdAt as timestamp)) as created_at,
+        timezone('America/New_York', cast(sc.scorecard.updatedAt as timestamp)) as updated_at,
+        sc.scorecard.createdBy.objectId as created_by_user_id,
+        max(sc.loaded_at) as loaded_at
         
-    from {{ source('raw_udisc_scorecards', 'raw_udisc_scorecards') }} r
+    from {{ ref('parsed_scorecards') }} sc
+    {% if is_incremental() %}
+    where sc.loaded_at > (select max(loaded_at) from {{ this }})
+    {% endif %}
     
     group by all
+),
+
+latest_scorecards as (
+    select *
+    from grouped_scorecards
+    -- Keep the latest version of each scorecard so late edits flow through to the incremental models
+    qualify row_number() over (partition by scorecard_id order by updated_at desc, loaded_at desc) = 1
 )
 
-select *
-from grouped_scorecards
-qualify row_number() over (partition by scorecard_id order by loaded_at) = 1
\ No newline at end of file
+select lsc.*
+from latest_scorecards lsc
+
+{% if is_incremental() %}
+-- Re-loading an older version of a scorecard shouldn't replace the newer one already staged
+left join {{ this }} prev on lsc.scorecard_id = prev.scorecard_id
+where prev.scorecard_id is null
+    or lsc.updated_at >= prev.updated_at
+{% endif %}
\ No newline at end of file
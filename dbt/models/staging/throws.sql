@@ -1,23 +1,33 @@
 {{
   config(
-    schema='staging'
+    materialized='incremental',
+    unique_key='scorecard_id',
+    schema='staging',
+    pre_hook="{{ delete_restaged_scorecards(ref('scorecard_entries')) }}"
   )
 }}
 
+-- Incremental runs replace every row of each scorecard staged after this model's latest loaded_at; the pre_hook
+-- drops the old rows first, so a version that no longer has any (e.g. throws removed) doesn't keep them
+
 with throws_flattened as (
     select
         se.scorecard_id,
         se.entry_id,
         se.hole_number,
-        json_extract_string(throw, '$.landingZone') as landing_zone,
-        cast(json_extract(throw, '$.distance') as double) as throw_distance,
+        throw.landingZone as landing_zone,
+        throw.distance as throw_distance,
         ordinality as throw_number,
         se.created_at,
-        se.updated_at
+        se.updated_at,
+        se.loaded_at
         
     from {{ ref('scorecard_entries') }} se,
-         unnest(json_extract(se.hole_throws, '$')::json[]) with ordinality as t(throw, ordinality)
+         unnest(se.hole_throws) with ordinality as t(throw, ordinality)
     where hole_throws is not null
+    {% if is_incremental() %}
+        and se.loaded_at > (select max(loaded_at) from {{ this }})
+    {% endif %}
 )
 
 select
@@ -28,6 +38,7 @@ select
     landing_zone,
     throw_distance,
     created_at,
-    updated_at
+    updated_at,
+    loaded_at
     
 from throws_flattened
\ No newline at end of file
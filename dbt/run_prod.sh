@@ -12,12 +12,22 @@ echo "📊 Running dbt models in production (${LOAD_TYPE} mode)..."
 
 if [ "$LOAD_TYPE" = "full" ]; then
     dbt run --target prod --full-refresh
+    DBT_STATUS=$?
     echo "🔄 Full refresh mode enabled"
 else
     dbt run --target prod
+    DBT_STATUS=$?
     echo "📈 Incremental mode enabled"
 fi
 
+# Publish a read-only warehouse snapshot for the dashboard, only if dbt succeeded
+if [ $DBT_STATUS -eq 0 ]; then
+    echo "📸 Publishing warehouse snapshot..."
+    DATA_DIR=${DATA_DIR:-../etl/data} python ../etl/airflow/lib/publish_snapshot.py
+else
+    echo "⚠️ dbt run failed - keeping the current dashboard snapshot"
+fi
+
 # Run tests to ensure data quality
 echo "🧪 Running data tests..."
 dbt test --target prod
@@ -6,10 +6,10 @@ from datetime import datetime
 from airflow import DAG
 from airflow.operators.python import PythonOperator
 from airflow.utils.email import send_email
-from lib.user_manager import get_user_manager
-from lib.load_to_duckdb import load_to_duckdb
-from lib.write_to_parquet import write_all_scorecards
-from lib.fetch_scorecards import fetch_all_scorecards
+
+# Pipeline modules (lib.*) are imported inside the task callables rather than here:
+# the scheduler re-parses this file every loop, and importing them pulls in boto3,
+# duckdb and pandas that only the running tasks need.
 
 
 # Check if email is configured
@@ -45,6 +45,10 @@ dag = DAG(
 
 def fetch_and_write_scorecards_task(**context):
     """Fetch scorecard data from UDisc API and write to Parquet files"""
+    from lib.user_manager import get_user_manager
+    from lib.write_to_parquet import write_all_scorecards
+    from lib.fetch_scorecards import fetch_all_scorecards
+
     try:
         # Get user summary for logging
         user_manager = get_user_manager()
@@ -57,17 +61,23 @@ def fetch_and_write_scorecards_task(**context):
 
         print("Fetching data from UDisc API")
 
-        # Fetch scorecards for all configured users
-        scorecards_data = fetch_all_scorecards()
+        # Fetch scorecards for all configured users - users whose login failed are skipped
+        scorecards_data, login_report = fetch_all_scorecards()
 
         print(
             f"Successfully fetched scorecards from API: {list(scorecards_data.keys())}")
 
         # Write scorecards to Parquet files
-        results = write_all_scorecards(scorecards_data)
-        print(f"Successfully wrote scorecards to Parquet files: {results}")
+        files = write_all_scorecards(scorecards_data)
+        print(f"Successfully wrote scorecards to Parquet files: {files}")
 
-        return results
+        # Report failed logins with the results, so the success email surfaces the partial failure
+        failed_logins = {name: result.error for name, result in login_report.items()
+                         if not result.success}
+        if failed_logins:
+            print(f"Warning: Skipped users whose login failed: {failed_logins}")
+
+        return {'files': files, 'failed_logins': failed_logins}
     except Exception as e:
         print(f"Error in fetch and write task: {e}")
         raise e
@@ -75,6 +85,8 @@ def fetch_and_write_scorecards_task(**context):
 
 def load_to_duckdb_task(**context):
     """Load scorecard data from Parquet files to DuckDB"""
+    from lib.load_to_duckdb import load_to_duckdb
+
     try:
         # Load data to DuckDB
         result = load_to_duckdb()
@@ -133,6 +145,19 @@ def run_dbt_models_task(**context):
         raise e
 
 
+def publish_snapshot_task(**context):
+    """Publish a read-only warehouse snapshot for the dashboard"""
+    from lib.publish_snapshot import publish_snapshot
+
+    try:
+        result = publish_snapshot()
+        print(f"Successfully published warehouse snapshot: {result}")
+        return result
+    except Exception as e:
+        print(f"Error publishing warehouse snapshot: {e}")
+        raise e
+
+
 def notify_success(**context):
     """Send success notification email"""
     if not EMAIL_ENABLED:
@@ -147,6 +172,16 @@ def notify_success(**context):
 
         subject = "Disc Golf ETL Pipeline - Success"
 
+        # Users skipped because their login failed
+        failed_logins = (write_results or {}).get('failed_logins') or {}
+        failed_logins_summary = ""
+        if failed_logins:
+            subject += f" ({len(failed_logins)} users failed to login)"
+            failed_logins_summary = "<p><strong>Failed Logins (not fetched):</strong><br>"
+            for user_name, error in failed_logins.items():
+                failed_logins_summary += f"• {user_name}: {error}<br>"
+            failed_logins_summary += "</p>"
+
         # Format DuckDB results nicely
         duckdb_summary = ""
         if duckdb_results:
@@ -158,7 +193,8 @@ def notify_success(**context):
 
         html_content = f"""
         <h2>Disc Golf ETL Pipeline Completed Successfully</h2>
-        <p><strong>Parquet Files Written:</strong> {write_results}</p>
+        <p><strong>Parquet Files Written:</strong> {(write_results or {}).get('files')}</p>
+        {failed_logins_summary}
         <p><strong>Loaded to DuckDB:</strong><br>{duckdb_summary}</p>
         <p><strong>dbt Models:</strong> {dbt_results}</p>
         <p><strong>Execution Date:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
@@ -228,6 +264,12 @@ dbt_models_task = PythonOperator(
     dag=dag,
 )
 
+publish_task = PythonOperator(
+    task_id='publish_snapshot',
+    python_callable=publish_snapshot_task,
+    dag=dag,
+)
+
 email_success = PythonOperator(
     task_id='notify_success',
     python_callable=notify_success,
@@ -243,7 +285,8 @@ email_failure = PythonOperator(
 )
 
 # Define task dependencies
-fetch_and_write_task >> load_task >> dbt_models_task >> email_success
+fetch_and_write_task >> load_task >> dbt_models_task >> publish_task >> email_success
 fetch_and_write_task >> email_failure
 load_task >> email_failure
 dbt_models_task >> email_failure
+publish_task >> email_failure
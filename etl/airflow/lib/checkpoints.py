@@ -0,0 +1,103 @@
+"""
+Per-user fetch checkpoints so an interrupted scorecard fetch can resume where it stopped.
+
+Each fetched page is written to a Parquet part file under the user's data directory,
+and checkpoint.json records the parts written so far plus the updatedAt cursor of the
+last committed page. A retried fetch reloads the parts and continues from the cursor.
+"""
+
+import os
+import json
+import shutil
+import pandas as pd
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+def get_checkpoint_directory(user_name: str) -> Path:
+    """Get the directory holding a user's checkpoint and part files."""
+    # Use /opt/airflow/data which is mounted from ./data (overridable via DATA_DIR)
+    return Path(os.getenv('DATA_DIR', '/opt/airflow/data')) / user_name.lower() / 'checkpoint'
+
+
+def new_checkpoint() -> Dict[str, Any]:
+    """Create an empty checkpoint for a fetch starting from scratch."""
+    return {
+        'cursor': None,
+        'parts': [],
+        'complete': False,
+        'started_at': datetime.now().isoformat(),
+        'updated_at': None,
+    }
+
+
+def load_checkpoint(user_name: str) -> Optional[Dict[str, Any]]:
+    """Load a user's checkpoint, or None if there is nothing to resume."""
+    checkpoint_path = get_checkpoint_directory(user_name) / 'checkpoint.json'
+    if not checkpoint_path.exists():
+        return None
+
+    try:
+        return json.loads(checkpoint_path.read_text())
+    except (json.JSONDecodeError, OSError) as e:
+        print(f"Warning: Ignoring unreadable checkpoint for {user_name}: {e}")
+        return None
+
+
+def load_checkpoint_scorecards(user_name: str, checkpoint: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Read back the scorecards stored in a checkpoint's part files."""
+    checkpoint_dir = get_checkpoint_directory(user_name)
+    scorecards = []
+    for part in checkpoint['parts']:
+        df = pd.read_parquet(checkpoint_dir / part, columns=['raw_data'])
+        scorecards.extend(json.loads(raw) for raw in df['raw_data'])
+    return scorecards
+
+
+def _write_checkpoint(user_name: str, checkpoint: Dict[str, Any]):
+    """Atomically replace checkpoint.json so a crash never leaves it half-written."""
+    checkpoint_dir = get_checkpoint_directory(user_name)
+    tmp_path = checkpoint_dir / 'checkpoint.json.tmp'
+    tmp_path.write_text(json.dumps(checkpoint))
+    os.replace(tmp_path, checkpoint_dir / 'checkpoint.json')
+
+
+def save_checkpoint_page(user_name: str, scorecards: List[Dict[str, Any]],
+                         checkpoint: Dict[str, Any]) -> Dict[str, Any]:
+    """Write one fetched page to a part file, then commit a checkpoint that includes it."""
+    checkpoint_dir = get_checkpoint_directory(user_name)
+    checkpoint_dir.mkdir(parents=True, exist_ok=True)
+
+    # A part left over from a crash before its checkpoint commit gets overwritten here
+    part_name = f"part_{len(checkpoint['parts']):05d}.parquet"
+    pd.DataFrame({
+        'raw_data': [json.dumps(scorecard) for scorecard in scorecards]
+    }).to_parquet(checkpoint_dir / part_name, engine='pyarrow', index=False)
+
+    cursor = scorecards[-1].get('updatedAt') if scorecards else None
+    checkpoint = {
+        **checkpoint,
+        'cursor': cursor or checkpoint['cursor'],
+        'parts': checkpoint['parts'] + [part_name],
+        'updated_at': datetime.now().isoformat(),
+    }
+    _write_checkpoint(user_name, checkpoint)
+    return checkpoint
+
+
+def mark_checkpoint_complete(user_name: str) -> Optional[Dict[str, Any]]:
+    """Record that the checkpointed scorecards were written, so the checkpoint is never resumed."""
+    checkpoint = load_checkpoint(user_name)
+    if checkpoint is None:
+        return None
+
+    checkpoint = {**checkpoint, 'complete': True,
+                  'updated_at': datetime.now().isoformat()}
+    _write_checkpoint(user_name, checkpoint)
+    return checkpoint
+
+
+def clear_checkpoint(user_name: str):
+    """Remove a user's checkpoint once their scorecards are safely written."""
+    shutil.rmtree(get_checkpoint_directory(user_name), ignore_errors=True)
@@ -6,7 +6,14 @@ import os
 import sys
 import json
 import api
-from user_manager import get_user_manager, User, login_user
+from user_manager import get_user_manager, User, login_user, login_all
+from checkpoints import (
+    new_checkpoint,
+    load_checkpoint,
+    load_checkpoint_scorecards,
+    save_checkpoint_page,
+    clear_checkpoint,
+)
 from concurrent.futures import ThreadPoolExecutor
 
 
@@ -16,13 +23,27 @@ def fetch_scorecards(user: User):
         raise ValueError(
             f"Missing username or password for {user.display_name}")
 
-    # Login to get fresh API token
-    if not login_user(user):
+    # Login to get fresh API token, unless login_all already warmed one
+    if not user.api_token and not login_user(user):
         raise ValueError(f"Failed to login {user.display_name}")
 
     all_scorecards = []
     skip = 0
 
+    # Resume from the last committed page of an interrupted fetch, if there is one. The checkpoint
+    # is only marked complete once its scorecards are written, so a complete one is left over
+    # from a run that stopped while clearing it, and the fetch starts fresh
+    checkpoint = load_checkpoint(user.name)
+    if checkpoint and checkpoint['complete']:
+        clear_checkpoint(user.name)
+        checkpoint = None
+    checkpoint = checkpoint or new_checkpoint()
+    if checkpoint['parts']:
+        all_scorecards = load_checkpoint_scorecards(user.name, checkpoint)
+        print(
+            f"  Resuming {user.display_name} from checkpoint: {len(all_scorecards)} scorecards, cursor {checkpoint['cursor']}")
+    resume_cursor = checkpoint['cursor']
+
     # Check if we're doing incremental loading
     load_type = os.getenv('LOAD_TYPE', 'full').lower()
     latest_snowflake_timestamp = None
@@ -64,6 +85,9 @@ def fetch_scorecards(user: User):
                         "$gt": 0,
                         "$lt": 4
                     },
+                    # $gte so scorecards sharing the cursor's timestamp aren't lost; dupes are dropped below
+                    **({"updatedAt": {"$gte": {"__type": "Date", "iso": resume_cursor}}}
+                       if resume_cursor else {}),
                 }),
                 "order": "updatedAt",
                 "include": "createdBy,entries,entries.users,entries.players",
@@ -76,6 +100,9 @@ def fetch_scorecards(user: User):
         if response.ok:
             scorecards = response.json()["results"]
             all_scorecards.extend(scorecards)
+            if scorecards:
+                checkpoint = save_checkpoint_page(
+                    user.name, scorecards, checkpoint)
 
             # Check if we should stop pagination
             if len(scorecards) < 50:
@@ -92,16 +119,33 @@ def fetch_scorecards(user: User):
 
             skip += 50
         else:
-            print("Failed to fetch results:", response.status_code,
-                  response.text, file=sys.stderr)
-            break
+            # Leave the checkpoint incomplete so a retry resumes from the last committed page
+            raise RuntimeError(
+                f"Failed to fetch results for {user.display_name}: {response.status_code} {response.text}")
 
+    all_scorecards = _dedupe_scorecards(all_scorecards)
     print(f"{user.display_name}: Fetched {len(all_scorecards)} scorecards from API.")
     return all_scorecards
 
 
+def _dedupe_scorecards(scorecards):
+    """Drop repeated scorecards (from resuming at an inclusive cursor), keeping the latest copy."""
+    by_id = {}
+    for scorecard in scorecards:
+        by_id[scorecard.get('objectId')] = scorecard
+    return list(by_id.values())
+
+
 def fetch_all_scorecards(user_names=None):
-    """Fetch scorecards for all users using concurrent processing"""
+    """
+    Fetch scorecards for all users who log in, using concurrent processing.
+
+    A failed login skips that user instead of aborting everyone else's fetch.
+
+    Returns:
+        tuple: (scorecards_by_user, login_report) - login_report maps each user's name to
+            their LoginResult, so callers can surface partial failures
+    """
     user_manager = get_user_manager()
 
     if user_names is None:
@@ -112,7 +156,20 @@ def fetch_all_scorecards(user_names=None):
 
     if not users:
         print("No users to fetch scorecards for")
-        return {}
+        return {}, {}
+
+    # Log everyone in up front, then fetch only the users whose login succeeded
+    login_report = login_all(users)
+    failed_logins = [result for result in login_report.values()
+                     if not result.success]
+    if failed_logins:
+        details = ", ".join(
+            f"{result.user_name} ({result.error})" for result in failed_logins)
+        print(f"Warning: Failed to login {len(failed_logins)} users, skipping them: {details}")
+
+    users = [user for user in users if login_report[user.name].success]
+    if not users:
+        raise ValueError(f"Failed to login all {len(login_report)} users")
 
     print(f"Fetching scorecards for {len(users)} users...")
 
@@ -134,7 +191,7 @@ def fetch_all_scorecards(user_names=None):
     print(f"Retrieved scorecards for {len(scorecards_by_user)} users from API")
     print(
         f"Returning data structure: {type(scorecards_by_user)} with keys: {list(scorecards_by_user.keys()) if isinstance(scorecards_by_user, dict) else 'Not a dict'}")
-    return scorecards_by_user
+    return scorecards_by_user, login_report
 
 
 if __name__ == "__main__":
@@ -10,18 +10,22 @@ from datetime import datetime
 from typing import Optional
 
 
+# Directories under the data directory that aren't per-user scorecard directories
+SNAPSHOTS_DIRECTORY = 'snapshots'
+NON_USER_DIRECTORIES = {'__pycache__', SNAPSHOTS_DIRECTORY}
+
+
 def get_duckdb_path():
     """Get the path to the DuckDB database file."""
-    # Use /opt/airflow/data which is mounted from ./data
-    db_path = Path('/opt/airflow/data') / 'warehouse.duckdb'
+    db_path = get_data_directory() / 'warehouse.duckdb'
     db_path.parent.mkdir(parents=True, exist_ok=True)
     return str(db_path)
 
 
 def get_data_directory():
     """Get the path to the data directory containing Parquet files."""
-    # Use /opt/airflow/data which is mounted from ./data
-    return Path('/opt/airflow/data')
+    # Use /opt/airflow/data which is mounted from ./data (overridable via DATA_DIR)
+    return Path(os.getenv('DATA_DIR', '/opt/airflow/data'))
 
 
 def create_scorecards_table(conn):
@@ -53,7 +57,7 @@ def load_latest_scorecards():
 
         # Find all user directories
         user_dirs = [d for d in data_dir.iterdir() if d.is_dir()
-                     and d.name != '__pycache__']
+                     and d.name not in NON_USER_DIRECTORIES]
 
         if not user_dirs:
             print("No user directories found in data folder")
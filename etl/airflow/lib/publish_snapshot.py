@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Publish an immutable, read-only snapshot of the DuckDB warehouse for the dashboard.
+
+After dbt succeeds, the warehouse is checkpointed and copied to a new versioned file in
+snapshots/, and the snapshots/CURRENT pointer is atomically replaced with its name. The
+dashboard only ever opens published snapshots, so it never contends with the ETL writer.
+"""
+
+import os
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+
+import duckdb
+
+from load_to_duckdb import SNAPSHOTS_DIRECTORY, get_data_directory, get_duckdb_path
+
+
+CURRENT_POINTER = 'CURRENT'
+
+
+def get_snapshots_directory():
+    """Get the path to the directory of published warehouse snapshots."""
+    snapshots_dir = get_data_directory() / SNAPSHOTS_DIRECTORY
+    snapshots_dir.mkdir(parents=True, exist_ok=True)
+    return snapshots_dir
+
+
+def _write_atomic(path, content):
+    """Write a small file by renaming a synced temp file over it, so readers see old or new content."""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, 'w') as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def prune_snapshots(snapshots_dir, current_name, retain):
+    """
+    Delete all but the newest published snapshots.
+
+    Dashboards still reading a deleted snapshot keep their open file until they swap to the current one.
+
+    Args:
+        snapshots_dir: Snapshots directory
+        current_name: File name of the current snapshot (never deleted)
+        retain: Number of snapshots to keep, including the current one
+    """
+    snapshots = sorted(snapshots_dir.glob('warehouse_*.duckdb'), reverse=True)
+    for snapshot in snapshots[retain:]:
+        if snapshot.name != current_name:
+            snapshot.unlink()
+            print(f"  - Removed old snapshot {snapshot.name}")
+
+
+def publish_snapshot():
+    """
+    Publish the warehouse as a new snapshot and point CURRENT at it.
+
+    Returns:
+        dict: Snapshot name, path and size
+    """
+    warehouse_path = Path(get_duckdb_path())
+    snapshots_dir = get_snapshots_directory()
+    retain = max(int(os.getenv('SNAPSHOT_RETAIN', '3')), 1)
+
+    print(f"Publishing warehouse snapshot from {warehouse_path}...")
+
+    # Fold the WAL into the database file so the copy is complete on its own
+    conn = duckdb.connect(str(warehouse_path))
+    try:
+        conn.execute("CHECKPOINT")
+    finally:
+        conn.close()
+
+    # Copy under a temp name, then rename - a snapshot file is never seen half written
+    version = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%fZ')
+    snapshot_name = f"warehouse_{version}.duckdb"
+    snapshot_path = snapshots_dir / snapshot_name
+    tmp_path = snapshots_dir / f".{snapshot_name}.tmp"
+
+    shutil.copyfile(warehouse_path, tmp_path)
+    with open(tmp_path, 'rb') as f:
+        os.fsync(f.fileno())
+    os.chmod(tmp_path, 0o444)
+    os.replace(tmp_path, snapshot_path)
+
+    # Swap the pointer - dashboards pick up the new snapshot on their next query
+    _write_atomic(snapshots_dir / CURRENT_POINTER, snapshot_name + '\n')
+    print(f"Published snapshot {snapshot_name}")
+
+    prune_snapshots(snapshots_dir, snapshot_name, retain)
+
+    return {
+        'snapshot': snapshot_name,
+        'path': str(snapshot_path),
+        'size_bytes': snapshot_path.stat().st_size,
+    }
+
+
+if __name__ == "__main__":
+    publish_snapshot()
@@ -1,13 +1,18 @@
 #!/usr/bin/env python3
 """
 AWS Secrets Manager integration for retrieving user credentials.
-This module handles fetching usernames and passwords from AWS Secrets Manager.
+This module handles fetching usernames and passwords from AWS Secrets Manager,
+or from a local JSON file standing in for it in tests and benchmarks.
 """
 
 import os
 import json
+import time
+import threading
 import boto3
-from typing import Dict, List, Optional
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 from botocore.exceptions import ClientError, NoCredentialsError
 from dotenv import load_dotenv
 
@@ -15,16 +20,58 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-class SecretsManager:
+def _parse_users(secret_string: str) -> List[Dict[str, str]]:
+    """Parse the users list out of a secret payload ({"users": [...]})"""
+    secret_data = json.loads(secret_string)
+    users_data = secret_data.get('users', [])
+
+    # Handle case where users might be stored as a string
+    if isinstance(users_data, str):
+        try:
+            users_data = json.loads(users_data)
+        except json.JSONDecodeError:
+            print("Warning: Could not parse users data as JSON")
+            return []
+
+    return users_data
+
+
+class CredentialProvider(ABC):
+    """Base class for sources of user credentials"""
+
+    @abstractmethod
+    def fetch_credentials(self) -> Tuple[List[Dict[str, str]], Optional[str]]:
+        """
+        Fetch user credentials along with the version id they were read at.
+        """
+
+    @abstractmethod
+    def get_version_id(self) -> Optional[str]:
+        """
+        Get the current version id without fetching the credentials themselves.
+        """
+
+    def get_user_credentials(self) -> List[Dict[str, str]]:
+        """
+        Retrieve user credentials.
+        """
+        users, _ = self.fetch_credentials()
+        return users
+
+
+class SecretsManager(CredentialProvider):
     """Handles AWS Secrets Manager operations for user credentials"""
 
-    def __init__(self, secret_name: Optional[str] = None, region: Optional[str] = None):
+    def __init__(self, secret_name: Optional[str] = None, region: Optional[str] = None,
+                 version_stage: Optional[str] = None):
         """
         Initialize the AWS Secrets Manager client.
         """
         self.secret_name = secret_name or os.getenv(
             'AWS_SECRETS_MANAGER_NAME', 'udisc-users')
         self.region = region or os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
+        self.version_stage = version_stage or os.getenv(
+            'AWS_SECRETS_MANAGER_VERSION_STAGE', 'AWSCURRENT')
         self.client = None
 
     def _get_client(self):
@@ -44,41 +91,49 @@ class SecretsManager:
                 return None
         return self.client
 
-    def get_user_credentials(self) -> List[Dict[str, str]]:
+    def fetch_credentials(self) -> Tuple[List[Dict[str, str]], Optional[str]]:
         """
         Retrieve user credentials from AWS Secrets Manager.
         """
         client = self._get_client()
         if not client:
             print("Failed to create AWS Secrets Manager client")
-            return []
+            return [], None
 
         try:
-            response = client.get_secret_value(SecretId=self.secret_name)
+            response = client.get_secret_value(
+                SecretId=self.secret_name, VersionStage=self.version_stage)
             if 'SecretString' in response:
-                secret_data = json.loads(response['SecretString'])
-                users_data = secret_data.get('users', [])
-
-                # Handle case where users might be stored as a string
-                if isinstance(users_data, str):
-                    try:
-                        users_data = json.loads(users_data)
-                    except json.JSONDecodeError:
-                        print("Warning: Could not parse users data as JSON")
-                        return []
-
-                return users_data
-            return []
+                return _parse_users(response['SecretString']), response.get('VersionId')
+            return [], None
         except ClientError as e:
             if e.response['Error']['Code'] == 'ResourceNotFoundException':
                 print(
                     f"Secret '{self.secret_name}' not found in AWS Secrets Manager")
-                return []
+                return [], None
             print(f"Error retrieving users: {e}")
-            return []
+            return [], None
         except Exception as e:
             print(f"Unexpected error: {e}")
-            return []
+            return [], None
+
+    def get_version_id(self) -> Optional[str]:
+        """
+        Get the id of the secret version currently attached to the configured stage.
+        """
+        client = self._get_client()
+        if not client:
+            return None
+
+        try:
+            response = client.describe_secret(SecretId=self.secret_name)
+            for version_id, stages in response.get('VersionIdsToStages', {}).items():
+                if self.version_stage in stages:
+                    return version_id
+            return None
+        except Exception as e:
+            print(f"Error describing secret '{self.secret_name}': {e}")
+            return None
 
     def test_connection(self) -> bool:
         """
@@ -97,12 +152,116 @@ class SecretsManager:
             return False
 
 
+class LocalCredentialsFile(CredentialProvider):
+    """Reads user credentials from a local JSON file shaped like the AWS secret"""
+
+    def __init__(self, path: Optional[str] = None):
+        path = path or os.getenv('UDISC_CREDENTIALS_FILE')
+        if not path:
+            raise ValueError(
+                "No credentials file given and UDISC_CREDENTIALS_FILE is not set")
+        self.path = Path(path)
+
+    def fetch_credentials(self) -> Tuple[List[Dict[str, str]], Optional[str]]:
+        """
+        Retrieve user credentials from the local file.
+        """
+        try:
+            version_id = self.get_version_id()
+            return _parse_users(self.path.read_text()), version_id
+        except FileNotFoundError:
+            print(f"Credentials file '{self.path}' not found")
+            return [], None
+        except Exception as e:
+            print(f"Error reading credentials file '{self.path}': {e}")
+            return [], None
+
+    def get_version_id(self) -> Optional[str]:
+        """
+        Use the file's modification time as its version id.
+        """
+        try:
+            return str(self.path.stat().st_mtime_ns)
+        except OSError:
+            return None
+
+
+class CachedCredentialProvider(CredentialProvider):
+    """
+    Caches another provider's credentials in-process.
+
+    Within the TTL no calls are made at all. Once the TTL lapses only the version id
+    is checked, and the credentials are refetched only if that version has changed.
+    """
+
+    def __init__(self, provider: CredentialProvider, ttl_seconds: Optional[float] = None):
+        self.provider = provider
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.getenv('CREDENTIALS_CACHE_TTL_SECONDS', '900'))
+        self._users: Optional[List[Dict[str, str]]] = None
+        self._version_id: Optional[str] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def fetch_credentials(self) -> Tuple[List[Dict[str, str]], Optional[str]]:
+        """
+        Retrieve user credentials, from the cache where still valid.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._users is not None and now - self._checked_at <= self.ttl_seconds:
+                return list(self._users), self._version_id
+
+            if self._users is not None and self._version_id is not None:
+                if self.provider.get_version_id() == self._version_id:
+                    self._checked_at = now
+                    return list(self._users), self._version_id
+
+            users, version_id = self.provider.fetch_credentials()
+            # Don't cache failed fetches; the next call should try again
+            if users:
+                self._users, self._version_id = users, version_id
+                self._checked_at = now
+            return list(users), version_id
+
+    def get_version_id(self) -> Optional[str]:
+        return self.provider.get_version_id()
+
+    def invalidate(self):
+        """
+        Drop the cached credentials so the next call refetches them.
+        """
+        with self._lock:
+            self._users = None
+            self._version_id = None
+
+
+_credential_provider: Optional[CachedCredentialProvider] = None
+_credential_provider_lock = threading.Lock()
+
+
+def get_credential_provider() -> CachedCredentialProvider:
+    """
+    Get the shared, cached credential provider for this process.
+
+    Uses the local file in UDISC_CREDENTIALS_FILE when set, otherwise AWS Secrets Manager.
+    """
+    global _credential_provider
+    with _credential_provider_lock:
+        if _credential_provider is None:
+            if os.getenv('UDISC_CREDENTIALS_FILE'):
+                provider = LocalCredentialsFile()
+            else:
+                provider = SecretsManager()
+            _credential_provider = CachedCredentialProvider(provider)
+        return _credential_provider
+
+
 def get_user_credentials() -> List[Dict[str, str]]:
     """
-    Convenience function to get user credentials from AWS Secrets Manager.
+    Convenience function to get user credentials from the shared credential provider.
     """
-    secrets_manager = SecretsManager()
-    return secrets_manager.get_user_credentials()
+    return get_credential_provider().get_user_credentials()
 
 
 def test_aws_connection() -> bool:
@@ -1,10 +1,13 @@
 import os
 import json
+import time
 import smtplib
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Dict, List, Optional
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from secrets_manager import get_user_credentials
 import api
 
@@ -23,22 +26,66 @@ class User:
     role: Optional[str] = None
 
 
+@dataclass
+class LoginResult:
+    """Outcome of logging a single user in to the UDisc API"""
+    user_name: str
+    success: bool
+    attempts: int
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def is_transient(self) -> bool:
+        """Whether the failure is worth retrying (no response, rate limited or server error)"""
+        if self.success:
+            return False
+        if self.status_code is None:
+            return self.error != "Missing username or password"
+        return self.status_code == 429 or self.status_code >= 500
+
+
 class UserManager:
     """Manages user configurations and operations"""
 
     _unmatched_check_sent = False
 
-    def __init__(self):
-        self.users = {}
-        self._load_users_from_env()
-
-    def _load_users_from_env(self):
-        """Load user configurations from environment variable and merge with AWS credentials"""
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.getenv('UDISC_USERS_TTL_SECONDS', '3600'))
+        self.users = self._load_users_from_env() or {}
+        self.loaded_at = time.monotonic()
+
+    def is_stale(self) -> bool:
+        """Check whether the cached user/credential snapshot has outlived its TTL"""
+        return time.monotonic() - self.loaded_at > self.ttl_seconds
+
+    def refresh(self):
+        """Reload users and credentials, keeping the logged-in User of anyone whose credentials didn't change"""
+        users = self._load_users_from_env()
+        if not users:
+            # A failed or empty reload (e.g. a transient AWS error) keeps the current users, and leaves
+            # loaded_at alone so the next call retries
+            print(f"Warning: Reloading users failed - keeping the {len(self.users)} users already loaded")
+            return
+        for key, user in users.items():
+            previous = self.users.get(key)
+            if previous and (previous.username, previous.password) == (user.username, user.password):
+                # Same credentials - keep the warmed API token, but pick up metadata changes
+                for field in ('display_name', 'email', 'role', 'pdga_id'):
+                    setattr(previous, field, getattr(user, field))
+                users[key] = previous
+        self.users = users
+        self.loaded_at = time.monotonic()
+
+    def _load_users_from_env(self) -> Optional[Dict[str, User]]:
+        """Load user configurations from environment variable and merge with AWS credentials (None on error)"""
+        users = {}
         users_config = os.getenv('UDISC_USERS')
 
         if not users_config:
             print("Warning: UDISC_USERS environment variable not set")
-            return
+            return users
 
         try:
             users_data = json.loads(users_config)
@@ -50,9 +97,10 @@ class UserManager:
                 aws_access_key and aws_secret_key and
                 aws_access_key != 'your_access_key' and
                 aws_secret_key != 'your_secret_key'
-            )
+            ) or bool(os.getenv('UDISC_CREDENTIALS_FILE'))
 
-            # Get credentials from AWS Secrets Manager if configured
+            # Get credentials from AWS Secrets Manager (or its local stand-in) if configured.
+            # The provider caches them, so the unmatched-users check below reuses this fetch.
             aws_credential_lookup = {}
             if use_aws_secrets:
                 aws_credentials = get_user_credentials()
@@ -114,27 +162,32 @@ class UserManager:
                     role=role,
                     pdga_id=pdga_id
                 )
-                self.users[user.name.upper()] = user
+                users[user.name.upper()] = user
 
             print(
-                f"Successfully loaded {len(self.users)} users with credentials")
+                f"Successfully loaded {len(users)} users with credentials")
 
             # Check for unmatched AWS secrets users
             if use_aws_secrets:
                 check_unmatched = os.getenv(
                     'CHECK_UNMATCHED_AWS_USERS', 'false').lower() == 'true'
                 if check_unmatched:
-                    self.check_for_unmatched_aws_users()
+                    self.check_for_unmatched_aws_users(users)
                 else:
                     print(
                         "Skipping unmatched AWS users check (set CHECK_UNMATCHED_AWS_USERS=true to enable)")
 
         except json.JSONDecodeError as e:
             print(f"Error parsing UDISC_USERS JSON: {e}")
+            return None
         except KeyError as e:
             print(f"Missing required field in user configuration: {e}")
+            return None
         except Exception as e:
             print(f"Error loading users: {e}")
+            return None
+
+        return users
 
     def get_user(self, name: str) -> Optional[User]:
         """Get a user by name"""
@@ -160,9 +213,13 @@ class UserManager:
 
     def login_user(self, user: User) -> bool:
         """Login a user to the UDisc API and update their API token and user object ID"""
+        return self._attempt_login(user).success
+
+    def _attempt_login(self, user: User, attempt: int = 1) -> LoginResult:
+        """Make a single login request for a user and describe how it went"""
         if not user.username or not user.password:
             print(f"Missing username or password for {user.display_name}")
-            return False
+            return LoginResult(user.name, False, attempt, error="Missing username or password")
 
         try:
             response = api.post(
@@ -179,23 +236,55 @@ class UserManager:
                     user.api_token = login_data['sessionToken']
                     user.user_object_id = login_data['objectId']
                     print(f"Successfully logged in {user.display_name}")
-                    return True
+                    return LoginResult(user.name, True, attempt, response.status_code)
                 else:
                     print(
                         f"Failed to get session token for {user.display_name}")
-                    return False
+                    return LoginResult(user.name, False, attempt, response.status_code,
+                                       error="No session token in login response")
             else:
                 print(
                     f"Login failed for {user.display_name} (status = {response.status_code})")
+                error = f"HTTP {response.status_code}"
                 if response.status_code == 401:
                     error_data = response.json()
+                    error = error_data.get('error', 'Unknown error')
                     print(
-                        f"Reason: {error_data.get('error', 'Unknown error')}")
-                return False
+                        f"Reason: {error}")
+                return LoginResult(user.name, False, attempt, response.status_code, error=error)
 
         except Exception as e:
             print(f"Login failed for {user.display_name}: {e}")
-            return False
+            return LoginResult(user.name, False, attempt, error=str(e))
+
+    def login_with_retry(self, user: User, max_attempts: Optional[int] = None,
+                         backoff_seconds: Optional[float] = None) -> LoginResult:
+        """Login a user, retrying transient failures (network errors, 429, 5xx) with backoff"""
+        max_attempts = max_attempts or int(os.getenv('LOGIN_MAX_ATTEMPTS', '3'))
+        backoff_seconds = backoff_seconds if backoff_seconds is not None else float(
+            os.getenv('LOGIN_BACKOFF_SECONDS', '1'))
+
+        for attempt in range(1, max_attempts + 1):
+            result = self._attempt_login(user, attempt)
+            if result.success or not result.is_transient:
+                return result
+            if attempt < max_attempts:
+                time.sleep(backoff_seconds * 2 ** (attempt - 1))
+        return result
+
+    def login_all(self, users: List[User], max_workers: Optional[int] = None) -> Dict[str, LoginResult]:
+        """Login all users concurrently (bounded by LOGIN_MAX_WORKERS) and report per-user status"""
+        if not users:
+            return {}
+
+        max_workers = max_workers or int(os.getenv('LOGIN_MAX_WORKERS', '4'))
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(users))) as executor:
+            results = list(executor.map(self.login_with_retry, users))
+
+        report = {result.user_name: result for result in results}
+        succeeded = sum(1 for result in results if result.success)
+        print(f"Logged in {succeeded}/{len(users)} users")
+        return report
 
     def _get_aws_credentials_for_comparison(self) -> List[Dict[str, str]]:
         """Get AWS credentials for comparison with UDISC_USERS metadata"""
@@ -249,17 +338,18 @@ Unmatched users:
             print(f"Failed to send email notification: {e}")
             return False
 
-    def check_for_unmatched_aws_users(self) -> List[str]:
+    def check_for_unmatched_aws_users(self, users: Optional[Dict[str, User]] = None) -> List[str]:
         """Check for AWS secrets users that don't match UDISC_USERS metadata"""
         if UserManager._unmatched_check_sent:
             print("Unmatched AWS users check already performed - skipping email")
             return []
 
+        users = self.users if users is None else users
         aws_credentials = self._get_aws_credentials_for_comparison()
         udisc_usernames = {user.username.lower()
-                           for user in self.users.values() if user.username}
+                           for user in users.values() if user.username}
         udisc_emails = {user.email.lower()
-                        for user in self.users.values() if user.email}
+                        for user in users.values() if user.email}
 
         unmatched_users = []
         for cred in aws_credentials:
@@ -278,15 +368,35 @@ Unmatched users:
         return unmatched_users
 
 
-# Global instance for easy access
-user_manager = UserManager()
+# Global instance, built lazily on first use so importing this module (e.g. while
+# Airflow parses the DAG file) never parses UDISC_USERS or calls AWS
+_user_manager: Optional[UserManager] = None
+_user_manager_lock = threading.Lock()
 
 
 def get_user_manager() -> UserManager:
-    """Get the global user manager instance"""
-    return user_manager
+    """Get the global user manager instance, refreshing its users once their snapshot is stale"""
+    global _user_manager
+    with _user_manager_lock:
+        if _user_manager is None:
+            _user_manager = UserManager()
+        elif _user_manager.is_stale():
+            _user_manager.refresh()
+        return _user_manager
+
+
+def reset_user_manager():
+    """Drop the cached user manager so the next call reloads users and credentials"""
+    global _user_manager
+    with _user_manager_lock:
+        _user_manager = None
 
 
 def login_user(user: User) -> bool:
     """Convenience function to login a user (calls UserManager.login_user)"""
-    return user_manager.login_user(user)
+    return get_user_manager().login_user(user)
+
+
+def login_all(users: List[User]) -> Dict[str, LoginResult]:
+    """Convenience function to login several users at once (calls UserManager.login_all)"""
+    return get_user_manager().login_all(users)
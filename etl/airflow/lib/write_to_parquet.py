@@ -4,14 +4,15 @@ import pandas as pd
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any
+from checkpoints import clear_checkpoint, mark_checkpoint_complete
 
 
 def write_scorecard_data(scorecard_data: Dict[str, Any], user_name: str) -> str:
     """Write scorecard data to Parquet file."""
     # Generate storage path
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    # Use /opt/airflow/data which is mounted from ./data
-    data_dir = Path('/opt/airflow/data')
+    # Use /opt/airflow/data which is mounted from ./data (overridable via DATA_DIR)
+    data_dir = Path(os.getenv('DATA_DIR', '/opt/airflow/data'))
     user_dir = data_dir / user_name.lower()
     user_dir.mkdir(parents=True, exist_ok=True)
 
@@ -61,6 +62,11 @@ def write_all_scorecards(scorecards_data: Dict[str, Any]) -> Dict[str, str]:
 
             file_path = write_scorecard_data(scorecards, user_name.lower())
             results[user_name] = file_path
+
+            # The full file is written, so a later run must start a fresh fetch. Marking the
+            # checkpoint complete first covers a crash while clearing it
+            mark_checkpoint_complete(user_name)
+            clear_checkpoint(user_name)
             print(f"Successfully wrote scorecards for {user_name} to Parquet")
         except Exception as e:
             print(f"Error writing scorecards for {user_name}: {e}")
@@ -0,0 +1,219 @@
+"""
+Generate synthetic UDisc scorecards shaped like the Parse API responses.
+
+The documents carry the fields the dbt staging models read (courses, layouts, holes
+with tee/target positions, entries with hole scores and optional throws), so the
+whole pipeline can run against them at any scale.
+"""
+
+import random
+import string
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+# Landing zones in the order a typical hole progresses through them
+FAIRWAY_ZONES = ['center', 'offFairway', 'ob', 'circle2']
+PUTTING_ZONES = ['circle2', 'circle1']
+
+
+def _object_id(rng: random.Random) -> str:
+    """Random 10-character Parse-style object id."""
+    return ''.join(rng.choices(string.ascii_letters + string.digits, k=10))
+
+
+def _iso(ts: datetime) -> str:
+    return ts.strftime('%Y-%m-%dT%H:%M:%S.') + f"{ts.microsecond // 1000:03d}Z"
+
+
+def _make_course(rng: random.Random, course_index: int, holes: int) -> Dict[str, Any]:
+    """Build a course with two layouts, each with its own tee/target positions."""
+    lat = 33.0 + rng.random()
+    lon = -82.0 - rng.random()
+    layouts = []
+    for layout_index, layout_name in enumerate(['Main', 'Short Tees']):
+        layout_holes = []
+        for hole_number in range(1, holes + 1):
+            tee_lat = lat + hole_number * 0.0015
+            tee_lon = lon + layout_index * 0.0003
+            length = rng.uniform(0.0005, 0.0025) * (1.0 if layout_index == 0 else 0.7)
+            layout_holes.append({
+                'holeId': f"h{course_index}_{hole_number}",
+                'name': str(hole_number),
+                'par': rng.choices([3, 4, 5], weights=[70, 22, 8])[0],
+                'distance': length * 111000,
+                'tee_lat': tee_lat,
+                'tee_lon': tee_lon,
+                'target_lat': tee_lat + length * rng.uniform(-1, 1),
+                'target_lon': tee_lon + length * rng.uniform(-1, 1),
+                'tee_id': f"t{course_index}{layout_index}{hole_number}",
+                'target_id': f"b{course_index}{hole_number}",
+            })
+        layouts.append({
+            'layoutId': course_index * 100 + layout_index,
+            'layoutName': layout_name,
+            'holes': layout_holes,
+        })
+    return {
+        'courseId': 1000 + course_index,
+        'courseName': f"Synthetic Park {course_index}",
+        'layouts': layouts,
+    }
+
+
+def _hole_json(hole: Dict[str, Any], moved: bool) -> Dict[str, Any]:
+    """Render a layout hole as a scorecard hole; moved tees exercise canonical id matching."""
+    tee_lat = hole['tee_lat'] + (0.00002 if moved else 0)
+    return {
+        'holeId': hole['holeId'],
+        'status': 'active',
+        'doglegs': [],
+        'name': hole['name'],
+        'par': hole['par'],
+        'distance': hole['distance'],
+        'teePosition': {
+            'status': 'active',
+            'teePositionId': hole['tee_id'],
+            'latitude': tee_lat,
+            'longitude': hole['tee_lon'],
+            'teeType': {'status': 'active', 'teeType': 'concrete'},
+        },
+        'targetPosition': {
+            'status': 'active',
+            'targetPositionId': hole['target_id'],
+            'latitude': hole['target_lat'],
+            'longitude': hole['target_lon'],
+            'targetType': {
+                'status': 'active',
+                'type': 'basket',
+                'basketModel': {'name': 'DISCatcher Pro', 'manufacturer': 'Innova Champion Discs'},
+            },
+        },
+        'teePad': {'latitude': tee_lat, 'longitude': hole['tee_lon']},
+        'basket': {'latitude': hole['target_lat'], 'longitude': hole['target_lon']},
+    }
+
+
+def _hole_throws(rng: random.Random, strokes: int) -> List[Dict[str, Any]]:
+    """Landing zones for each throw on a hole, ending in the basket."""
+    throws = []
+    for throw_number in range(1, strokes):
+        if throw_number >= strokes - 1:
+            zone = rng.choice(PUTTING_ZONES)
+        else:
+            zone = rng.choice(FAIRWAY_ZONES)
+        throws.append({'landingZone': zone})
+    throws.append({'landingZone': 'basket', 'distance': rng.uniform(0.5, 15)})
+    return throws
+
+
+def _user_json(player: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'username': player['username'],
+        'name': player['name'],
+        'fullName': player['name'],
+        'createdAt': player['createdAt'],
+        'updatedAt': player['createdAt'],
+        'objectId': player['objectId'],
+        '__type': 'Object',
+        'className': '_User',
+    }
+
+
+def generate_scorecards(users: int = 2, rounds: int = 100, holes: int = 18,
+                        throws: float = 0.25, courses: int = 5,
+                        players_per_card: int = 3, seed: int = 0) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Generate scorecards for each synthetic user.
+
+    Args:
+        users: Number of league users (each gets their own scorecard history)
+        rounds: Scorecards per user
+        holes: Holes per layout
+        throws: Fraction of scorecards with throw-by-throw tracking (0-1)
+        courses: Number of distinct courses played
+        players_per_card: Players on each scorecard, drawn from the user pool
+        seed: Random seed, so runs at the same scale are comparable
+
+    Returns:
+        dict: {user_name: [scorecard, ...]}, the scorecards_by_user fetch_all_scorecards returns
+    """
+    rng = random.Random(seed)
+    course_list = [_make_course(rng, i, holes) for i in range(courses)]
+    league = [{
+        'objectId': _object_id(rng),
+        'username': f"user{i}",
+        'name': f"User {i}",
+        'createdAt': _iso(datetime(2020, 1, 1) + timedelta(days=i)),
+    } for i in range(max(users, players_per_card))]
+
+    start = datetime(2021, 1, 1)
+    scorecards_by_user = {}
+    for user_index in range(users):
+        owner = league[user_index]
+        others = [p for p in league if p is not owner]
+        scorecards = []
+        for round_index in range(rounds):
+            course = rng.choice(course_list)
+            layout = rng.choice(course['layouts'])
+            played_at = start + timedelta(hours=round_index * 30 + user_index)
+            updated_at = played_at + timedelta(hours=2)
+            tracked = rng.random() < throws
+            card_players = [owner] + rng.sample(others, min(players_per_card - 1, len(others)))
+
+            entries = []
+            for player in card_players:
+                hole_scores = []
+                for hole in layout['holes']:
+                    strokes = max(1, hole['par'] + rng.choices([-1, 0, 1, 2, 3], weights=[18, 50, 22, 7, 3])[0])
+                    hole_score = {'strokes': strokes, 'changeVersion': 1}
+                    if tracked:
+                        hole_score['holeThrows'] = _hole_throws(rng, strokes)
+                    hole_scores.append(hole_score)
+                entries.append({
+                    'players': [],
+                    'users': [_user_json(player)],
+                    'holeScores': hole_scores,
+                    'includeInHandicaps': True,
+                    'includeInProfile': True,
+                    'startingScore': 0,
+                    'roundRating': rng.gauss(200, 30),
+                    'createdAt': _iso(played_at),
+                    'updatedAt': _iso(updated_at),
+                    'objectId': _object_id(rng),
+                    '__type': 'Object',
+                    'className': 'ScorecardEntry',
+                })
+
+            scorecards.append({
+                'objectId': _object_id(rng),
+                'courseId': course['courseId'],
+                'courseName': course['courseName'],
+                'layoutId': layout['layoutId'],
+                'layoutName': layout['layoutName'],
+                'startDate': {'__type': 'Date', 'iso': _iso(played_at)},
+                'endDate': {'__type': 'Date', 'iso': _iso(played_at + timedelta(hours=1, minutes=30))},
+                'playFormat': 'singles',
+                'startingHoleIndex': 0,
+                'stepCount': rng.randint(4000, 12000),
+                'floorsAscended': rng.randint(0, 20),
+                'floorsDescended': rng.randint(0, 20),
+                'distance': rng.uniform(2000, 6000),
+                'difficulty': 'moderate',
+                'usesValidSmartLayout': True,
+                'weather': {
+                    'humidity': rng.randint(20, 90),
+                    'temperature': rng.uniform(275, 305),
+                    'cloudCoverPercent': rng.randint(0, 100),
+                    'wind': {'speed': rng.uniform(0, 10), 'direction': rng.randint(0, 359)},
+                },
+                'entries': entries,
+                'holes': [_hole_json(hole, moved=rng.random() < 0.02) for hole in layout['holes']],
+                'version': 2,
+                'isFinished': True,
+                'isSimpleScoring': not tracked,
+                'createdAt': _iso(played_at),
+                'updatedAt': _iso(updated_at),
+                'createdBy': _user_json(owner),
+            })
+        scorecards_by_user[owner['username']] = scorecards
+    return scorecards_by_user
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+End-to-end pipeline benchmark on synthetic data.
+
+Runs fetch (synthetic) -> write -> load -> dbt -> dashboard against a temporary
+data directory and warehouse, and reports wall time and memory for each stage.
+
+Usage:
+    python bench/run_benchmark.py --users 4 --rounds 500 --throws 0.5
+    python bench/run_benchmark.py --rounds 2000 --skip-dbt --report report.json
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import resource
+import tempfile
+import subprocess
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent / 'airflow' / 'lib'))
+sys.path.insert(0, str(BENCH_DIR))
+
+from generate_scorecards import generate_scorecards  # noqa: E402
+
+DBT_DIR = BENCH_DIR.parent.parent / 'dbt'
+
+# Representative dashboard queries (All Rounds page)
+DASHBOARD_QUERIES = {
+    'player_options': 'SELECT DISTINCT "Player" FROM analytics.rounds WHERE "Player" IS NOT NULL ORDER BY "Player"',
+    'course_options': 'SELECT DISTINCT "Course Name" FROM analytics.rounds WHERE "Course Name" IS NOT NULL ORDER BY "Course Name"',
+    'all_rounds': 'SELECT * FROM analytics.rounds ORDER BY "Date" DESC, "UDisc Rating" DESC LIMIT 500',
+    'hole_results': 'SELECT "Competitor Name", avg("Hole Score") FROM analytics.hole_results GROUP BY 1',
+}
+
+
+def _max_rss_mb(who: int) -> float:
+    """Peak resident set size so far, in MB (ru_maxrss is KB on Linux, bytes on macOS)."""
+    max_rss = resource.getrusage(who).ru_maxrss
+    return max_rss / (1024 * 1024) if sys.platform == 'darwin' else max_rss / 1024
+
+
+def run_stage(name: str, func: Callable[[], Any], report: List[Dict[str, Any]]) -> Any:
+    """Run one stage, recording wall time, Python heap peak and process RSS high-water marks."""
+    print(f"\n=== {name} ===")
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = func()
+        status = 'ok'
+    except Exception as e:
+        print(f"Stage {name} failed: {e}")
+        result, status = None, f"failed: {e}"
+    elapsed = time.perf_counter() - start
+    _, python_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    report.append({
+        'stage': name,
+        'status': status,
+        'seconds': round(elapsed, 3),
+        'python_peak_mb': round(python_peak / (1024 * 1024), 1),
+        'process_max_rss_mb': round(_max_rss_mb(resource.RUSAGE_SELF), 1),
+        'children_max_rss_mb': round(_max_rss_mb(resource.RUSAGE_CHILDREN), 1),
+    })
+    return result
+
+
+def write_profiles(work_dir: Path, warehouse_path: Path, threads: int) -> Path:
+    """Write a throwaway dbt profile pointing at the benchmark warehouse."""
+    profiles_dir = work_dir / 'profiles'
+    profiles_dir.mkdir()
+    (profiles_dir / 'profiles.yml').write_text(f"""disc_golf_dbt:
+  target: bench
+  outputs:
+    bench:
+      type: duckdb
+      path: {warehouse_path}
+      threads: {threads}
+""")
+    return profiles_dir
+
+
+def run_dbt(work_dir: Path, warehouse_path: Path, threads: int) -> str:
+    """Run the dbt project against the benchmark warehouse."""
+    profiles_dir = write_profiles(work_dir, warehouse_path, threads)
+    common = ['--profiles-dir', str(profiles_dir)]
+    if not (DBT_DIR / 'dbt_packages').exists():
+        subprocess.run(['dbt', 'deps'] + common, cwd=DBT_DIR, check=True)
+
+    result = subprocess.run(
+        ['dbt', 'run', '--target', 'bench', '--target-path', str(work_dir / 'target'),
+         '--log-path', str(work_dir / 'logs')] + common,
+        cwd=DBT_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stdout[-2000:] + result.stderr[-2000:])
+    return 'dbt run completed'
+
+
+def run_dashboard_queries(warehouse_path: Path) -> Dict[str, float]:
+    """Time the dashboard's queries against the built analytics schema."""
+    import duckdb
+
+    conn = duckdb.connect(str(warehouse_path), read_only=True)
+    timings = {}
+    try:
+        for name, query in DASHBOARD_QUERIES.items():
+            start = time.perf_counter()
+            conn.execute(query).df()
+            timings[name] = round(time.perf_counter() - start, 4)
+            print(f"  {name}: {timings[name]}s")
+    finally:
+        conn.close()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=2, help='League users (scorecard histories)')
+    parser.add_argument('--rounds', type=int, default=100, help='Scorecards per user')
+    parser.add_argument('--holes', type=int, default=18, help='Holes per layout')
+    parser.add_argument('--throws', type=float, default=0.25,
+                        help='Fraction of scorecards with throw tracking (0-1)')
+    parser.add_argument('--courses', type=int, default=5, help='Distinct courses')
+    parser.add_argument('--players-per-card', type=int, default=3, help='Players per scorecard')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--threads', type=int, default=4, help='dbt threads')
+    parser.add_argument('--skip-dbt', action='store_true', help='Stop after loading DuckDB')
+    parser.add_argument('--keep', action='store_true', help='Keep the temporary data directory')
+    parser.add_argument('--report', help='Write the stage report to this JSON file')
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix='disc_golf_bench_'))
+    data_dir = work_dir / 'data'
+    data_dir.mkdir()
+    warehouse_path = data_dir / 'warehouse.duckdb'
+    # Point the pipeline modules at the temporary data directory
+    os.environ['DATA_DIR'] = str(data_dir)
+
+    from write_to_parquet import write_all_scorecards
+    from load_to_duckdb import load_to_duckdb
+
+    print(f"Benchmark working directory: {work_dir}")
+    report: List[Dict[str, Any]] = []
+    try:
+        scorecards = run_stage('fetch (synthetic)', lambda: generate_scorecards(
+            users=args.users, rounds=args.rounds, holes=args.holes, throws=args.throws,
+            courses=args.courses, players_per_card=args.players_per_card, seed=args.seed
+        ), report)
+        run_stage('write', lambda: write_all_scorecards(scorecards), report)
+        del scorecards
+        run_stage('load', load_to_duckdb, report)
+
+        dashboard = None
+        if not args.skip_dbt:
+            run_stage('dbt', lambda: run_dbt(work_dir, warehouse_path, args.threads), report)
+            dashboard = run_stage('dashboard', lambda: run_dashboard_queries(warehouse_path), report)
+
+        summary = {
+            'scale': {
+                'users': args.users,
+                'rounds': args.rounds,
+                'holes': args.holes,
+                'throws': args.throws,
+                'courses': args.courses,
+                'players_per_card': args.players_per_card,
+            },
+            'warehouse_mb': round(warehouse_path.stat().st_size / (1024 * 1024), 1)
+            if warehouse_path.exists() else None,
+            'stages': report,
+            'dashboard_queries': dashboard,
+        }
+
+        print("\n=== Report ===")
+        print(f"{'stage':<20}{'status':<10}{'seconds':>10}{'py peak MB':>12}{'max RSS MB':>12}{'child RSS MB':>14}")
+        for row in report:
+            print(f"{row['stage']:<20}{row['status'][:9]:<10}{row['seconds']:>10}"
+                  f"{row['python_peak_mb']:>12}{row['process_max_rss_mb']:>12}{row['children_max_rss_mb']:>14}")
+        print(f"Warehouse size: {summary['warehouse_mb']} MB")
+
+        if args.report:
+            Path(args.report).write_text(json.dumps(summary, indent=2))
+            print(f"Wrote report to {args.report}")
+    finally:
+        if args.keep:
+            print(f"Kept benchmark data in {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,24 +3,12 @@ Disc Golf Analytics Dashboard
 Interactive dashboard for analyzing disc golf scorecard data.
 """
 
+import importlib
+from datetime import datetime
+
 import streamlit as st
-from utils.db_connection import get_db_connection
-from pages import (
-    show_title_page,
-    show_monthly_summary,
-    show_all_rounds,
-    show_record_sheet,
-    show_player_profile,
-    show_course_profile,
-    show_hole_analysis,
-    show_stats_tables,
-    show_historic_ratings,
-    show_head_to_head,
-    show_power_scores,
-    show_turkeys_bounce_backs,
-    show_hole_streaks,
-    show_golden_birdies,
-)
+from utils.db_connection import get_db_connection, get_db_path, get_session_cursor, get_warehouse_version
+from utils.query_profiler import is_profiling_enabled, show_profiler_panel
 
 
 # Page configuration
@@ -32,29 +20,86 @@ st.set_page_config(
 )
 
 
+# Dashboard pages as (module, title, icon) - each page module in page_modules/ defines show_<module>(conn)
+PAGES = [
+    ("title_page", "Home", "🏠"),
+    ("monthly_summary", "Monthly Summary", "📅"),
+    ("all_rounds", "All Rounds", "📋"),
+    ("record_sheet", "Record Sheet", "🏆"),
+    ("player_profile", "Player Profile", "👤"),
+    ("course_profile", "Course Profile", "🌳"),
+    ("hole_analysis", "Hole Analysis", "🎯"),
+    ("stats_tables", "Stats Tables", "📊"),
+    ("historic_ratings", "Historic Ratings", "📈"),
+    ("head_to_head", "Head-to-Head", "🤝"),
+    ("power_scores", "Power Scores", "💪"),
+    ("turkeys_bounce_backs", "Turkeys and Bounce Backs", "🦃"),
+    ("hole_streaks", "Hole Streaks", "🔥"),
+    ("golden_birdies", "Golden Birdies", "🐤"),
+]
+
+# Pages shown in the navigation - only All Rounds for now
+ENABLED_PAGES = ["all_rounds"]
+
+
 # Initialize connection
-@st.cache_resource
-def init_connection():
-    """Initialize and cache DuckDB connection"""
-    return get_db_connection()
+@st.cache_resource(max_entries=1)
+def init_connection(db_path, warehouse_version):
+    """Initialize and cache the read-only root DuckDB connection for a warehouse version
+
+    A new version (a newly published snapshot) opens a new connection on the next script run,
+    so the app hot-swaps to new data without a restart.
+    """
+    return get_db_connection(db_path)
+
+
+def make_page(conn, module_name, title, icon):
+    """
+    Navigation page that imports and runs its page module only when it's the active page.
+
+    Args:
+        conn: DuckDB connection for the page's queries
+        module_name: Page module in page_modules/
+        title: Page title
+        icon: Page icon
+
+    Returns:
+        st.Page: Navigation page
+    """
+    def run_page():
+        module = importlib.import_module(f"page_modules.{module_name}")
+        if module_name != "title_page":
+            st.title(f"{icon} {title}")
+            st.markdown("---")
+        getattr(module, f"show_{module_name}")(conn)
+
+    return st.Page(run_page, title=title, icon=icon, url_path=module_name)
 
 
 def main():
     """Main application"""
-    # Initialize database connection
+    # Initialize database connection - each script run queries through its own cursor, and the
+    # root connection is reopened when a new warehouse version lands. The version is stamped
+    # once per run, on the file the connection reads, and cached results are keyed by it
     try:
-        conn = init_connection()
+        db_path = get_db_path()
+        warehouse_version = get_warehouse_version(db_path)
+        conn = get_session_cursor(init_connection(db_path, warehouse_version), warehouse_version)
     except Exception as e:
         st.error(f"Failed to connect to database: {e}")
         st.stop()
 
-    # Navigation - only show All Rounds for now
-    tabs = st.tabs(["All Rounds"])
+    try:
+        # Navigation - only the active page's module is imported and run
+        run_started = datetime.now()
+        pages = [make_page(conn, *page) for page in PAGES if page[0] in ENABLED_PAGES]
+        st.navigation(pages).run()
 
-    with tabs[0]:
-        st.title("📋 All Rounds")
-        st.markdown("---")
-        show_all_rounds(conn)
+        # Developer query profiler (DASHBOARD_PROFILE=1)
+        if is_profiling_enabled():
+            show_profiler_panel(conn, run_started)
+    finally:
+        conn.close()
 
 
 if __name__ == "__main__":
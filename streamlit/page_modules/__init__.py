@@ -0,0 +1,33 @@
+"""
+Page modules for the Disc Golf Analytics Dashboard
+
+Page functions are imported lazily, so importing one page doesn't import (and run the
+module code of) every page.
+"""
+
+import importlib
+
+__all__ = [
+    'show_title_page',
+    'show_monthly_summary',
+    'show_all_rounds',
+    'show_record_sheet',
+    'show_player_profile',
+    'show_course_profile',
+    'show_hole_analysis',
+    'show_stats_tables',
+    'show_historic_ratings',
+    'show_head_to_head',
+    'show_power_scores',
+    'show_turkeys_bounce_backs',
+    'show_hole_streaks',
+    'show_golden_birdies',
+]
+
+
+def __getattr__(name):
+    """Import a page function's module on first access, e.g. show_all_rounds from .all_rounds"""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{name[len('show_'):]}", __name__)
+    return getattr(module, name)
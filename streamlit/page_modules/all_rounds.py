@@ -0,0 +1,354 @@
+"""All Rounds - round search with filters"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+import pandas as pd
+from utils.filter_options import get_filter_options
+from utils.query_cache import run_query
+from utils.query_filters import build_where_clause, date_range_months, open_range
+from utils.round_grid import ROUND_GRID_CSS, build_round_grid_html
+
+
+PAGE_SIZE_OPTIONS = [25, 50, 100, 200]
+
+# Slider limits - a slider at a limit leaves that end of the range open
+HOLES_LIMITS = (6, 27)
+SCORE_LIMITS = (-20, 30)
+
+# Keyset for paging newest first - unrated rounds sort after rated ones on the same date
+UNRATED_SORT_VALUE = -1000000
+ROUND_KEYSET = f'("Date", coalesce("UDisc Rating", {UNRATED_SORT_VALUE}), "Round SK")'
+
+
+def _round_cursor(row):
+    """Keyset cursor (date, rating sort value, round sk) of a rounds row"""
+    rating = row['UDisc Rating']
+    return (
+        row['Date'].to_pydatetime(),
+        UNRATED_SORT_VALUE if pd.isna(rating) else float(rating),
+        int(row['Round SK'])
+    )
+
+
+def _next_page(cursor):
+    """Move to the page of rounds after the cursor"""
+    st.session_state["rounds_prev_cursors"].append(st.session_state["rounds_cursor"])
+    st.session_state["rounds_cursor"] = cursor
+
+
+def _prev_page():
+    """Move back to the previous page of rounds"""
+    st.session_state["rounds_cursor"] = st.session_state["rounds_prev_cursors"].pop()
+
+
+def show_all_rounds(conn):
+    """All Rounds - round search with filters"""
+    # Get available options for filters first - players are singles players and teams
+    player_options = sorted(get_filter_options(conn, 'player') + get_filter_options(conn, 'team'))
+    course_options = get_filter_options(conn, 'course')
+    format_options = get_filter_options(conn, 'format')
+
+    # Filters
+    col1, col2, col3, col4, col5 = st.columns(5)
+    with col1:
+        player_filter = st.multiselect(
+            "Player", player_options if player_options else [])
+    with col2:
+        format_filter = st.multiselect(
+            "Format", format_options, default=[])
+    with col3:
+        course_filter = st.multiselect(
+            "Course", course_options if course_options else [], key="course_filter")
+
+    # Layout filter depends on course selection - only show when course is selected
+    layout_filter = []  # Default value
+    layout_filter_shown = False
+    if course_filter and len(course_filter) > 0:
+        # Get layouts for all selected courses
+        layout_options = get_filter_options(conn, 'layout', parents=course_filter)
+
+        # Only show layout filter when a course is selected
+        if layout_options:
+            with col4:
+                layout_filter = st.multiselect(
+                    "Layout", layout_options, key="layout_filter")
+                layout_filter_shown = True
+
+    # Date and other filters - use col4 if no layout filter, col5 if layout filter is shown
+    filter_col = col4 if not layout_filter_shown else col5
+    with filter_col:
+        date_range = st.selectbox(
+            "Date", ["Last 1 month", "Last 3 months", "Last 6 months", "Last 12 months", "Last 24 months", "All"], index=1)
+        holes_min, holes_max = st.slider("Holes", *HOLES_LIMITS, HOLES_LIMITS)
+        score_min, score_max = st.slider("Score", *SCORE_LIMITS, SCORE_LIMITS)
+        page_size = st.selectbox("Rounds per page", PAGE_SIZE_OPTIONS, index=1)
+
+    # Pages are keyset cursors kept in session state - any filter change goes back to the first page
+    filter_key = (tuple(player_filter), tuple(format_filter), tuple(course_filter), tuple(layout_filter),
+                  date_range, holes_min, holes_max, score_min, score_max, page_size)
+    if st.session_state.get("rounds_filter_key") != filter_key:
+        st.session_state["rounds_filter_key"] = filter_key
+        st.session_state["rounds_cursor"] = None
+        st.session_state["rounds_prev_cursors"] = []
+    cursor = st.session_state["rounds_cursor"]
+
+    try:
+        # Build query based on filters
+        page_select = """
+            SELECT 
+                "Round SK",
+                "Date",
+                "Player",
+                "Course Name",
+                "Layout Name",
+                "Course Layout Name",
+                "Date Formatted",
+                "Score",
+                "Score Display",
+                "UDisc Rating",
+                "Holes Played",
+                "Par",
+                "Aces",
+                "Eagles",
+                "Birdies",
+                "Pars",
+                "Bogeys",
+                "Doubles",
+                "Triples",
+                "Quads+",
+                "Fairway Hits",
+                "Fairway Attempts",
+                "GIR C2",
+                "GIR C1",
+                "Parked",
+                "C1 Putts Made",
+                "C1 Putts Attempted",
+                "C1X Putts Made",
+                "C1X Putts Attempted",
+                "C2 Putts Made",
+                "C2 Putts Attempted",
+                "Hole Strokes",
+                "Hole Results"
+            FROM analytics.rounds
+        """
+
+        # Filter predicates shared by the page and summary queries
+        filters = [
+            ('"Player"', 'in', player_filter),
+            ('"Course Name"', 'in', course_filter),
+            ('"Layout Name"', 'in', layout_filter),
+            ('"Format"', 'in', format_filter),
+            ('"Date"', 'last_months', date_range_months(date_range)),
+            ('"Holes Played"', 'between', open_range((holes_min, holes_max), HOLES_LIMITS)),
+            ('"Score"', 'between', open_range((score_min, score_max), SCORE_LIMITS)),
+        ]
+        where_clause, filter_params = build_where_clause(filters)
+        page_where_clause, params = build_where_clause(filters + [(ROUND_KEYSET, '<', cursor)])
+        query = page_select + page_where_clause
+
+        # One extra row tells whether there is a next page
+        query += f''' ORDER BY "Date" DESC, coalesce("UDisc Rating", {UNRATED_SORT_VALUE}) DESC, "Round SK" DESC
+            LIMIT {page_size + 1}'''
+
+        # Summary statistics over every round matching the filters, not just the page
+        summary_query = f"""
+            SELECT
+                count(*) AS "Rounds",
+                avg("UDisc Rating") AS "Avg Rating",
+                avg("Score") AS "Avg Score",
+                coalesce(sum("Holes Played"), 0) AS "Holes Played",
+                coalesce(sum("Aces"), 0) AS "Aces",
+                coalesce(sum("Eagles"), 0) AS "Eagles",
+                coalesce(sum("Birdies"), 0) AS "Birdies",
+                coalesce(sum("Pars"), 0) AS "Pars",
+                coalesce(sum("Bogeys"), 0) AS "Bogeys",
+                coalesce(sum("Doubles"), 0) AS "Doubles",
+                coalesce(sum("Triples"), 0) AS "Triples",
+                coalesce(sum("Quads+"), 0) AS "Quads+"
+            FROM analytics.rounds
+            {where_clause}
+        """
+
+        try:
+            # Run the page and summary queries in parallel, the summary on its own cursor
+            summary_conn = conn.cursor()
+            try:
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    page_future = executor.submit(run_query, conn, query, params)
+                    summary_future = executor.submit(run_query, summary_conn, summary_query, filter_params)
+                    df = page_future.result()
+                    summary = summary_future.result().iloc[0]
+            finally:
+                summary_conn.close()
+        except Exception as query_error:
+            st.error(f"Query error: {query_error}")
+            st.code(query)
+            st.code(summary_query)
+            st.code(f"Params: {params}")
+            import traceback
+            st.code(traceback.format_exc())
+            st.stop()
+
+        has_next_page = len(df) > page_size
+        df = df.head(page_size)
+
+        if df is not None and not df.empty and len(df) > 0:
+            st.markdown("#### Summary Statistics")
+
+            # Totals over all filtered rounds from the summary query
+            total_rounds = int(summary['Rounds'])
+            total_holes = int(summary['Holes Played'])
+            aces = int(summary['Aces'])
+            eagles = int(summary['Eagles'])
+            birdies = int(summary['Birdies'])
+            pars = int(summary['Pars'])
+            bogeys = int(summary['Bogeys'])
+            doubles = int(summary['Doubles'])
+            triples = int(summary['Triples'])
+            quads_plus = int(summary['Quads+'])
+
+            # Stats in smaller format - custom HTML boxes (dark mode compatible)
+            st.markdown("""
+            <style>
+            .stat-box {
+                display: inline-block;
+                padding: 6px 10px;
+                margin: 2px;
+                background-color: rgba(250, 250, 250, 0.8);
+                border: 1px solid rgba(128, 128, 128, 0.3);
+                border-radius: 4px;
+                font-size: 12px;
+                min-width: 70px;
+            }
+            .stat-label {
+                font-size: 10px;
+                color: rgba(0, 0, 0, 0.6);
+                display: block;
+                margin-bottom: 2px;
+            }
+            .stat-value {
+                font-size: 16px;
+                font-weight: bold;
+                display: block;
+                color: rgba(0, 0, 0, 0.9);
+            }
+            /* Dark mode styles */
+            @media (prefers-color-scheme: dark) {
+                .stat-box {
+                    background-color: rgba(30, 30, 30, 0.8);
+                    border-color: rgba(100, 100, 100, 0.5);
+                }
+                .stat-label {
+                    color: rgba(255, 255, 255, 0.7);
+                }
+                .stat-value {
+                    color: rgba(255, 255, 255, 0.9);
+                }
+            }
+            /* Streamlit dark mode */
+            .stApp[data-theme="dark"] .stat-box,
+            [data-theme="dark"] .stat-box {
+                background-color: rgba(30, 30, 30, 0.8);
+                border-color: rgba(100, 100, 100, 0.5);
+            }
+            .stApp[data-theme="dark"] .stat-label,
+            [data-theme="dark"] .stat-label {
+                color: rgba(255, 255, 255, 0.7);
+            }
+            .stApp[data-theme="dark"] .stat-value,
+            [data-theme="dark"] .stat-value {
+                color: rgba(255, 255, 255, 0.9);
+            }
+            </style>
+            """, unsafe_allow_html=True)
+
+            # All stats in one row - 14 columns
+            col1, col2, col3, col4, col5, col6, col7, col8, col9, col10, col11, col12, col13, col14 = st.columns(
+                14)
+            with col1:
+                st.markdown(
+                    f'<div class="stat-box"><span class="stat-label">Rounds</span><span class="stat-value">{total_rounds}</span></div>', unsafe_allow_html=True)
+            with col2:
+                avg_rating = summary['Avg Rating']
+                if pd.isna(avg_rating):
+                    rating_val = "N/A"
+                else:
+                    rating_val = f"{avg_rating:.0f}"
+                st.markdown(
+                    f'<div class="stat-box"><span class="stat-label">Avg Rating</span><span class="stat-value">{rating_val}</span></div>', unsafe_allow_html=True)
+            with col3:
+                avg_score = summary['Avg Score']
+                score_val = f"{avg_score:.1f}" if avg_score is not None and not pd.isna(
+                    avg_score) else "N/A"
+                st.markdown(
+                    f'<div class="stat-box"><span class="stat-label">Avg Score</span><span class="stat-value">{score_val}</span></div>', unsafe_allow_html=True)
+            with col4:
+                st.markdown(
+                    f'<div class="stat-box"><span class="stat-label">Aces</span><span class="stat-value">{aces}</span></div>', unsafe_allow_html=True)
+            with col5:
+                st.markdown(
+                    f'<div class="stat-box"><span class="stat-label">Eagles</span><span class="stat-value">{eagles}</span></div>', unsafe_allow_html=True)
+            with col6:
+                st.markdown(
+                    f'<div class="stat-box"><span class="stat-label">Birdies</span><span class="stat-value">{birdies}</span></div>', unsafe_allow_html=True)
+            with col7:
+                birdie_pct = (birdies / total_holes *
+                              100) if total_holes > 0 else 0
+                st.markdown(
+                    f'<div class="stat-box"><span class="stat-label">Birdie %</span><span class="stat-value">{birdie_pct:.1f}%</span></div>', unsafe_allow_html=True)
+            with col8:
+                par_pct = (pars / total_holes * 100) if total_holes > 0 else 0
+                st.markdown(
+                    f'<div class="stat-box"><span class="stat-label">Par %</span><span class="stat-value">{par_pct:.1f}%</span></div>', unsafe_allow_html=True)
+            with col9:
+                bogey_pct = (bogeys / total_holes *
+                             100) if total_holes > 0 else 0
+                st.markdown(
+                    f'<div class="stat-box"><span class="stat-label">Bogey %</span><span class="stat-value">{bogey_pct:.1f}%</span></div>', unsafe_allow_html=True)
+            with col10:
+                st.markdown(
+                    f'<div class="stat-box"><span class="stat-label">Pars</span><span class="stat-value">{pars}</span></div>', unsafe_allow_html=True)
+            with col11:
+                st.markdown(
+                    f'<div class="stat-box"><span class="stat-label">Bogeys</span><span class="stat-value">{bogeys}</span></div>', unsafe_allow_html=True)
+            with col12:
+                st.markdown(
+                    f'<div class="stat-box"><span class="stat-label">Doubles</span><span class="stat-value">{doubles}</span></div>', unsafe_allow_html=True)
+            with col13:
+                st.markdown(
+                    f'<div class="stat-box"><span class="stat-label">Triples</span><span class="stat-value">{triples}</span></div>', unsafe_allow_html=True)
+            with col14:
+                st.markdown(
+                    f'<div class="stat-box"><span class="stat-label">Quads+</span><span class="stat-value">{quads_plus}</span></div>', unsafe_allow_html=True)
+
+            st.markdown("---")
+            st.markdown("### Rounds")
+
+            # One HTML element for the whole grid - rounds expand client-side on click
+            st.markdown(ROUND_GRID_CSS, unsafe_allow_html=True)
+            st.markdown(build_round_grid_html(df), unsafe_allow_html=True)
+
+            # Page navigation
+            page_number = len(st.session_state["rounds_prev_cursors"]) + 1
+            first_round = (page_number - 1) * page_size + 1
+            nav_cols = st.columns([1, 4, 1])
+            with nav_cols[0]:
+                st.button("← Previous", key="rounds_prev_page", on_click=_prev_page,
+                          disabled=page_number == 1)
+            with nav_cols[1]:
+                st.markdown(
+                    f"<div style='text-align: center;'>Page {page_number} · rounds {first_round}-{first_round + len(df) - 1} of {total_rounds}</div>",
+                    unsafe_allow_html=True)
+            with nav_cols[2]:
+                st.button("Next →", key="rounds_next_page", on_click=_next_page,
+                          args=(_round_cursor(df.iloc[-1]),), disabled=not has_next_page)
+        else:
+            st.info(
+                "No rounds found matching filters. Create `analytics.rounds` model in dbt if table doesn't exist.")
+
+    except Exception as e:
+        import traceback
+        st.error(f"Error loading rounds: {e}")
+        st.code(traceback.format_exc())
+        st.info("Make sure the `analytics.rounds` table exists. Run: `cd dbt && dbt run --select analytics.rounds`")
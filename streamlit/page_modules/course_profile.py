@@ -1,19 +1,16 @@
 """Course Profile - dashboard for single, selectable course"""
 
 import streamlit as st
+from utils.filter_options import get_filter_options
+from utils.query_cache import run_query
+from utils.query_filters import build_where_clause
 
 
 def show_course_profile(conn):
     """Course Profile - dashboard for single, selectable course"""
 
     # Course selector
-    try:
-        courses = conn.execute(
-            "SELECT DISTINCT course_layout_name FROM analytics.course_stats ORDER BY course_layout_name").fetchall()
-        course_options = [c[0]
-                          for c in courses] if courses else ["No courses found"]
-    except:
-        course_options = ["No courses found"]
+    course_options = get_filter_options(conn, 'course_layout') or ["No courses found"]
 
     selected_course = st.selectbox("Select Course Layout", course_options)
 
@@ -25,22 +22,25 @@ def show_course_profile(conn):
     try:
         # Course stats
         st.subheader("Course Statistics")
-        stats_df = conn.execute("""
+        where_clause, params = build_where_clause([
+            ('course_layout_name', '=', selected_course),
+        ])
+        stats_df = run_query(conn, f"""
             SELECT * FROM analytics.course_stats
-            WHERE course_layout_name = ?
-        """, [selected_course]).df()
+            {where_clause}
+        """, params)
 
         if not stats_df.empty:
             st.dataframe(stats_df, use_container_width=True)
 
         # Top rounds
         st.subheader("Top Rounds")
-        rounds_df = conn.execute("""
+        rounds_df = run_query(conn, f"""
             SELECT * FROM analytics.course_rounds
-            WHERE course_layout_name = ?
+            {where_clause}
             ORDER BY score ASC, rating DESC
             LIMIT 20
-        """, [selected_course]).df()
+        """, params)
 
         if not rounds_df.empty:
             st.dataframe(rounds_df, use_container_width=True)
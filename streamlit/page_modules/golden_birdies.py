@@ -1,6 +1,9 @@
 """Golden Birdies - cumulative birdie tracking"""
 
 import streamlit as st
+from utils.filter_options import get_filter_options
+from utils.query_cache import run_query
+from utils.query_filters import build_where_clause
 
 
 def show_golden_birdies(conn):
@@ -9,18 +12,21 @@ def show_golden_birdies(conn):
     # Filters
     col1, col2 = st.columns(2)
     with col1:
-        course_layout = st.selectbox("Course Layout", ["Dolly Cooper Park"])
+        course_layout = st.selectbox("Course Layout", get_filter_options(conn, 'course_layout'))
     with col2:
-        player_filter = st.multiselect("Player", ["All"])
+        player_filter = st.multiselect("Player", get_filter_options(conn, 'player'))
 
     try:
         # Golden Birdie Stats
         st.subheader("Golden Birdie Stats")
-        stats_df = conn.execute("""
+        where_clause, params = build_where_clause([
+            ('course_layout_name', '=', course_layout),
+        ])
+        stats_df = run_query(conn, f"""
             SELECT * FROM analytics.golden_birdie_stats
-            WHERE course_layout_name = ?
+            {where_clause}
             ORDER BY hole_number
-        """, [course_layout]).df()
+        """, params)
 
         if not stats_df.empty:
             st.dataframe(stats_df, use_container_width=True)
@@ -29,11 +35,15 @@ def show_golden_birdies(conn):
 
         # Golden Birdie Tracker
         st.subheader("Golden Birdie Tracker")
-        tracker_df = conn.execute("""
+        where_clause, params = build_where_clause([
+            ('course_layout_name', '=', course_layout),
+            ('player_name', 'in', player_filter),
+        ])
+        tracker_df = run_query(conn, f"""
             SELECT * FROM analytics.golden_birdie_tracker
-            WHERE course_layout_name = ?
+            {where_clause}
             ORDER BY player_name, hole_number
-        """, [course_layout]).df()
+        """, params)
 
         if not tracker_df.empty:
             st.dataframe(tracker_df, use_container_width=True)
@@ -1,18 +1,16 @@
 """Head-to-Head - compare 2 players"""
 
 import streamlit as st
+from utils.filter_options import get_filter_options
+from utils.query_cache import run_query
+from utils.query_filters import build_where_clause
 
 
 def show_head_to_head(conn):
     """Head-to-Head - compare 2 players"""
 
     # Player selectors
-    try:
-        players = conn.execute(
-            "SELECT DISTINCT player_name FROM analytics.player_stats ORDER BY player_name").fetchall()
-        player_options = [p[0] for p in players] if players else ["No players"]
-    except:
-        player_options = ["No players"]
+    player_options = get_filter_options(conn, 'player') or ["No players"]
 
     col1, col2 = st.columns(2)
     with col1:
@@ -23,7 +21,7 @@ def show_head_to_head(conn):
     # Additional filters
     col3, col4, col5 = st.columns(3)
     with col3:
-        course_filter = st.selectbox("Course", ["All"])
+        course_filter = st.selectbox("Course", ["All"] + get_filter_options(conn, 'course'))
     with col4:
         date_range = st.selectbox(
             "Date", ["Last 10 years", "Last 5 years", "Last 3 years", "All"])
@@ -36,11 +34,14 @@ def show_head_to_head(conn):
         return
 
     try:
-        h2h_df = conn.execute("""
+        # The pair can be stored either way round
+        where_clause, params = build_where_clause([
+            ('(player1_name, player2_name)', 'in', [(player1, player2), (player2, player1)]),
+        ])
+        h2h_df = run_query(conn, f"""
             SELECT * FROM analytics.head_to_head
-            WHERE (player1_name = ? AND player2_name = ?)
-               OR (player1_name = ? AND player2_name = ?)
-        """, [player1, player2, player2, player1]).df()
+            {where_clause}
+        """, params)
 
         if not h2h_df.empty:
             st.dataframe(h2h_df, use_container_width=True)
@@ -2,6 +2,9 @@
 
 import streamlit as st
 import pandas as pd
+from utils.filter_options import get_filter_options
+from utils.query_cache import run_query
+from utils.query_filters import build_where_clause, date_range_months
 
 
 def show_historic_ratings(conn):
@@ -10,17 +13,23 @@ def show_historic_ratings(conn):
     # Filters
     col1, col2 = st.columns(2)
     with col1:
-        player_filter = st.multiselect("Player", ["All"])
+        player_filter = st.multiselect("Player", get_filter_options(conn, 'player'))
     with col2:
         date_range = st.selectbox(
             "Date", ["Last 3 years", "Last 5 years", "Last 10 years", "All"])
 
     try:
-        rating_df = conn.execute("""
+        where_clause, params = build_where_clause([
+            ('rating', 'is_null', False),
+            ('player_name', 'in', player_filter),
+            ('date', 'last_months', date_range_months(date_range)),
+        ])
+        rating_df = run_query(conn, f"""
             SELECT date, player_name, rating
             FROM analytics.player_rating_history
+            {where_clause}
             ORDER BY date, player_name
-        """).df()
+        """, params)
 
         if not rating_df.empty:
             # Pivot for line chart
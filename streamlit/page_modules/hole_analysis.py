@@ -1,6 +1,9 @@
 """Hole Analysis - in-depth stats for specific holes"""
 
 import streamlit as st
+from utils.filter_options import get_filter_options
+from utils.query_cache import run_query
+from utils.query_filters import build_where_clause
 
 
 def show_hole_analysis(conn):
@@ -9,9 +12,9 @@ def show_hole_analysis(conn):
     # Filters
     col1, col2, col3 = st.columns(3)
     with col1:
-        course_layout = st.selectbox("Course Layout", ["Timmons Park"])
+        course_layout = st.selectbox("Course Layout", get_filter_options(conn, 'course_layout'))
     with col2:
-        player_filter = st.multiselect("Player", ["All"])
+        player_filter = st.multiselect("Player", get_filter_options(conn, 'player'))
     with col3:
         date_range = st.selectbox(
             "Date", ["Last 5 years", "Last 3 years", "Last year", "All"])
@@ -21,12 +24,15 @@ def show_hole_analysis(conn):
     try:
         # Hole average scores
         st.subheader("Hole Average Scores")
-        hole_avg_df = conn.execute("""
+        where_clause, params = build_where_clause([
+            ('course_layout_name', '=', course_layout),
+        ])
+        hole_avg_df = run_query(conn, f"""
             SELECT hole_number, avg_score_vs_par
             FROM analytics.hole_statistics
-            WHERE course_layout_name = ?
+            {where_clause}
             ORDER BY hole_number
-        """, [course_layout]).df()
+        """, params)
 
         if not hole_avg_df.empty:
             # Display as colored boxes
@@ -39,10 +45,10 @@ def show_hole_analysis(conn):
 
         # Hole result distribution
         st.subheader("Hole Result Distribution")
-        dist_df = conn.execute("""
+        dist_df = run_query(conn, f"""
             SELECT * FROM analytics.hole_result_distribution
-            WHERE course_layout_name = ?
-        """, [course_layout]).df()
+            {where_clause}
+        """, params)
 
         if not dist_df.empty:
             st.dataframe(dist_df, use_container_width=True)
@@ -0,0 +1,70 @@
+"""Hole Streaks - various streak types"""
+
+import streamlit as st
+from utils.filter_options import get_filter_options
+from utils.query_cache import run_query
+from utils.query_filters import build_where_clause
+
+
+def show_hole_streaks(conn):
+    """Hole Streaks - various streak types"""
+
+    # Filters
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        player_filter = st.multiselect("Player", get_filter_options(conn, 'player'))
+    with col2:
+        as_of_date = st.date_input("As Of", value=None)
+    with col3:
+        course_layout = st.selectbox("Course Layout", ["All"] + get_filter_options(conn, 'course_layout'))
+
+    st.info("Note: All filters apply to any view below them.")
+
+    # Streaks as of the end of each play date - take each streak's latest row on or before the As Of date
+    streak_filters = [
+        ('player_name', 'in', player_filter),
+        ('as_of_date', '<=', as_of_date),
+    ]
+    latest_streaks = """
+        QUALIFY row_number() OVER (PARTITION BY streak_sk ORDER BY as_of_date DESC) = 1
+    """
+
+    try:
+        # Total streaks
+        st.subheader("Total Streaks")
+        where_clause, params = build_where_clause(
+            [('streak_type', '=', 'total')] + streak_filters)
+        total_streaks_df = run_query(conn, f"""
+            SELECT * EXCLUDE (hole_streak_sk, streak_sk, player_sk, layout_sk, processed_at)
+            FROM analytics.hole_streaks
+            {where_clause}
+            {latest_streaks}
+            ORDER BY player_name
+        """, params)
+
+        if not total_streaks_df.empty:
+            st.dataframe(total_streaks_df, use_container_width=True)
+
+        # Course-specific streaks
+        if course_layout != "All":
+            st.subheader(f"Streaks at {course_layout}")
+            where_clause, params = build_where_clause(
+                [('streak_type', '=', 'course'), ('course_layout_name', '=', course_layout)] + streak_filters)
+            course_streaks_df = run_query(conn, f"""
+                SELECT * EXCLUDE (hole_streak_sk, streak_sk, player_sk, layout_sk, processed_at)
+                FROM analytics.hole_streaks
+                {where_clause}
+                {latest_streaks}
+                ORDER BY player_name
+            """, params)
+
+            if not course_streaks_df.empty:
+                st.dataframe(course_streaks_df, use_container_width=True)
+        else:
+            st.info(
+                "No streak data available. Create `analytics.hole_streaks` model in dbt.")
+
+    except Exception as e:
+        st.warning(
+            f"`analytics.hole_streaks` table not found. Create this model in `dbt/models/analytics/hole_streaks.sql`")
+        st.error(f"Error: {e}")
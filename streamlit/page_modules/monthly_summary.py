@@ -0,0 +1,47 @@
+"""Monthly Summary - monthly stats for each player"""
+
+import streamlit as st
+import pandas as pd
+from utils.filter_options import get_date_bounds
+from utils.query_cache import run_query
+from utils.query_filters import build_where_clause
+
+
+def show_monthly_summary(conn):
+    """Monthly Summary - monthly stats for each player"""
+    # Filters - months and years with rounds, newest first
+    first_round_date, last_round_date = get_date_bounds(conn)
+    if first_round_date is not None:
+        month_starts = pd.date_range(first_round_date.to_period('M').to_timestamp(), last_round_date, freq='MS')
+        month_options = [m.strftime("%B %Y") for m in reversed(month_starts)]
+        year_options = [str(y) for y in range(last_round_date.year, first_round_date.year - 1, -1)]
+    else:
+        month_options, year_options = [], []
+
+    col1, col2 = st.columns(2)
+    with col1:
+        month = st.selectbox("Month", month_options)
+    with col2:
+        year = st.selectbox("Year", year_options)
+
+    try:
+        where_clause, params = build_where_clause([
+            ('month', '=', month),
+            ('year', '=', year),
+        ])
+        df = run_query(conn, f"""
+            SELECT * FROM analytics.monthly_summary
+            {where_clause}
+            ORDER BY player_rating DESC
+        """, params)
+
+        if not df.empty:
+            st.dataframe(df, use_container_width=True)
+        else:
+            st.info(
+                "No monthly summary data available. Create `analytics.monthly_summary` model in dbt.")
+
+    except Exception as e:
+        st.warning(
+            f"`analytics.monthly_summary` table not found. Create this model in `dbt/models/analytics/monthly_summary.sql`")
+        st.error(f"Error: {e}")
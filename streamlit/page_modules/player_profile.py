@@ -1,19 +1,16 @@
 """Player Profile - dashboard for single, selectable player"""
 
 import streamlit as st
+from utils.filter_options import get_filter_options
+from utils.query_cache import run_query
+from utils.query_filters import build_where_clause
 
 
 def show_player_profile(conn):
     """Player Profile - dashboard for single, selectable player"""
 
     # Player selector
-    try:
-        players = conn.execute(
-            "SELECT DISTINCT player_name FROM analytics.player_stats ORDER BY player_name").fetchall()
-        player_options = [p[0]
-                          for p in players] if players else ["No players found"]
-    except:
-        player_options = ["No players found"]
+    player_options = get_filter_options(conn, 'player') or ["No players found"]
 
     selected_player = st.selectbox("Select Player", player_options)
 
@@ -25,12 +22,16 @@ def show_player_profile(conn):
     try:
         # Rating history chart
         st.subheader("Rating History")
-        rating_df = conn.execute("""
+        where_clause, params = build_where_clause([
+            ('player_name', '=', selected_player),
+            ('rating', 'is_null', False),
+        ])
+        rating_df = run_query(conn, f"""
             SELECT date, rating 
             FROM analytics.player_rating_history
-            WHERE player_name = ?
+            {where_clause}
             ORDER BY date
-        """, [selected_player]).df()
+        """, params)
 
         if not rating_df.empty:
             st.line_chart(rating_df.set_index('date'))
@@ -40,10 +41,13 @@ def show_player_profile(conn):
 
         # Career stats
         st.subheader("Career Stats")
-        stats_df = conn.execute("""
+        where_clause, params = build_where_clause([
+            ('player_name', '=', selected_player),
+        ])
+        stats_df = run_query(conn, f"""
             SELECT * FROM analytics.player_stats
-            WHERE player_name = ?
-        """, [selected_player]).df()
+            {where_clause}
+        """, params)
 
         if not stats_df.empty:
             st.dataframe(stats_df, use_container_width=True)
@@ -0,0 +1,85 @@
+"""Power Scores - best possible score per course"""
+
+import streamlit as st
+import pandas as pd
+from utils.filter_options import get_filter_options
+from utils.query_cache import run_query
+from utils.query_filters import build_where_clause, open_range
+
+
+# Slider limits - a slider at a limit leaves that end of the range open
+ROUNDS_PLAYED_LIMITS = (2, 200)
+
+
+def show_power_scores(conn):
+    """Power Scores - best possible score per course"""
+
+    # Filters
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        power_sour = st.selectbox(
+            "Power/Sour Score", ["Power Scores", "Sour Scores"])
+    with col2:
+        course_layout_grouped = st.selectbox(
+            "Course Layout (grouped)", ["All"])
+    with col3:
+        player_filter = st.multiselect("Player", get_filter_options(conn, 'player'))
+
+    rounds_played_min, rounds_played_max = st.slider(
+        "Rounds Played", *ROUNDS_PLAYED_LIMITS, ROUNDS_PLAYED_LIMITS)
+
+    st.info("💡 Tip: Select a score below the table to see its hole makeup.")
+
+    # Power scores use each hole's best strokes, sour scores the worst
+    score_column = "power_score" if power_sour == "Power Scores" else "sour_score"
+    score_order = "ASC" if power_sour == "Power Scores" else "DESC"
+
+    try:
+        where_clause, params = build_where_clause([
+            ('rounds_played', 'between', open_range((rounds_played_min, rounds_played_max), ROUNDS_PLAYED_LIMITS)),
+            ('player_name', 'in', player_filter),
+        ])
+        df = run_query(conn, f"""
+            SELECT
+                player_name,
+                course_layout_name,
+                rounds_played,
+                holes,
+                par,
+                {score_column},
+                {score_column}_vs_par,
+                hole_makeup
+            FROM analytics.power_scores
+            {where_clause}
+            ORDER BY course_layout_name, {score_column} {score_order}
+        """, params)
+
+        if not df.empty:
+            st.dataframe(df.drop(columns=['hole_makeup']),
+                         use_container_width=True)
+
+            # Hole power scores detail - the hole makeup is stored with each score, so no second query
+            st.subheader("Hole Power Scores" if power_sour ==
+                         "Power Scores" else "Hole Sour Scores")
+            score_labels = [f"{row['player_name']} - {row['course_layout_name']}"
+                            for _, row in df.iterrows()]
+            selected_label = st.selectbox(
+                "Select a score to see its hole-by-hole breakdown", score_labels)
+            selected_row = df.iloc[score_labels.index(selected_label)]
+            makeup_df = pd.DataFrame(list(selected_row['hole_makeup']))
+            makeup_df = makeup_df.rename(columns={
+                'hole_number': 'Hole',
+                'par': 'Par',
+                'times_played': 'Times Played',
+                'best_strokes': 'Best',
+                'worst_strokes': 'Worst'
+            })
+            st.dataframe(makeup_df, use_container_width=True, hide_index=True)
+        else:
+            st.info(
+                "No power score data available. Create `analytics.power_scores` model in dbt.")
+
+    except Exception as e:
+        st.warning(
+            f"`analytics.power_scores` table not found. Create this model in `dbt/models/analytics/power_scores.sql`")
+        st.error(f"Error: {e}")
@@ -1,6 +1,8 @@
 """Record Sheet - personal records per course layout"""
 
 import streamlit as st
+from utils.filter_options import get_filter_options
+from utils.query_cache import run_query
 
 
 def show_record_sheet(conn):
@@ -14,17 +16,17 @@ def show_record_sheet(conn):
     with col2:
         sort_by = st.selectbox(
             "Sort By", ["Most Played", "Best Score", "Best Rating"])
-        format_filter = st.selectbox("Format", ["All", "Singles", "Doubles"])
+        format_filter = st.selectbox("Format", ["All"] + get_filter_options(conn, 'format'))
     with col3:
         retired_layout = st.selectbox("Retired Layout?", ["No", "Yes", "All"])
         state_filter = st.selectbox("State", ["All"])
 
     try:
-        df = conn.execute("""
+        df = run_query(conn, """
             SELECT * FROM analytics.course_records
             ORDER BY rounds_played DESC
             LIMIT 100
-        """).df()
+        """)
 
         if not df.empty:
             st.dataframe(df, use_container_width=True)
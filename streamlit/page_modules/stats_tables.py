@@ -1,6 +1,8 @@
 """Stats Tables - big tables of raw stats"""
 
 import streamlit as st
+from utils.filter_options import get_filter_options
+from utils.query_cache import run_query
 
 
 def show_stats_tables(conn):
@@ -9,20 +11,21 @@ def show_stats_tables(conn):
     # Filters
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        player_filter = st.multiselect("Player", ["All"])
+        player_filter = st.multiselect("Player", get_filter_options(conn, 'player'))
     with col2:
-        course_filter = st.selectbox("Course", ["All"])
+        course_filter = st.selectbox("Course", ["All"] + get_filter_options(conn, 'course'))
     with col3:
-        course_layout_filter = st.selectbox("Course Layout", ["All"])
+        course_layout_filter = st.selectbox(
+            "Course Layout", ["All"] + get_filter_options(conn, 'course_layout'))
     with col4:
         date_range = st.selectbox(
-            "Date", ["Last 1", "Last 6 months", "Last year", "All"])
+            "Date", ["Last 1 month", "Last 6 months", "Last year", "All"])
 
     st.info("Note: All filters apply to any view below them.")
 
     try:
-        df = conn.execute(
-            "SELECT * FROM analytics.player_stats_summary LIMIT 1000").df()
+        df = run_query(conn,
+            "SELECT * FROM analytics.player_stats_summary LIMIT 1000")
 
         if not df.empty:
             st.dataframe(df, use_container_width=True)
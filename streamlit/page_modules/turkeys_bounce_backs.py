@@ -1,6 +1,8 @@
 """Turkeys and Bounce Backs - streaks and patterns"""
 
 import streamlit as st
+from utils.filter_options import get_filter_options
+from utils.query_cache import run_query
 
 
 def show_turkeys_bounce_backs(conn):
@@ -12,19 +14,19 @@ def show_turkeys_bounce_backs(conn):
         group_by = st.selectbox(
             "Group by Layout or Player", ["Layout", "Player"])
     with col2:
-        course_layout = st.selectbox("Course Layout", ["All"])
+        course_layout = st.selectbox("Course Layout", ["All"] + get_filter_options(conn, 'course_layout'))
     with col3:
-        player_filter = st.selectbox("Player", ["All"])
+        player_filter = st.selectbox("Player", ["All"] + get_filter_options(conn, 'player'))
     with col4:
         month_year = st.selectbox("Month, Year of Date", ["All"])
 
     try:
         # Turkeys table
         st.subheader("Turkeys")
-        turkeys_df = conn.execute("""
+        turkeys_df = run_query(conn, """
             SELECT * FROM analytics.turkeys
             ORDER BY total_turkeys DESC
-        """).df()
+        """)
 
         if not turkeys_df.empty:
             st.dataframe(turkeys_df, use_container_width=True)
@@ -33,10 +35,10 @@ def show_turkeys_bounce_backs(conn):
 
         # Bounce Backs table
         st.subheader("Bounce Backs")
-        bounce_backs_df = conn.execute("""
+        bounce_backs_df = run_query(conn, """
             SELECT * FROM analytics.bounce_backs
             ORDER BY total_bounce_backs DESC
-        """).df()
+        """)
 
         if not bounce_backs_df.empty:
             st.dataframe(bounce_backs_df, use_container_width=True)
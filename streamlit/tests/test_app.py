@@ -0,0 +1,33 @@
+"""
+Smoke tests for the dashboard app, run with Streamlit's AppTest against an empty warehouse.
+"""
+
+from pathlib import Path
+
+import duckdb
+import pytest
+from streamlit.testing.v1 import AppTest
+
+
+APP_DIR = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """ETL data directory holding an empty warehouse, in place of etl/data"""
+    duckdb.connect(str(tmp_path / 'warehouse.duckdb')).close()
+
+    monkeypatch.syspath_prepend(str(APP_DIR))
+    from utils import db_connection
+    monkeypatch.setattr(db_connection, 'get_data_dir', lambda: tmp_path)
+    return tmp_path
+
+
+def test_page_renders_on_every_run(data_dir):
+    """The navigation page runs through app.py (with its connection setup) on reruns too."""
+    at = AppTest.from_file(str(APP_DIR / 'app.py'), default_timeout=30)
+
+    for _ in range(2):
+        at.run()
+        assert not at.exception
+        assert [title.value for title in at.title] == ["📋 All Rounds"]
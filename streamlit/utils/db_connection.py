@@ -6,15 +6,72 @@ import duckdb
 from pathlib import Path
 
 
-def get_db_connection():
+def get_data_dir():
     """
-    Get connection to DuckDB warehouse.
+    Get path to the ETL data directory holding the warehouse and its snapshots.
+
+    Returns:
+        Path: Data directory path
+    """
+    # Path to data directory relative to streamlit folder
+    return Path(__file__).parent.parent.parent / 'etl' / 'data'
+
+
+def get_db_path():
+    """
+    Get path to DuckDB warehouse.
+
+    The app reads the immutable snapshot named by snapshots/CURRENT, which the pipeline
+    swaps atomically after each successful dbt run, so it never opens the file dbt writes.
+    Falls back to the live warehouse if no snapshot has been published (e.g. in development).
+
+    Returns:
+        Path: Warehouse snapshot (or warehouse) file path
+    """
+    snapshots_dir = get_data_dir() / 'snapshots'
+    try:
+        snapshot_name = (snapshots_dir / 'CURRENT').read_text().strip()
+    except FileNotFoundError:
+        snapshot_name = ''
+
+    if snapshot_name and (snapshots_dir / snapshot_name).exists():
+        return snapshots_dir / snapshot_name
+    return get_data_dir() / 'warehouse.duckdb'
+
+
+def get_warehouse_version(db_path=None):
+    """
+    Get version stamp of the warehouse, which changes whenever new data lands.
+
+    Args:
+        db_path: Warehouse file (default: get_db_path())
+
+    Returns:
+        tuple: Warehouse file modification time in nanoseconds and file name ((0, '') if
+            missing), so later versions compare greater
+    """
+    db_path = db_path or get_db_path()
+    try:
+        return (db_path.stat().st_mtime_ns, db_path.name)
+    except FileNotFoundError:
+        return (0, '')
+
+
+def get_db_connection(db_path=None):
+    """
+    Get read-only root connection to DuckDB warehouse.
+
+    The root connection is shared by all sessions (cache it with st.cache_resource), but
+    DuckDB connections aren't safe to use from several threads at once, so queries should
+    go through a cursor from get_session_cursor().
+
+    Args:
+        db_path: Warehouse file (default: get_db_path())
     
     Returns:
-        duckdb.DuckDBPyConnection: Database connection
+        duckdb.DuckDBPyConnection: Read-only root database connection
     """
-    # Path to warehouse relative to streamlit folder
-    db_path = Path(__file__).parent.parent.parent / 'etl' / 'data' / 'warehouse.duckdb'
+    db_path = db_path or get_db_path()
     
     if not db_path.exists():
         raise FileNotFoundError(
@@ -22,7 +79,46 @@ def get_db_connection():
             "Make sure the ETL pipeline has been run to create the warehouse."
         )
     
-    return duckdb.connect(str(db_path))
+    return duckdb.connect(str(db_path), read_only=True)
+
+
+class SessionCursor:
+    """
+    DuckDB cursor tagged with the warehouse version its connection was opened on.
+
+    Behaves like the cursor it wraps. run_query caches results under warehouse_version,
+    so results stay keyed to the snapshot they were read from even if a newer one is
+    published while the script runs.
+    """
+
+    def __init__(self, cursor, warehouse_version):
+        self._cursor = cursor
+        self.warehouse_version = warehouse_version
+
+    def cursor(self):
+        """Another cursor on the same database and version, e.g. for a query on another thread"""
+        return SessionCursor(self._cursor.cursor(), self.warehouse_version)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+def get_session_cursor(root_conn, warehouse_version):
+    """
+    Get a cursor for one script run.
+
+    Each cursor is its own DuckDB connection to the same database, so concurrent
+    sessions run their queries in parallel instead of sharing the root connection.
+    Close it when the run finishes.
+
+    Args:
+        root_conn: Root connection from get_db_connection()
+        warehouse_version: Version stamp of the warehouse file root_conn was opened on
+
+    Returns:
+        SessionCursor: Cursor for this script run
+    """
+    return SessionCursor(root_conn.cursor(), warehouse_version)
 
 
 def get_table_info(conn, schema='analytics'):
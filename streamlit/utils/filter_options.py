@@ -0,0 +1,59 @@
+"""
+Filter widget options for Streamlit app.
+
+Options come from the analytics.filter_options model, loaded whole through the query
+cache, so it's read once per warehouse version and every page lists the same options.
+"""
+
+from utils.query_cache import run_query
+
+
+FILTER_OPTIONS_QUERY = """
+    SELECT option_type, option_value, parent_value, rounds, first_round_date, last_round_date
+    FROM analytics.filter_options
+    ORDER BY option_type, option_value
+"""
+
+
+def get_filter_options(conn, option_type, parents=None):
+    """
+    Get the options for a filter widget.
+
+    Args:
+        conn: DuckDB connection or cursor
+        option_type: 'player', 'team', 'course', 'layout', 'course_layout' or 'format'
+        parents: Only options under these parent values, e.g. the layouts of selected courses (optional)
+
+    Returns:
+        list: Option values in order, or an empty list if the options can't be loaded
+    """
+    try:
+        options = run_query(conn, FILTER_OPTIONS_QUERY)
+    except Exception as e:
+        return []
+
+    options = options[options['option_type'] == option_type]
+    if parents:
+        options = options[options['parent_value'].isin(parents)]
+    return options['option_value'].drop_duplicates().tolist()
+
+
+def get_date_bounds(conn):
+    """
+    Get the dates of the first and last rounds in the warehouse.
+
+    Args:
+        conn: DuckDB connection or cursor
+
+    Returns:
+        tuple: (first_round_date, last_round_date) as pandas Timestamps, or (None, None) if unavailable
+    """
+    try:
+        options = run_query(conn, FILTER_OPTIONS_QUERY)
+    except Exception as e:
+        return None, None
+
+    formats = options[options['option_type'] == 'format']
+    if formats.empty:
+        return None, None
+    return formats['first_round_date'].min(), formats['last_round_date'].max()
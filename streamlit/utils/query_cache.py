@@ -0,0 +1,135 @@
+"""
+Query result cache for Streamlit app.
+
+Results are keyed by SQL, parameters and the warehouse version stamp, so they're
+reused across reruns and sessions until new data lands, with no TTL. The cache is
+an LRU capped by entry count and memory (QUERY_CACHE_MAX_ENTRIES, QUERY_CACHE_MAX_MB).
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from utils.query_profiler import is_profiling_enabled, record_query
+
+
+class QueryCache:
+    """Thread-safe LRU cache of query result DataFrames for the newest warehouse version seen."""
+
+    def __init__(self, max_entries, max_bytes):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.version = None
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, version, key):
+        """
+        Get a cached result.
+
+        Args:
+            version: Warehouse version stamp
+            key: (query, params) key
+
+        Returns:
+            pandas.DataFrame or None: Cached result, or None on a miss (including any
+                version other than the cached one)
+        """
+        with self._lock:
+            if version != self.version or key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+    def put(self, version, key, df):
+        """
+        Cache a result, evicting least recently used results over the caps.
+
+        Results from an older version than the cached one are dropped, so a session still
+        reading the previous snapshot can't flush the newer results or roll the version back.
+
+        Args:
+            version: Warehouse version stamp the result was read from
+            key: (query, params) key
+            df: Query result
+        """
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if self.version is not None and version < self.version:
+                return
+            if version != self.version:
+                # New data landed - results from the previous version are stale
+                self._entries.clear()
+                self.total_bytes = 0
+                self.version = version
+
+            if key in self._entries:
+                self.total_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (df, size)
+            self.total_bytes += size
+
+            while self._entries and (len(self._entries) > self.max_entries
+                                     or self.total_bytes > self.max_bytes):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+
+    def clear(self):
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+
+_query_cache = QueryCache(
+    max_entries=int(os.getenv('QUERY_CACHE_MAX_ENTRIES', '512')),
+    max_bytes=int(os.getenv('QUERY_CACHE_MAX_MB', '256')) * 1024 * 1024,
+)
+
+
+def get_query_cache():
+    """
+    Get the process-wide query cache shared by all sessions.
+
+    Returns:
+        QueryCache: Query cache
+    """
+    return _query_cache
+
+
+def run_query(conn, query, params=None):
+    """
+    Run a query, reusing the cached result while the warehouse version is unchanged.
+
+    The version comes from the connection (see get_session_cursor), so a result is never
+    cached under a newer version than the snapshot it was read from. Connections without
+    a version aren't cached.
+
+    Args:
+        conn: Session cursor, or another DuckDB connection or cursor
+        query: SQL query
+        params: Query parameters (optional)
+
+    Returns:
+        pandas.DataFrame: Query result (a copy, so callers can modify it)
+    """
+    params = tuple(params) if params else ()
+    key = (query, params)
+    version = getattr(conn, 'warehouse_version', None)
+
+    started = time.perf_counter()
+    df = _query_cache.get(version, key) if version is not None else None
+    cached = df is not None
+    if not cached:
+        df = conn.execute(query, list(params)).df()
+        if version is not None:
+            _query_cache.put(version, key, df)
+
+    if is_profiling_enabled():
+        record_query(query, params, (time.perf_counter() - started) * 1000, df, cached)
+
+    return df.copy()
@@ -0,0 +1,125 @@
+"""
+Filter spec to SQL builder for Streamlit app.
+
+Pages describe their widget filters as (column, op, value) tuples and get back a
+parameterized WHERE clause, so every filter is applied in DuckDB rather than in pandas.
+"""
+
+import re
+
+import pandas as pd
+
+
+# Select box option meaning "no filter"
+ALL_OPTION = "All"
+
+COMPARISON_OPS = ('=', '!=', '<', '<=', '>', '>=')
+
+
+def _placeholder(value):
+    """Placeholder for a value - tuples are row values, e.g. (?, ?, ?)"""
+    if isinstance(value, tuple):
+        return "(" + ", ".join(["?"] * len(value)) + ")"
+    return "?"
+
+
+def _flatten(value):
+    """Parameters for a placeholder from _placeholder"""
+    return list(value) if isinstance(value, tuple) else [value]
+
+
+def _is_unset(op, value):
+    """True if a filter value means "no filter" for its op"""
+    if value is None:
+        return True
+    if op == 'in':
+        return len(value) == 0 or ALL_OPTION in value
+    if op == 'between':
+        return all(bound is None for bound in value)
+    return isinstance(value, str) and value == ALL_OPTION
+
+
+def date_range_months(label):
+    """
+    Number of months in a date range select box label.
+
+    Args:
+        label: "Last N months", "Last N years", "Last month", "Last year" or "All"
+
+    Returns:
+        int or None: Months in the range, or None for "All" (or an unrecognized label)
+    """
+    match = re.fullmatch(r'Last (\d+ )?(month|year)s?', label.strip())
+    if not match:
+        return None
+    count = int(match.group(1)) if match.group(1) else 1
+    return count * 12 if match.group(2) == 'year' else count
+
+
+def open_range(selected, limits):
+    """
+    Slider range as between bounds, leaving a bound open when it's at the slider's limit.
+
+    So a slider left at its full range doesn't filter out rows beyond its limits (or with nulls).
+
+    Args:
+        selected: (min, max) selected on the slider
+        limits: (min, max) of the slider
+
+    Returns:
+        tuple: (min or None, max or None)
+    """
+    low, high = selected
+    return (low if low > limits[0] else None, high if high < limits[1] else None)
+
+
+def build_where_clause(filters):
+    """
+    Build a parameterized WHERE clause from a declarative filter spec.
+
+    Filters whose value means "no filter" (None, an empty list, "All", or an open range)
+    are skipped.
+
+    Args:
+        filters: List of (column, op, value) tuples. column is a SQL expression and op one of
+            '=', '!=', '<', '<=', '>', '>=' (tuple values compare as rows), 'in' (a list),
+            'between' ((min, max), either bound None for open), 'is_null' (True or False) or
+            'last_months' (a month count)
+
+    Returns:
+        tuple: (clause, params) - clause is "WHERE ..." or "" if no filter applies
+    """
+    predicates = []
+    params = []
+
+    for column, op, value in filters:
+        if _is_unset(op, value):
+            continue
+
+        if op in COMPARISON_OPS:
+            predicates.append(f"{column} {op} {_placeholder(value)}")
+            params.extend(_flatten(value))
+        elif op == 'in':
+            placeholders = ", ".join(_placeholder(item) for item in value)
+            predicates.append(f"{column} IN ({placeholders})")
+            for item in value:
+                params.extend(_flatten(item))
+        elif op == 'between':
+            low, high = value
+            if low is not None:
+                predicates.append(f"{column} >= ?")
+                params.append(low)
+            if high is not None:
+                predicates.append(f"{column} <= ?")
+                params.append(high)
+        elif op == 'is_null':
+            predicates.append(f"{column} IS NULL" if value else f"{column} IS NOT NULL")
+        elif op == 'last_months':
+            cutoff = pd.Timestamp.today().normalize() - pd.DateOffset(months=value)
+            predicates.append(f"{column} >= ?")
+            params.append(cutoff.to_pydatetime())
+        else:
+            raise ValueError(f"Unknown filter op: {op}")
+
+    clause = "WHERE " + " AND ".join(predicates) if predicates else ""
+    return clause, params
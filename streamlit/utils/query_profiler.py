@@ -0,0 +1,177 @@
+"""
+Query profiler for Streamlit app.
+
+Opt-in (DASHBOARD_PROFILE=1) instrumentation of run_query: records each query's latency,
+rows returned and result size, shows them in a developer sidebar panel with EXPLAIN ANALYZE
+on demand, and appends queries slower than SLOW_QUERY_MS to a slow-query log table in
+QUERY_LOG_PATH (query_log.duckdb in the ETL data directory by default).
+"""
+
+import json
+import os
+import threading
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+
+import duckdb
+import pandas as pd
+import streamlit as st
+
+from utils.db_connection import get_data_dir
+
+
+# Most recent queries kept for the panel, across sessions
+MAX_RECORDS = 200
+
+_records = deque(maxlen=MAX_RECORDS)
+_records_lock = threading.Lock()
+_log_lock = threading.Lock()
+
+
+def is_profiling_enabled():
+    """
+    Check whether query profiling is turned on (DASHBOARD_PROFILE environment variable).
+
+    Returns:
+        bool: True if profiling is enabled
+    """
+    return os.getenv('DASHBOARD_PROFILE', '').lower() in ('1', 'true', 'yes')
+
+
+def get_query_log_path():
+    """
+    Get path to the slow-query log database.
+
+    Returns:
+        Path: Query log file path
+    """
+    return Path(os.getenv('QUERY_LOG_PATH', str(get_data_dir() / 'query_log.duckdb')))
+
+
+def _log_slow_query(record):
+    """Append a query record to the slow_queries table of the query log database."""
+    try:
+        with _log_lock:
+            log_conn = duckdb.connect(str(get_query_log_path()))
+            try:
+                log_conn.execute("""
+                    CREATE TABLE IF NOT EXISTS slow_queries (
+                        logged_at TIMESTAMP,
+                        query VARCHAR,
+                        params VARCHAR,
+                        latency_ms DOUBLE,
+                        rows BIGINT,
+                        bytes BIGINT
+                    )
+                """)
+                log_conn.execute("INSERT INTO slow_queries VALUES (?, ?, ?, ?, ?, ?)", [
+                    record['logged_at'],
+                    record['query'],
+                    json.dumps(record['params'], default=str),
+                    record['latency_ms'],
+                    record['rows'],
+                    record['bytes'],
+                ])
+            finally:
+                log_conn.close()
+    except Exception as e:
+        print(f"Failed to log slow query: {e}")
+
+
+def record_query(query, params, latency_ms, df, cached):
+    """
+    Record a query run through run_query.
+
+    Args:
+        query: SQL query
+        params: Query parameters
+        latency_ms: Time to get the result in milliseconds
+        df: Query result
+        cached: True if the result came from the query cache
+    """
+    record = {
+        'logged_at': datetime.now(),
+        'query': query,
+        'params': list(params),
+        'latency_ms': latency_ms,
+        'rows': len(df),
+        'bytes': int(df.memory_usage(index=True, deep=True).sum()),
+        'cached': cached,
+    }
+    with _records_lock:
+        _records.append(record)
+
+    slow_query_ms = float(os.getenv('SLOW_QUERY_MS', '500'))
+    if not cached and latency_ms >= slow_query_ms:
+        _log_slow_query(record)
+
+
+def get_query_records(since=None):
+    """
+    Get recorded queries, oldest first.
+
+    Args:
+        since: Only queries recorded at or after this datetime (optional)
+
+    Returns:
+        list: Query records
+    """
+    with _records_lock:
+        records = list(_records)
+    if since is not None:
+        records = [r for r in records if r['logged_at'] >= since]
+    return records
+
+
+def _short_query(query, length=80):
+    """Query on one line, truncated for labels."""
+    query = " ".join(query.split())
+    return query if len(query) <= length else query[:length - 3] + "..."
+
+
+def show_profiler_panel(conn, since):
+    """
+    Show the developer sidebar panel with the queries of this script run.
+
+    Args:
+        conn: DuckDB connection or cursor, for EXPLAIN ANALYZE
+        since: Start of this script run
+    """
+    records = get_query_records(since)
+
+    with st.sidebar:
+        st.markdown("---")
+        st.markdown("### 🛠️ Query Profiler")
+
+        if not records:
+            st.caption("No queries this run.")
+            return
+
+        total_ms = sum(r['latency_ms'] for r in records)
+        cached = sum(1 for r in records if r['cached'])
+        st.caption(f"{len(records)} queries ({cached} cached), {total_ms:.0f} ms total")
+
+        st.dataframe(pd.DataFrame([{
+            'Query': _short_query(r['query'], 40),
+            'ms': round(r['latency_ms'], 1),
+            'Rows': r['rows'],
+            'KB': round(r['bytes'] / 1024, 1),
+            'Cached': r['cached'],
+        } for r in records]), use_container_width=True, hide_index=True)
+
+        # EXPLAIN ANALYZE on demand for a selected query
+        selected = st.selectbox(
+            "Query", range(len(records)), key="profiler_query",
+            format_func=lambda i: f"{i + 1}. {records[i]['latency_ms']:.0f} ms - {_short_query(records[i]['query'])}")
+        record = records[selected]
+        st.code(record['query'], language="sql")
+        if record['params']:
+            st.caption(f"Params: {record['params']}")
+
+        if st.button("EXPLAIN ANALYZE", key="profiler_explain"):
+            try:
+                plan = conn.execute("EXPLAIN ANALYZE " + record['query'], record['params']).fetchall()
+                st.code("\n".join(row[1] for row in plan))
+            except Exception as e:
+                st.error(f"EXPLAIN ANALYZE failed: {e}")
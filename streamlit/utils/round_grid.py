@@ -0,0 +1,157 @@
+"""
+Round grid renderer for Streamlit app.
+
+Builds the All Rounds scorecard grid as a single HTML element: one header row and one
+<details> row per round, so expanding a round's throwing stats happens in the browser
+without a rerun.
+"""
+
+from html import escape
+
+import pandas as pd
+
+
+# Hole result colors for the scorecard circles
+HOLE_RESULT_COLORS = {
+    'Ace': '#1E90FF',  # Blue
+    'Eagle': '#1E90FF',  # Blue
+    'Birdie': '#87CEEB',  # Light blue
+    'Par': '#D3D3D3',  # Light gray
+    'Bogey': '#FFD700',  # Yellow
+    'Double Bogey': '#FFA500',  # Orange
+    'Triple Bogey': '#A0522D',  # Brownish (sienna)
+    'Quadruple Bogey+': '#2F2F2F',  # Dark gray
+}
+DEFAULT_HOLE_COLOR = '#CCCCCC'
+
+MIN_HOLE_COLUMNS = 18
+MAX_HOLE_COLUMNS = 27
+
+ROUND_GRID_CSS = """
+<style>
+.round-grid { font-size: 13px; overflow-x: auto; }
+.round-grid .rg-row {
+    display: grid;
+    grid-template-columns: minmax(110px, 2fr) minmax(150px, 3.5fr) minmax(90px, 1.8fr) 60px 60px repeat(var(--rg-holes), 30px);
+    align-items: center;
+    column-gap: 4px;
+    padding: 4px 0;
+}
+.round-grid .rg-header { font-weight: bold; border-bottom: 1px solid rgba(128, 128, 128, 0.4); }
+.round-grid .rg-header .rg-hole-number { text-align: center; font-size: 11px; }
+.round-grid details { border-bottom: 1px solid rgba(128, 128, 128, 0.2); }
+.round-grid summary { list-style: none; cursor: pointer; }
+.round-grid summary::-webkit-details-marker { display: none; }
+.round-grid summary:hover { background-color: rgba(128, 128, 128, 0.1); }
+.round-grid .rg-text { white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+.round-grid .rg-hole {
+    display: inline-block; width: 26px; height: 26px; border-radius: 50%;
+    color: white; text-align: center; line-height: 26px; font-weight: bold; font-size: 12px;
+}
+.round-grid .rg-stats { display: flex; flex-wrap: wrap; gap: 8px; padding: 6px 0 10px 0; }
+.round-grid .rg-stat {
+    padding: 4px 10px; min-width: 90px;
+    border: 1px solid rgba(128, 128, 128, 0.3); border-radius: 4px;
+}
+.round-grid .rg-stat-label { display: block; font-size: 11px; opacity: 0.7; }
+.round-grid .rg-stat-value { display: block; font-size: 18px; font-weight: bold; }
+.round-grid .rg-stat-count { display: block; font-size: 11px; opacity: 0.7; }
+</style>
+"""
+
+
+def _count(row, column):
+    """Integer value of a count column, 0 if missing or null."""
+    value = row.get(column)
+    return 0 if value is None or pd.isna(value) else int(value)
+
+
+def _as_list(value):
+    """Python list of a list column value (masked entries become None), [] if null."""
+    if value is None:
+        return []
+    return value.tolist() if hasattr(value, 'tolist') else list(value)
+
+
+def _stat_html(label, made, attempted):
+    """Throwing stat box with the percentage and made/attempted counts."""
+    pct = (made / attempted * 100) if attempted > 0 else 0
+    return (
+        f'<div class="rg-stat"><span class="rg-stat-label">{label}</span>'
+        f'<span class="rg-stat-value">{pct:.1f}%</span>'
+        f'<span class="rg-stat-count">{made}/{attempted}</span></div>'
+    )
+
+
+def _round_html(row):
+    """One round as a <details> row: the scorecard summary and its throwing stats."""
+    hole_strokes = _as_list(row.get('Hole Strokes'))
+    hole_results = _as_list(row.get('Hole Results'))
+    round_max_hole = min(len(hole_strokes), MAX_HOLE_COLUMNS)
+
+    rating = row.get('UDisc Rating')
+    rating_display = "N/A" if rating is None or pd.isna(rating) else f"{rating:.0f}"
+
+    cells = [
+        f'<div class="rg-text"><strong>{escape(str(row["Player"]))}</strong></div>',
+        f'<div class="rg-text">{escape(str(row["Course Layout Name"]))}</div>',
+        f'<div class="rg-text">{escape(str(row["Date Formatted"]))}</div>',
+        f'<div><strong>{escape(str(row["Score Display"]))}</strong></div>',
+        f'<div>{rating_display}</div>',
+    ]
+    for i in range(round_max_hole):
+        hole_score = hole_strokes[i]
+        hole_result = hole_results[i] if i < len(hole_results) else None
+        if hole_score is not None and hole_result is not None:
+            color = HOLE_RESULT_COLORS.get(hole_result, DEFAULT_HOLE_COLOR)
+            cells.append(
+                f'<div><span class="rg-hole" style="background-color: {color};" '
+                f'title="Hole {i + 1}: {escape(hole_result)}">{int(hole_score)}</span></div>')
+        else:
+            cells.append('<div></div>')
+
+    holes_played = _count(row, 'Holes Played') or round_max_hole
+    stats = [
+        _stat_html("C1 Putting", _count(row, 'C1 Putts Made'), _count(row, 'C1 Putts Attempted')),
+        _stat_html("C1X Putting", _count(row, 'C1X Putts Made'), _count(row, 'C1X Putts Attempted')),
+        _stat_html("C2 Putting", _count(row, 'C2 Putts Made'), _count(row, 'C2 Putts Attempted')),
+        _stat_html("Fairway Hits", _count(row, 'Fairway Hits'), _count(row, 'Fairway Attempts')),
+        _stat_html("GIR C2", _count(row, 'GIR C2'), holes_played),
+        _stat_html("GIR C1", _count(row, 'GIR C1'), holes_played),
+        _stat_html("Parked", _count(row, 'Parked'), holes_played),
+    ]
+
+    return (
+        f'<details><summary class="rg-row" title="View scorecard">{"".join(cells)}</summary>'
+        f'<div class="rg-stats">{"".join(stats)}</div></details>'
+    )
+
+
+def build_round_grid_html(df):
+    """
+    Build the color-coded scorecard grid for a DataFrame of analytics.rounds rows.
+
+    Clicking a round expands its throwing stats client-side. The HTML has no newlines or
+    indentation, so st.markdown passes it through as a single raw HTML block.
+
+    Args:
+        df: Rounds with the All Rounds page columns
+
+    Returns:
+        str: Grid HTML (without the CSS, see ROUND_GRID_CSS)
+    """
+    # Hole lists are indexed by hole number, so their length is the round's last hole
+    hole_counts = [len(strokes) for strokes in df['Hole Strokes'] if strokes is not None]
+    max_hole = max([MIN_HOLE_COLUMNS] + [min(count, MAX_HOLE_COLUMNS) for count in hole_counts])
+
+    header_cells = ['<div>Player</div>', '<div>Course</div>', '<div>Date</div>',
+                    '<div>Score</div>', '<div>Rating</div>']
+    header_cells += [f'<div class="rg-hole-number">{i}</div>' for i in range(1, max_hole + 1)]
+
+    rows = [_round_html(row) for row in df.to_dict('records')]
+
+    return (
+        f'<div class="round-grid" style="--rg-holes: {max_hole};">'
+        f'<div class="rg-row rg-header">{"".join(header_cells)}</div>'
+        f'{"".join(rows)}</div>'
+    )